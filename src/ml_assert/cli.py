@@ -16,17 +16,35 @@ import yaml
 
 from ml_assert.core.base import AssertionResult
 from ml_assert.core.dsl import DataFrameAssertion, ModelAssertion, assert_model
+from ml_assert.data.loaders import load_array
+from ml_assert.fairness.attribution import (
+    AttributionProfile,
+    assert_attribution_distance,
+    assert_attribution_rank_correlation,
+)
 from ml_assert.fairness.explainability import ModelExplainer
-from ml_assert.fairness.fairness import FairnessMetrics
+from ml_assert.fairness.fairness import FairnessMetrics, check_fairness
 from ml_assert.integrations.mlflow import MLflowLogger
 from ml_assert.integrations.prometheus import PrometheusExporter
 from ml_assert.integrations.slack import SlackAlerter
+from ml_assert.model.loaders import load_model
 from ml_assert.plugins.base import get_plugins
 from ml_assert.schema import Schema
 from ml_assert.stats.drift import assert_no_drift
 
 app = typer.Typer(help="ml-assert CLI")
 
+# Fairness step keys that set a metric threshold.
+_FAIRNESS_METRICS = (
+    "demographic_parity",
+    "equal_opportunity",
+    "equalized_odds",
+    "predictive_parity",
+    "false_positive_rate_parity",
+    "calibration_by_group",
+    "disparate_impact",
+)
+
 
 def _build_schema_from_yaml(schema_def: dict) -> Schema:
     """Build a Schema object from a YAML definition."""
@@ -150,25 +168,38 @@ def run_model_assertion(config: dict[str, Any]) -> AssertionResult:
         AssertionResult containing the assertion outcome.
     """
     try:
-        y_true = np.load(config["y_true_path"])
-        y_pred = np.load(config["y_pred_path"])
-        assertion = ModelAssertion(y_true, y_pred)
+        y_true = load_array(config["y_true_path"])
+        y_pred = load_array(config["y_pred_path"])
+        metrics = config.get("metrics", [])
+        # Scores may be given once for the whole assertion or on a score metric.
+        y_scores_path = config.get("y_scores_path") or next(
+            (m["y_scores_path"] for m in metrics if "y_scores_path" in m), None
+        )
+        y_scores = load_array(y_scores_path) if y_scores_path else None
+        assertion = ModelAssertion(y_true, y_pred, y_scores)
 
-        for metric in config.get("metrics", []):
+        for metric in metrics:
             metric_type = metric.get("type")
             threshold = metric.get("threshold")
+            average = metric.get("average", "binary")
             if metric_type == "accuracy":
                 assertion.accuracy(threshold)
             elif metric_type == "precision":
-                assertion.precision(threshold)
+                assertion.precision(threshold, average=average)
             elif metric_type == "recall":
-                assertion.recall(threshold)
+                assertion.recall(threshold, average=average)
             elif metric_type == "f1":
-                assertion.f1(threshold)
+                assertion.f1(threshold, average=average)
+            elif metric_type == "per_class":
+                assertion.per_class(metric["metric"], threshold)
             elif metric_type == "roc_auc":
-                y_scores = np.load(metric["y_scores_path"])
-                assertion._y_scores = y_scores
                 assertion.roc_auc(threshold)
+            elif metric_type == "log_loss":
+                assertion.log_loss(threshold)
+            elif metric_type == "brier_score":
+                assertion.brier_score(threshold)
+            elif metric_type == "calibration":
+                assertion.calibration(threshold, n_bins=metric.get("n_bins", 10))
             else:
                 raise ValueError(f"Unknown metric type: {metric_type}")
 
@@ -229,51 +260,113 @@ def run(
                     df_test = pd.read_csv(step["test"])
                     assert_no_drift(df_train, df_test, alpha=step.get("alpha", 0.05))
                 elif stype == "model_performance":
-                    y_true = np.loadtxt(step["y_true"])
-                    y_pred = np.loadtxt(step["y_pred"])
+                    y_true = load_array(step["y_true"])
+                    y_pred = load_array(step["y_pred"])
                     y_scores = (
-                        np.loadtxt(step["y_scores"]) if "y_scores" in step else None
+                        load_array(step["y_scores"]) if "y_scores" in step else None
                     )
                     model_asserter = assert_model(y_true, y_pred, y_scores)
                     for metric, threshold in step.get("assertions", {}).items():
                         getattr(model_asserter, metric)(threshold)
                     model_asserter.validate()
                 elif stype == "fairness":
-                    y_true = np.loadtxt(step["y_true"])
-                    y_pred = np.loadtxt(step["y_pred"])
-                    sensitive_attr = np.loadtxt(step["sensitive_attr"])
-                    metrics = FairnessMetrics(y_true, y_pred, sensitive_attr)
-                    if "demographic_parity" in step:
-                        dp = metrics.demographic_parity()
-                        if dp > step["demographic_parity"]:
-                            raise AssertionError(
-                                f"Demographic parity {dp:.4f} exceeds threshold {step['demographic_parity']:.4f}"
-                            )
-                    if "equal_opportunity" in step:
-                        eo = metrics.equal_opportunity()
-                        if eo > step["equal_opportunity"]:
-                            raise AssertionError(
-                                f"Equal opportunity {eo:.4f} exceeds threshold {step['equal_opportunity']:.4f}"
+                    y_true = load_array(step["y_true"])
+                    y_pred = load_array(step["y_pred"])
+                    # A list of attribute files audits their intersections.
+                    sensitive_attr = (
+                        [load_array(spec) for spec in step["sensitive_attr"]]
+                        if isinstance(step["sensitive_attr"], list)
+                        else load_array(step["sensitive_attr"])
+                    )
+                    metrics = FairnessMetrics(
+                        y_true,
+                        y_pred,
+                        sensitive_attr,
+                        min_group_size=step.get("min_group_size", 1),
+                        y_scores=(
+                            load_array(step["y_scores"]) if "y_scores" in step else None
+                        ),
+                    )
+                    # With `confidence`, thresholds apply to the bootstrap
+                    # interval; calibration is always checked on its estimate.
+                    for name in _FAIRNESS_METRICS:
+                        if name in step:
+                            check_fairness(
+                                metrics,
+                                name,
+                                step[name],
+                                confidence=step.get("confidence"),
+                                n_resamples=step.get("n_resamples", 1000),
+                                alpha=step.get("alpha"),
+                                random_state=step.get("random_state"),
                             )
                 elif stype == "explainability":
-                    model = step.get("model")
+                    model = load_model(step["model"])
                     X = pd.read_csv(step["features"])
-                    explainer = ModelExplainer(model, feature_names=X.columns)
+                    background = (
+                        pd.read_csv(step["background"])
+                        if "background" in step
+                        else None
+                    )
+                    explainer = ModelExplainer(
+                        model,
+                        feature_names=X.columns,
+                        background=background,
+                        background_size=step.get("background_size", 100),
+                        background_method=step.get("background_method", "kmeans"),
+                    )
+                    shap_values = None
                     if "output_dir" in step:
                         explainer.save_explanation_report(
                             X,
                             step["output_dir"],
                             include_plots=step.get("include_plots", True),
+                            dpi=step.get("dpi", 300),
+                            plot_format=step.get("plot_format", "png"),
+                            max_points=step.get("max_points"),
+                            n_jobs=step.get("n_jobs", 1),
                         )
                     else:
-                        shap_values = explainer.explain(X)
                         output_path = Path(step.get("output", "shap_values.npy"))
-                        np.save(output_path, shap_values["shap_values"])
+                        if "batch_size" in step or "n_jobs" in step:
+                            shap_values = explainer.explain(
+                                X,
+                                batch_size=step.get("batch_size"),
+                                n_jobs=step.get("n_jobs", 1),
+                                output_path=output_path,
+                            )["shap_values"]
+                        else:
+                            shap_values = explainer.explain(X)["shap_values"]
+                            np.save(output_path, shap_values)
+                    if "profile_output" in step or "baseline_profile" in step:
+                        # Reuse SHAP values already computed by this step.
+                        profile = (
+                            explainer.attribution_profile(X)
+                            if shap_values is None
+                            else AttributionProfile.from_shap_values(
+                                shap_values, list(X.columns)
+                            )
+                        )
+                        if "profile_output" in step:
+                            profile.save(step["profile_output"])
+                        if "baseline_profile" in step:
+                            baseline = AttributionProfile.load(step["baseline_profile"])
+                            if "min_rank_correlation" in step:
+                                assert_attribution_rank_correlation(
+                                    baseline, profile, step["min_rank_correlation"]
+                                )
+                            if "max_attribution_distance" in step:
+                                assert_attribution_distance(
+                                    baseline, profile, step["max_attribution_distance"]
+                                )
                     if "plots" in step:
                         plots_config = step["plots"]
                         if "summary" in plots_config:
                             explainer.plot_summary(
-                                X, output_path=plots_config["summary"].get("output")
+                                X,
+                                output_path=plots_config["summary"].get("output"),
+                                dpi=step.get("dpi", 300),
+                                max_points=step.get("max_points"),
                             )
                         if "dependence" in plots_config:
                             for dep_config in plots_config["dependence"]:
@@ -284,6 +377,8 @@ def run(
                                         "interaction_index"
                                     ),
                                     output_path=dep_config.get("output"),
+                                    dpi=step.get("dpi", 300),
+                                    max_points=step.get("max_points"),
                                 )
                 elif stype in plugins:
                     plugin_result = plugins[stype]().run(step)
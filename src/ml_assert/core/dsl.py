@@ -16,13 +16,24 @@ from ml_assert.data.checks import (
     assert_unique,
     assert_values_in_set,
 )
+from ml_assert.model.multiclass import ClassificationCounts, check_per_class_scores
 from ml_assert.model.performance import (
     assert_accuracy_score,
     assert_f1_score,
     assert_precision_score,
     assert_recall_score,
     assert_roc_auc_score,
+    check_max_score,
+    check_min_score,
 )
+from ml_assert.model.regression import RegressionMetrics
+from ml_assert.model.scores import (
+    as_score_array,
+    brier_score,
+    expected_calibration_error,
+    log_loss_score,
+)
+from ml_assert.model.thresholds import ThresholdCurve, check_metric_at_thresholds
 from ml_assert.schema import Schema
 
 
@@ -203,19 +214,38 @@ class ModelAssertion(Assertion):
     A chainable assertion builder for model performance metrics.
 
     Usage:
-        ModelAssertion(y_true, y_pred) \
+        ModelAssertion(y_true, y_pred, y_scores) \
             .accuracy(0.8) \
             .precision(0.7) \
             .recall(0.6) \
+            .roc_auc(0.85) \
             .validate()
     """
 
-    def __init__(self, y_true: np.ndarray, y_pred: np.ndarray):
-        """Initialize the model assertion."""
+    def __init__(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        y_scores: np.ndarray | None = None,
+    ):
+        """
+        Initialize the model assertion.
+
+        Args:
+            y_true: Ground truth labels or targets.
+            y_pred: Predicted labels or targets.
+            y_scores: Optional scores or probability estimates, required by the
+                score-based assertions. They are normalized once to a
+                contiguous float array that every score metric shares.
+        """
         super().__init__()
         self._y_true = y_true
         self._y_pred = y_pred
+        self._y_scores = None if y_scores is None else as_score_array(y_scores)
         self._assertions: list[dict[str, Any]] = []
+        self._regression_cache: dict[int, tuple[Any, RegressionMetrics]] = {}
+        self._threshold_curve_cache: ThresholdCurve | None = None
+        self._counts_cache: ClassificationCounts | None = None
 
     def accuracy(
         self, threshold: float = None, min_score: float = None
@@ -244,7 +274,10 @@ class ModelAssertion(Assertion):
         return self
 
     def precision(
-        self, threshold: float = None, min_score: float = None
+        self,
+        threshold: float = None,
+        min_score: float = None,
+        average: str = "binary",
     ) -> "ModelAssertion":
         """
         Assert precision score is above threshold.
@@ -252,6 +285,8 @@ class ModelAssertion(Assertion):
         Args:
             threshold: Minimum acceptable precision score.
             min_score: (deprecated) Minimum acceptable precision score.
+            average: 'binary' (default), or 'macro', 'micro' or 'weighted' for
+                multi-class and multi-label targets.
 
         Returns:
             self for method chaining.
@@ -261,16 +296,19 @@ class ModelAssertion(Assertion):
         self._assertions.append(
             {
                 "name": "precision",
-                "fn": lambda: assert_precision_score(
-                    self._y_true, self._y_pred, threshold
+                "fn": lambda: self._check_averaged(
+                    "precision", "Precision score", threshold, average
                 ),
-                "args": {"threshold": threshold},
+                "args": {"threshold": threshold, "average": average},
             }
         )
         return self
 
     def recall(
-        self, threshold: float = None, min_score: float = None
+        self,
+        threshold: float = None,
+        min_score: float = None,
+        average: str = "binary",
     ) -> "ModelAssertion":
         """
         Assert recall score is above threshold.
@@ -278,6 +316,8 @@ class ModelAssertion(Assertion):
         Args:
             threshold: Minimum acceptable recall score.
             min_score: (deprecated) Minimum acceptable recall score.
+            average: 'binary' (default), or 'macro', 'micro' or 'weighted' for
+                multi-class and multi-label targets.
 
         Returns:
             self for method chaining.
@@ -287,21 +327,28 @@ class ModelAssertion(Assertion):
         self._assertions.append(
             {
                 "name": "recall",
-                "fn": lambda: assert_recall_score(
-                    self._y_true, self._y_pred, threshold
+                "fn": lambda: self._check_averaged(
+                    "recall", "Recall score", threshold, average
                 ),
-                "args": {"threshold": threshold},
+                "args": {"threshold": threshold, "average": average},
             }
         )
         return self
 
-    def f1(self, threshold: float = None, min_score: float = None) -> "ModelAssertion":
+    def f1(
+        self,
+        threshold: float = None,
+        min_score: float = None,
+        average: str = "binary",
+    ) -> "ModelAssertion":
         """
         Assert F1 score is above threshold.
 
         Args:
             threshold: Minimum acceptable F1 score.
             min_score: (deprecated) Minimum acceptable F1 score.
+            average: 'binary' (default), or 'macro', 'micro' or 'weighted' for
+                multi-class and multi-label targets.
 
         Returns:
             self for method chaining.
@@ -311,8 +358,10 @@ class ModelAssertion(Assertion):
         self._assertions.append(
             {
                 "name": "f1",
-                "fn": lambda: assert_f1_score(self._y_true, self._y_pred, threshold),
-                "args": {"threshold": threshold},
+                "fn": lambda: self._check_averaged(
+                    "f1", "F1 score", threshold, average
+                ),
+                "args": {"threshold": threshold, "average": average},
             }
         )
         return self
@@ -332,19 +381,474 @@ class ModelAssertion(Assertion):
         """
         if threshold is None and min_score is not None:
             threshold = min_score
-        if not hasattr(self, "_y_scores"):
-            raise ValueError("y_scores must be provided for ROC AUC assertion")
+        self._require_scores("ROC AUC")
         self._assertions.append(
             {
                 "name": "roc_auc",
                 "fn": lambda: assert_roc_auc_score(
-                    self._y_true, self._y_scores, threshold
+                    self._y_true, self._scores(), threshold
                 ),
                 "args": {"threshold": threshold},
             }
         )
         return self
 
+    def _classification_counts(self) -> ClassificationCounts:
+        """Return per-class counts, built from one confusion matrix on first use."""
+        if self._counts_cache is None:
+            self._counts_cache = ClassificationCounts(self._y_true, self._y_pred)
+        return self._counts_cache
+
+    def _check_averaged(
+        self, metric: str, label: str, threshold: float, average: str
+    ) -> None:
+        """Check precision/recall/F1, sharing counts across non-binary averages."""
+        if average == "binary":
+            binary_fns = {
+                "precision": assert_precision_score,
+                "recall": assert_recall_score,
+                "f1": assert_f1_score,
+            }
+            binary_fns[metric](self._y_true, self._y_pred, threshold)
+            return
+        score = self._classification_counts().score(metric, average)
+        check_min_score(f"{label} ({average})", score, threshold)
+
+    def per_class(
+        self, metric: str, thresholds: float | dict[Any, float]
+    ) -> "ModelAssertion":
+        """
+        Assert a per-class precision, recall or F1 score is above threshold.
+
+        Args:
+            metric: One of 'precision', 'recall', 'f1'.
+            thresholds: One minimum score applied to every class, or a mapping
+                from class label to its minimum score.
+
+        Returns:
+            self for method chaining.
+        """
+        self._assertions.append(
+            {
+                "name": f"per_class_{metric}",
+                "fn": lambda: check_per_class_scores(
+                    self._classification_counts(), metric, thresholds
+                ),
+                "args": {"metric": metric, "thresholds": thresholds},
+            }
+        )
+        return self
+
+    def _threshold_curve(self) -> ThresholdCurve:
+        """Return the threshold curve, sorting the scores on first use only."""
+        if self._threshold_curve_cache is None:
+            self._threshold_curve_cache = ThresholdCurve(self._y_true, self._scores())
+        return self._threshold_curve_cache
+
+    def _require_scores(self, metric: str) -> None:
+        if self._y_scores is None:
+            raise ValueError(f"y_scores must be provided for {metric} assertion")
+
+    def _scores(self) -> np.ndarray:
+        """Return y_scores as the shared normalized float array."""
+        scores = as_score_array(self._y_scores)
+        # Scores attached after construction are normalized here, once.
+        self._y_scores = scores
+        return scores
+
+    def log_loss(
+        self, max_loss: float, labels: np.ndarray | None = None
+    ) -> "ModelAssertion":
+        """
+        Assert log loss of y_scores is below max_loss.
+
+        Args:
+            max_loss: Maximum acceptable log loss.
+            labels: Sorted class labels of 2-D y_scores columns; see
+                :func:`~ml_assert.model.scores.log_loss_score`.
+
+        Returns:
+            self for method chaining.
+        """
+        self._require_scores("log loss")
+        self._assertions.append(
+            {
+                "name": "log_loss",
+                "fn": lambda: check_max_score(
+                    "Log loss",
+                    log_loss_score(self._y_true, self._scores(), labels),
+                    max_loss,
+                ),
+                "args": {"max_loss": max_loss},
+            }
+        )
+        return self
+
+    def brier_score(self, max_score: float) -> "ModelAssertion":
+        """
+        Assert Brier score of y_scores is below max_score.
+
+        Args:
+            max_score: Maximum acceptable Brier score.
+
+        Returns:
+            self for method chaining.
+        """
+        self._require_scores("Brier score")
+        self._assertions.append(
+            {
+                "name": "brier_score",
+                "fn": lambda: check_max_score(
+                    "Brier score", brier_score(self._y_true, self._scores()), max_score
+                ),
+                "args": {"max_score": max_score},
+            }
+        )
+        return self
+
+    def calibration(self, max_error: float, n_bins: int = 10) -> "ModelAssertion":
+        """
+        Assert expected calibration error of y_scores is below max_error.
+
+        Args:
+            max_error: Maximum acceptable expected calibration error.
+            n_bins: Number of equal-width probability bins.
+
+        Returns:
+            self for method chaining.
+        """
+        self._require_scores("calibration")
+        self._assertions.append(
+            {
+                "name": "calibration",
+                "fn": lambda: check_max_score(
+                    "Expected calibration error",
+                    expected_calibration_error(self._y_true, self._scores(), n_bins),
+                    max_error,
+                ),
+                "args": {"max_error": max_error, "n_bins": n_bins},
+            }
+        )
+        return self
+
+    def precision_at_recall(
+        self, min_recall: float, threshold: float = None, min_score: float = None
+    ) -> "ModelAssertion":
+        """
+        Assert some score threshold reaches min_recall with precision above threshold.
+
+        All threshold-sweep assertions share a single sort of y_scores.
+
+        Args:
+            min_recall: Recall the operating point must reach.
+            threshold: Minimum acceptable precision at that recall.
+            min_score: (deprecated) Minimum acceptable precision at that recall.
+
+        Returns:
+            self for method chaining.
+        """
+        if threshold is None and min_score is not None:
+            threshold = min_score
+        self._require_scores("precision@recall")
+        self._assertions.append(
+            {
+                "name": "precision_at_recall",
+                "fn": lambda: check_min_score(
+                    f"Precision at recall {min_recall:.2f}",
+                    self._threshold_curve().precision_at_recall(min_recall),
+                    threshold,
+                ),
+                "args": {"min_recall": min_recall, "threshold": threshold},
+            }
+        )
+        return self
+
+    def recall_at_precision(
+        self, min_precision: float, threshold: float = None, min_score: float = None
+    ) -> "ModelAssertion":
+        """
+        Assert some score threshold reaches min_precision with recall above threshold.
+
+        Args:
+            min_precision: Precision the operating point must reach.
+            threshold: Minimum acceptable recall at that precision.
+            min_score: (deprecated) Minimum acceptable recall at that precision.
+
+        Returns:
+            self for method chaining.
+        """
+        if threshold is None and min_score is not None:
+            threshold = min_score
+        self._require_scores("recall@precision")
+        self._assertions.append(
+            {
+                "name": "recall_at_precision",
+                "fn": lambda: check_min_score(
+                    f"Recall at precision {min_precision:.2f}",
+                    self._threshold_curve().recall_at_precision(min_precision),
+                    threshold,
+                ),
+                "args": {"min_precision": min_precision, "threshold": threshold},
+            }
+        )
+        return self
+
+    def precision_at_k(
+        self, k: int, threshold: float = None, min_score: float = None
+    ) -> "ModelAssertion":
+        """
+        Assert precision among the k highest-scored samples is above threshold.
+
+        Args:
+            k: Number of top-ranked samples to consider.
+            threshold: Minimum acceptable precision@k.
+            min_score: (deprecated) Minimum acceptable precision@k.
+
+        Returns:
+            self for method chaining.
+        """
+        if threshold is None and min_score is not None:
+            threshold = min_score
+        self._require_scores("precision@k")
+        self._assertions.append(
+            {
+                "name": "precision_at_k",
+                "fn": lambda: check_min_score(
+                    f"Precision at k={k}",
+                    self._threshold_curve().precision_at_k(k),
+                    threshold,
+                ),
+                "args": {"k": k, "threshold": threshold},
+            }
+        )
+        return self
+
+    def recall_at_k(
+        self, k: int, threshold: float = None, min_score: float = None
+    ) -> "ModelAssertion":
+        """
+        Assert recall among the k highest-scored samples is above threshold.
+
+        Args:
+            k: Number of top-ranked samples to consider.
+            threshold: Minimum acceptable recall@k.
+            min_score: (deprecated) Minimum acceptable recall@k.
+
+        Returns:
+            self for method chaining.
+        """
+        if threshold is None and min_score is not None:
+            threshold = min_score
+        self._require_scores("recall@k")
+        self._assertions.append(
+            {
+                "name": "recall_at_k",
+                "fn": lambda: check_min_score(
+                    f"Recall at k={k}",
+                    self._threshold_curve().recall_at_k(k),
+                    threshold,
+                ),
+                "args": {"k": k, "threshold": threshold},
+            }
+        )
+        return self
+
+    def metric_at_thresholds(
+        self,
+        metric: str,
+        thresholds: Iterable[float],
+        min_score: float | Iterable[float],
+    ) -> "ModelAssertion":
+        """
+        Assert a metric stays above min_score at every given score threshold.
+
+        Args:
+            metric: One of 'precision', 'recall', 'f1', 'accuracy', 'specificity'.
+            thresholds: Score cut-offs to evaluate.
+            min_score: Minimum acceptable value, either one for all thresholds
+                or one per threshold.
+
+        Returns:
+            self for method chaining.
+        """
+        self._require_scores(f"{metric}@threshold")
+        thresholds = list(thresholds)
+        if isinstance(min_score, Iterable):
+            min_score = list(min_score)
+        self._assertions.append(
+            {
+                "name": "metric_at_thresholds",
+                "fn": lambda: check_metric_at_thresholds(
+                    self._threshold_curve(), metric, thresholds, min_score
+                ),
+                "args": {
+                    "metric": metric,
+                    "thresholds": thresholds,
+                    "min_score": min_score,
+                },
+            }
+        )
+        return self
+
+    def _regression_metrics(
+        self, sample_mask: np.ndarray | None = None
+    ) -> RegressionMetrics:
+        """Return the fused regression statistics for the (optionally sliced) data."""
+        key = id(sample_mask)
+        cached = self._regression_cache.get(key)
+        if cached is None:
+            # Keep a reference to the mask so its id cannot be reused.
+            cached = (
+                sample_mask,
+                RegressionMetrics.from_arrays(self._y_true, self._y_pred, sample_mask),
+            )
+            self._regression_cache[key] = cached
+        return cached[1]
+
+    def mae(
+        self, max_error: float, sample_mask: np.ndarray | None = None
+    ) -> "ModelAssertion":
+        """
+        Assert mean absolute error is below max_error.
+
+        All regression assertions on the same slice share a single pass over
+        the residuals.
+
+        Args:
+            max_error: Maximum acceptable MAE.
+            sample_mask: Optional boolean mask or index array selecting the
+                slice of samples to evaluate.
+
+        Returns:
+            self for method chaining.
+        """
+        self._assertions.append(
+            {
+                "name": "mae",
+                "fn": lambda: check_max_score(
+                    "MAE", self._regression_metrics(sample_mask).mae, max_error
+                ),
+                "args": {"max_error": max_error, "sliced": sample_mask is not None},
+            }
+        )
+        return self
+
+    def rmse(
+        self, max_error: float, sample_mask: np.ndarray | None = None
+    ) -> "ModelAssertion":
+        """
+        Assert root mean squared error is below max_error.
+
+        Args:
+            max_error: Maximum acceptable RMSE.
+            sample_mask: Optional boolean mask or index array selecting the
+                slice of samples to evaluate.
+
+        Returns:
+            self for method chaining.
+        """
+        self._assertions.append(
+            {
+                "name": "rmse",
+                "fn": lambda: check_max_score(
+                    "RMSE", self._regression_metrics(sample_mask).rmse, max_error
+                ),
+                "args": {"max_error": max_error, "sliced": sample_mask is not None},
+            }
+        )
+        return self
+
+    def r2(
+        self,
+        threshold: float = None,
+        min_score: float = None,
+        sample_mask: np.ndarray | None = None,
+    ) -> "ModelAssertion":
+        """
+        Assert R² score is above threshold.
+
+        Args:
+            threshold: Minimum acceptable R² score.
+            min_score: (deprecated) Minimum acceptable R² score.
+            sample_mask: Optional boolean mask or index array selecting the
+                slice of samples to evaluate.
+
+        Returns:
+            self for method chaining.
+        """
+        if threshold is None and min_score is not None:
+            threshold = min_score
+        self._assertions.append(
+            {
+                "name": "r2",
+                "fn": lambda: check_min_score(
+                    "R2 score", self._regression_metrics(sample_mask).r2, threshold
+                ),
+                "args": {"threshold": threshold, "sliced": sample_mask is not None},
+            }
+        )
+        return self
+
+    def mape(
+        self, max_error: float, sample_mask: np.ndarray | None = None
+    ) -> "ModelAssertion":
+        """
+        Assert mean absolute percentage error (as a fraction) is below max_error.
+
+        Args:
+            max_error: Maximum acceptable MAPE.
+            sample_mask: Optional boolean mask or index array selecting the
+                slice of samples to evaluate.
+
+        Returns:
+            self for method chaining.
+        """
+        self._assertions.append(
+            {
+                "name": "mape",
+                "fn": lambda: check_max_score(
+                    "MAPE", self._regression_metrics(sample_mask).mape, max_error
+                ),
+                "args": {"max_error": max_error, "sliced": sample_mask is not None},
+            }
+        )
+        return self
+
+    def quantile_loss(
+        self,
+        quantile: float,
+        max_loss: float,
+        sample_mask: np.ndarray | None = None,
+    ) -> "ModelAssertion":
+        """
+        Assert quantile (pinball) loss is below max_loss.
+
+        Args:
+            quantile: Quantile level in (0, 1) the predictions target.
+            max_loss: Maximum acceptable mean pinball loss.
+            sample_mask: Optional boolean mask or index array selecting the
+                slice of samples to evaluate.
+
+        Returns:
+            self for method chaining.
+        """
+        self._assertions.append(
+            {
+                "name": "quantile_loss",
+                "fn": lambda: check_max_score(
+                    f"Quantile loss (q={quantile:g})",
+                    self._regression_metrics(sample_mask).quantile_loss(quantile),
+                    max_loss,
+                ),
+                "args": {
+                    "quantile": quantile,
+                    "max_loss": max_loss,
+                    "sliced": sample_mask is not None,
+                },
+            }
+        )
+        return self
+
     def validate(self) -> AssertionResult:
         """
         Execute all chained assertions.
@@ -406,4 +910,4 @@ def assert_model(
     Returns:
         A ModelAssertion instance.
     """
-    return ModelAssertion(y_true, y_pred)
+    return ModelAssertion(y_true, y_pred, y_scores)
@@ -0,0 +1,105 @@
+"""
+Array loaders for prediction, label and score files.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+_RAW_SUFFIXES = {".bin", ".raw"}
+_ARROW_SUFFIXES = {".arrow", ".feather", ".ipc"}
+_PARQUET_SUFFIXES = {".parquet", ".pq"}
+
+
+def _single_column(names: list[str], column: str | None, path: Path) -> str:
+    if column is not None:
+        return column
+    if len(names) != 1:
+        raise ValueError(
+            f"{path} has {len(names)} columns; specify which one to load with 'column'"
+        )
+    return names[0]
+
+
+def _column_to_numpy(chunked: Any) -> np.ndarray:
+    """Convert an Arrow column to numpy, without copying when the buffers allow it."""
+    if chunked.num_chunks == 1:
+        return chunked.chunk(0).to_numpy(zero_copy_only=False)
+    return chunked.to_numpy()
+
+
+def _load_arrow(path: Path, column: str | None) -> np.ndarray:
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "Loading Arrow files requires pyarrow. Install it with 'pip install pyarrow'."
+        ) from e
+    # Memory-mapped IPC reads alias the file's pages instead of copying them.
+    source = pa.memory_map(str(path), "r")
+    try:
+        table = pa.ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        table = pa.ipc.open_stream(source).read_all()
+    return _column_to_numpy(
+        table.column(_single_column(table.column_names, column, path))
+    )
+
+
+def _load_parquet(path: Path, column: str | None) -> np.ndarray:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Loading Parquet files requires pyarrow. Install it with 'pip install pyarrow'."
+        ) from e
+    names = pq.read_schema(path).names
+    name = _single_column(names, column, path)
+    table = pq.read_table(path, columns=[name], memory_map=True)
+    return _column_to_numpy(table.column(name))
+
+
+def load_array(spec: str | Path | dict[str, Any]) -> np.ndarray:
+    """
+    Load a 1-D array of labels, predictions or scores.
+
+    The format is chosen from the file suffix:
+
+    - ``.npy``: memory-mapped read-only with ``np.load(mmap_mode="r")``.
+    - ``.bin``/``.raw``: raw binary, memory-mapped with ``np.memmap``
+      using ``dtype`` (default ``float64``) and an optional byte ``offset``.
+    - ``.arrow``/``.feather``/``.ipc``: Arrow IPC, memory-mapped via pyarrow.
+    - ``.parquet``/``.pq``: one Parquet column, read via pyarrow.
+    - anything else: whitespace-delimited text via ``np.loadtxt``.
+
+    Memory-mapped results are returned as-is so the metric code can consume
+    them without materializing a copy.
+
+    Args:
+        spec: A path, or a mapping with ``path`` and optional ``column``,
+            ``dtype`` and ``offset`` keys.
+
+    Returns:
+        The loaded array.
+    """
+    if isinstance(spec, dict):
+        path = Path(spec["path"])
+        column = spec.get("column")
+        dtype = spec.get("dtype")
+        offset = spec.get("offset", 0)
+    else:
+        path = Path(spec)
+        column = dtype = None
+        offset = 0
+
+    suffix = path.suffix.lower()
+    if suffix == ".npy":
+        return np.load(path, mmap_mode="r")
+    if suffix in _RAW_SUFFIXES:
+        return np.memmap(path, dtype=dtype or np.float64, mode="r", offset=offset)
+    if suffix in _ARROW_SUFFIXES:
+        return _load_arrow(path, column)
+    if suffix in _PARQUET_SUFFIXES:
+        return _load_parquet(path, column)
+    return np.loadtxt(path, dtype=dtype or float)
@@ -0,0 +1,161 @@
+"""
+Persisted SHAP attribution profiles and explanation drift assertions.
+
+A profile summarizes a model's SHAP values in a size independent of the
+number of explained rows: the mean absolute attribution of every feature and
+a fixed grid of quantiles of its signed attributions. Profiles are saved next
+to a baseline model once and compared against a candidate's profile, so the
+baseline's SHAP values never have to be recomputed.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.stats import spearmanr
+
+from ml_assert.model.performance import check_max_score, check_min_score
+
+
+@dataclass
+class AttributionProfile:
+    """Per-feature summary of SHAP values, comparable across model versions."""
+
+    feature_names: list[str]
+    mean_abs: np.ndarray
+    levels: np.ndarray
+    quantiles: np.ndarray
+    n_samples: int
+
+    @classmethod
+    def from_shap_values(
+        cls, values: np.ndarray, feature_names: list[str], n_quantiles: int = 101
+    ) -> "AttributionProfile":
+        """
+        Summarize SHAP values.
+
+        Args:
+            values: SHAP values of shape (samples, features), or (samples,
+                features, classes) for multiclass models, whose classes are
+                pooled.
+            feature_names: Name of each feature.
+            n_quantiles: Number of evenly spaced quantile levels on [0, 1]
+                kept per feature.
+
+        Returns:
+            The attribution profile.
+        """
+        if n_quantiles < 2:
+            raise ValueError("n_quantiles must be at least 2")
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 3:
+            values = values.transpose(0, 2, 1).reshape(-1, values.shape[1])
+        if values.ndim != 2 or values.shape[1] != len(feature_names):
+            raise ValueError(
+                f"Expected SHAP values with {len(feature_names)} feature columns, "
+                f"got shape {values.shape}"
+            )
+        levels = np.linspace(0.0, 1.0, n_quantiles)
+        return cls(
+            feature_names=[str(name) for name in feature_names],
+            mean_abs=np.abs(values).mean(axis=0),
+            levels=levels,
+            quantiles=np.quantile(values, levels, axis=0).T,
+            n_samples=values.shape[0],
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Save the profile as an ``.npz`` archive."""
+        np.savez(
+            path,
+            feature_names=np.array(self.feature_names, dtype=str),
+            mean_abs=self.mean_abs,
+            levels=self.levels,
+            quantiles=self.quantiles,
+            n_samples=self.n_samples,
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "AttributionProfile":
+        """Load a profile saved with :meth:`save`."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                feature_names=data["feature_names"].tolist(),
+                mean_abs=data["mean_abs"],
+                levels=data["levels"],
+                quantiles=data["quantiles"],
+                n_samples=int(data["n_samples"]),
+            )
+
+    def importance(self) -> pd.Series:
+        """Mean absolute SHAP value per feature, sorted in descending order."""
+        return pd.Series(self.mean_abs, index=self.feature_names).sort_values(
+            ascending=False
+        )
+
+    def _aligned(self, other: "AttributionProfile") -> np.ndarray:
+        """Positions of this profile's features in ``other``."""
+        positions = {name: i for i, name in enumerate(other.feature_names)}
+        missing = set(self.feature_names).symmetric_difference(positions)
+        if missing:
+            raise ValueError(f"Profiles cover different features: {sorted(missing)}")
+        return np.array([positions[name] for name in self.feature_names])
+
+    def rank_correlation(self, other: "AttributionProfile") -> float:
+        """
+        Spearman rank correlation of feature importance with another profile.
+
+        Features are matched by name, so their order may differ.
+        """
+        other_mean_abs = other.mean_abs[self._aligned(other)]
+        return float(spearmanr(self.mean_abs, other_mean_abs).statistic)
+
+    def distances(self, other: "AttributionProfile") -> pd.Series:
+        """
+        Wasserstein-1 distance between each feature's attribution distributions.
+
+        The distance is the area between the two quantile functions, read off
+        the stored quantile grids. Profiles with different grids are compared
+        on this profile's levels.
+
+        Returns:
+            Distance per feature, sorted in descending order.
+        """
+        other_quantiles = other.quantiles[self._aligned(other)]
+        if not np.array_equal(self.levels, other.levels):
+            other_quantiles = np.array(
+                [np.interp(self.levels, other.levels, q) for q in other_quantiles]
+            )
+        gaps = np.abs(self.quantiles - other_quantiles)
+        # Trapezoidal area between the quantile functions on [0, 1].
+        area = ((gaps[:, 1:] + gaps[:, :-1]) / 2 * np.diff(self.levels)).sum(axis=1)
+        return pd.Series(area, index=self.feature_names).sort_values(ascending=False)
+
+
+def assert_attribution_rank_correlation(
+    baseline: AttributionProfile,
+    candidate: AttributionProfile,
+    min_correlation: float,
+) -> None:
+    """Asserts that feature importance rankings of two profiles agree."""
+    correlation = baseline.rank_correlation(candidate)
+    if np.isnan(correlation):
+        raise AssertionError(
+            "Attribution rank correlation is undefined for constant importances"
+        )
+    check_min_score("Attribution rank correlation", correlation, min_correlation)
+
+
+def assert_attribution_distance(
+    baseline: AttributionProfile,
+    candidate: AttributionProfile,
+    max_distance: float,
+) -> None:
+    """Asserts that no feature's attribution distribution moved too far."""
+    distances = baseline.distances(candidate)
+    check_max_score(
+        f"Attribution distance of feature {distances.index[0]!r}",
+        distances.iloc[0],
+        max_distance,
+    )
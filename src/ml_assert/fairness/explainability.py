@@ -1,66 +1,422 @@
+import pickle
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import matplotlib.pyplot as plt
+import cloudpickle
+import joblib
 import numpy as np
 import pandas as pd
-import shap
+from joblib import Parallel, delayed
+from sklearn.cluster import KMeans
+from sklearn.utils import resample
+
+from ml_assert.fairness.attribution import AttributionProfile
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# shap is imported where it is used: importing it loads matplotlib.pyplot, so
+# importing this module (and with it the CLI) stays light until an explainer
+# is built.
+
+# Largest automatic row batch, so explaining millions of rows never hands one
+# worker an intermediate tensor as large as the whole input.
+_MAX_AUTO_BATCH_SIZE = 10_000
+
+
+_BACKGROUND_METHODS = ("kmeans", "sample")
+
+# Upper bound on TreeSHAP interaction entries (rows x features²) held at once.
+_INTERACTION_BATCH_CELLS = 2**24
+
+# joblib backends whose workers are processes on this machine, so they can
+# load an explainer dumped to a local temporary file.
+_LOCAL_PROCESS_BACKENDS = ("loky", "multiprocessing")
+
+# Explainer loaded in this worker process, keyed by the path it was dumped to.
+_WORKER_EXPLAINER: dict[str, Any] = {}
+
+
+def summarize_background(
+    data: pd.DataFrame | np.ndarray,
+    size: int = 100,
+    method: str = "kmeans",
+    stratify: np.ndarray | None = None,
+    random_state: int | None = None,
+) -> pd.DataFrame:
+    """
+    Reduce background data to a fixed number of representative rows.
+
+    Model-agnostic SHAP explainers evaluate the model once per background row
+    for every explained sample, so their cost is linear in the background
+    size. Data that already has at most ``size`` rows is returned unchanged.
+
+    Args:
+        data: Background data, typically a sample of the training set.
+        size: Number of rows to keep.
+        method: ``"kmeans"`` for k-means centroids (numeric features only)
+            or ``"sample"`` for a random subset of real rows. Explainers
+            average over background rows uniformly, so each centroid is
+            repeated in proportion to its cluster's size, like the weights
+            of ``shap.kmeans``; centroids of clusters too small for a whole
+            row are left out.
+        stratify: Optional labels for ``"sample"``; the subset keeps their
+            class proportions. Not supported with ``"kmeans"``.
+        random_state: Seed for k-means initialization or sampling.
+
+    Returns:
+        The summarized background as a DataFrame with the input's columns.
+    """
+    if method not in _BACKGROUND_METHODS:
+        raise ValueError(f"method must be one of {_BACKGROUND_METHODS}, got {method!r}")
+    if size < 1:
+        raise ValueError("size must be a positive integer")
+    if stratify is not None and method != "sample":
+        raise ValueError("stratify is only supported with method='sample'")
+    data = pd.DataFrame(data)
+    if len(data) <= size:
+        return data
+    if method == "sample":
+        return resample(
+            data,
+            n_samples=size,
+            replace=False,
+            stratify=stratify,
+            random_state=random_state,
+        )
+    kmeans = KMeans(n_clusters=size, random_state=random_state).fit(data.to_numpy())
+    # Split the size rows between the clusters by largest remainder.
+    quotas = np.bincount(kmeans.labels_, minlength=size) * size / len(data)
+    copies = np.floor(quotas).astype(np.int64)
+    copies[np.argsort(copies - quotas)[: size - copies.sum()]] += 1
+    return pd.DataFrame(
+        np.repeat(kmeans.cluster_centers_, copies, axis=0), columns=data.columns
+    )
+
+
+def _row_slice(X: Any, start: int, stop: int) -> Any:
+    """Rows ``start:stop`` of a DataFrame or array, without copying."""
+    return X.iloc[start:stop] if hasattr(X, "iloc") else X[start:stop]
+
+
+def _render_plot(
+    kind: str,
+    values: np.ndarray,
+    X: pd.DataFrame,
+    output_path: str | None,
+    dpi: int,
+    feature: str | None = None,
+    interaction_index: str | None = None,
+) -> "Figure | None":
+    """
+    Draw a summary or dependence plot, saving and closing it if a path is given.
+
+    pyplot is imported here rather than at module level, like shap.
+    """
+    import matplotlib.pyplot as plt
+    import shap
+
+    fig = plt.figure(figsize=(10, 6))
+    if kind == "summary":
+        shap.summary_plot(values, X, show=False)
+    else:
+        shap.dependence_plot(
+            feature,
+            values,
+            X,
+            interaction_index=interaction_index,
+            ax=fig.gca(),
+            show=False,
+        )
+    if output_path is None:
+        return fig
+    fig.savefig(output_path, bbox_inches="tight", dpi=dpi)
+    plt.close(fig)
+    return None
+
+
+def _render_plot_headless(*args: Any) -> None:
+    """Render a plot in a worker process with the non-interactive Agg backend."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    _render_plot(*args)
+
+
+def _worker_explainer(path: str) -> Any:
+    """
+    The explainer dumped at ``path``, loaded once per worker process.
+
+    Only the latest explainer is kept. Unpickling rebuilds shap's
+    numba-compiled link functions as new objects, but shap detects the
+    identity link by object identity. An unrecognized identity link gets
+    linearized, which divides by zero wherever an output equals its expected
+    value (every output, for a constant model), so built-in links are
+    swapped back for the worker's own instances.
+    """
+    explainer = _WORKER_EXPLAINER.get(path)
+    if explainer is None:
+        import shap
+
+        with open(path, "rb") as f:
+            explainer = pickle.load(f)
+        link = getattr(explainer, "link", None)
+        if getattr(link, "__module__", None) == "shap.links":
+            explainer.link = getattr(shap.links, link.__name__, link)
+        _WORKER_EXPLAINER.clear()
+        _WORKER_EXPLAINER[path] = explainer
+    return explainer
+
+
+def _explain_rows(explainer: Any, X: Any) -> np.ndarray:
+    """
+    SHAP values of one row batch.
+
+    ``explainer`` is the explainer itself, or in worker processes the path
+    it was dumped to, so the model is not pickled again for every batch.
+    """
+    if isinstance(explainer, str):
+        explainer = _worker_explainer(explainer)
+    return np.asarray(explainer(X).values)
 
 
 class ModelExplainer:
     """A class to provide model explainability using SHAP values."""
 
-    def __init__(self, model: Any, feature_names: list | None = None):
+    def __init__(
+        self,
+        model: Any,
+        feature_names: list | None = None,
+        cache_size: int = 4,
+        background: pd.DataFrame | np.ndarray | None = None,
+        background_size: int = 100,
+        background_method: str = "kmeans",
+        stratify: np.ndarray | None = None,
+        random_state: int | None = None,
+    ):
         """
         Initialize the ModelExplainer.
 
         Args:
             model: The trained model to explain.
-            feature_names: Optional list of feature names.
+            feature_names: Optional list of feature names. Defaults to the
+                columns of ``background`` when it is a DataFrame.
+            cache_size: Number of distinct inputs whose SHAP values are kept
+                for reuse by every method. 0 disables the cache.
+            background: Optional background data the explainer integrates
+                features out over, typically a sample of the training set.
+                Without it a single all-zero row is used.
+            background_size: Number of rows ``background`` is summarized to.
+            background_method: ``"kmeans"`` or ``"sample"``; see
+                :func:`summarize_background`.
+            stratify: Optional labels that ``"sample"`` keeps the class
+                proportions of. Requires ``background_method="sample"``.
+            random_state: Seed for the background summarization.
         """
+        import shap
+
+        if cache_size < 0:
+            raise ValueError("cache_size must be non-negative")
+        if background is None:
+            if feature_names is None:
+                raise ValueError("feature_names is required without background data")
+            background = pd.DataFrame(
+                np.zeros((1, len(feature_names))), columns=feature_names
+            )
+        else:
+            if not isinstance(background, pd.DataFrame):
+                background = pd.DataFrame(background, columns=feature_names)
+            if feature_names is None:
+                feature_names = background.columns
+            background = summarize_background(
+                background,
+                background_size,
+                background_method,
+                stratify=stratify,
+                random_state=random_state,
+            )
         self.model = model
         self.feature_names = feature_names
-        # Use a default masker (the input data) if none is provided
+        self.cache_size = cache_size
+        self._shap_cache: OrderedDict[str, Any] = OrderedDict()
+        # Summarized once and kept, so the masker never re-clusters or resamples.
+        self.background = background
+        self._tree_explainer = None
         self.explainer = shap.Explainer(
             model,
-            masker=pd.DataFrame(
-                np.zeros((1, len(feature_names))), columns=feature_names
-            ),
+            masker=shap.maskers.Independent(background, max_samples=len(background)),
         )
 
-    def explain(self, X: pd.DataFrame) -> dict[str, np.ndarray]:
+    def _shap_values(self, X: pd.DataFrame) -> Any:
+        """
+        SHAP values for X, computed at most once per distinct input.
+
+        Results are cached under a content hash of X, so every method called
+        with the same data reuses one computation. The least recently used
+        entry is evicted once more than ``cache_size`` inputs are cached.
+        """
+        if self.cache_size == 0:
+            return self.explainer(X)
+        key = joblib.hash(X)
+        if key in self._shap_cache:
+            self._shap_cache.move_to_end(key)
+            return self._shap_cache[key]
+        shap_values = self.explainer(X)
+        self._shap_cache[key] = shap_values
+        while len(self._shap_cache) > self.cache_size:
+            self._shap_cache.popitem(last=False)
+        return shap_values
+
+    def clear_cache(self) -> None:
+        """Drop all cached SHAP values."""
+        self._shap_cache.clear()
+
+    def explain(
+        self,
+        X: pd.DataFrame,
+        batch_size: int | None = None,
+        n_jobs: int | None = 1,
+        output_path: str | Path | None = None,
+        backend: str = "loky",
+    ) -> dict[str, np.ndarray]:
         """
         Generate SHAP values for the given input data.
 
+        By default X is explained in one call and the result is cached. With
+        ``batch_size``, ``n_jobs`` or ``output_path`` set, X is instead split
+        into row batches that are explained across a joblib worker pool and
+        written into a preallocated array as they complete, so memory holds
+        the output plus a few in-flight batches rather than every
+        intermediate tensor of one huge call.
+
         Args:
             X: Input data as a pandas DataFrame.
+            batch_size: Number of rows explained per task. Defaults to
+                splitting X evenly across the workers, with at most 10,000
+                rows per batch.
+            n_jobs: Number of worker processes; -1 uses every CPU.
+            output_path: Optional ``.npy`` path. The output is then a
+                memory-mapped file written batch by batch instead of an
+                in-memory array, so it can exceed available RAM.
+            backend: joblib backend used to run the batches.
 
         Returns:
             A dictionary containing SHAP values.
         """
-        shap_values = self.explainer(X)
-        return {"shap_values": shap_values.values}
+        if batch_size is None and n_jobs == 1 and output_path is None:
+            shap_values = self._shap_values(X)
+            return {"shap_values": shap_values.values}
+        return {
+            "shap_values": self._explain_batches(
+                X, batch_size, n_jobs, output_path, backend
+            )
+        }
+
+    def _explain_batches(
+        self,
+        X: pd.DataFrame,
+        batch_size: int | None,
+        n_jobs: int | None,
+        output_path: str | Path | None,
+        backend: str,
+    ) -> np.ndarray:
+        """
+        Explain X in row batches, writing each batch into one output array.
+
+        The output is allocated once the first batch reveals its trailing
+        shape and dtype (multiclass explainers add a class axis). Batches
+        are consumed in order from a joblib generator, and ``pre_dispatch``
+        bounds how many finished batches can wait in memory. For worker
+        processes the explainer, model included, is dumped to a temporary
+        file once per call and each task carries only its path.
+        """
+        n_rows = len(X)
+        if n_rows == 0:
+            raise ValueError("X must contain at least one row")
+        if batch_size is None:
+            n_workers = joblib.effective_n_jobs(n_jobs)
+            batch_size = min(-(-n_rows // n_workers), _MAX_AUTO_BATCH_SIZE)
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        starts = range(0, n_rows, batch_size)
+        out = None
+        with (
+            tempfile.TemporaryDirectory() as tmp,
+            Parallel(n_jobs=n_jobs, backend=backend, return_as="generator") as parallel,
+        ):
+            explainer = self.explainer
+            if (
+                backend in _LOCAL_PROCESS_BACKENDS
+                and joblib.effective_n_jobs(n_jobs) > 1
+            ):
+                explainer = str(Path(tmp) / "explainer.pkl")
+                with open(explainer, "wb") as f:
+                    cloudpickle.dump(self.explainer, f)
+            batches = parallel(
+                delayed(_explain_rows)(
+                    explainer, _row_slice(X, start, start + batch_size)
+                )
+                for start in starts
+            )
+            for start, values in zip(starts, batches, strict=True):
+                if out is None:
+                    shape = (n_rows, *values.shape[1:])
+                    if output_path is not None:
+                        out = np.lib.format.open_memmap(
+                            output_path, mode="w+", dtype=values.dtype, shape=shape
+                        )
+                    else:
+                        out = np.empty(shape, dtype=values.dtype)
+                out[start : start + len(values)] = values
+        if isinstance(out, np.memmap):
+            out.flush()
+        return out
+
+    def _plot_data(
+        self, X: pd.DataFrame, max_points: int | None
+    ) -> tuple[np.ndarray, pd.DataFrame]:
+        """
+        SHAP values and rows to plot, randomly downsampled to ``max_points``.
 
-    def plot_summary(self, X: pd.DataFrame, output_path: str | None = None) -> None:
+        Multiclass SHAP values are reduced to the first class. Downsampling
+        uses a fixed seed, so repeated plots of the same data match.
+        """
+        values = self._shap_values(X).values
+        if values.ndim == 3:
+            values = values[:, :, 0]
+        if max_points is not None and len(X) > max_points:
+            rng = np.random.default_rng(0)
+            rows = np.sort(rng.choice(len(X), size=max_points, replace=False))
+            values = values[rows]
+            X = X.iloc[rows] if hasattr(X, "iloc") else X[rows]
+        return values, X
+
+    def plot_summary(
+        self,
+        X: pd.DataFrame,
+        output_path: str | None = None,
+        dpi: int = 300,
+        max_points: int | None = None,
+    ) -> "Figure | None":
         """
         Generate and optionally save a summary plot of SHAP values.
 
         Args:
             X: Input data as a pandas DataFrame.
-            output_path: Optional path to save the plot.
+            output_path: Optional path to save the plot; the file extension
+                sets the image format.
+            dpi: Resolution of the saved image.
+            max_points: Optional number of rows to randomly downsample to
+                before plotting.
+
+        Returns:
+            The figure if no output path is given, otherwise None.
         """
-        shap_values = self.explainer(X)
-        # Handle multiclass: select first class if 3D
-        values = shap_values.values
-        if values.ndim == 3:
-            values = values[:, :, 0]
-        plt.figure(figsize=(10, 6))
-        shap.summary_plot(values, X, show=False)
-        if output_path:
-            plt.savefig(output_path, bbox_inches="tight", dpi=300)
-            plt.close()
-        else:
-            plt.show()
+        values, X = self._plot_data(X, max_points)
+        return _render_plot("summary", values, X, output_path, dpi)
 
     def plot_dependence(
         self,
@@ -68,7 +424,9 @@ class ModelExplainer:
         feature: str,
         interaction_index: str | None = None,
         output_path: str | None = None,
-    ) -> None:
+        dpi: int = 300,
+        max_points: int | None = None,
+    ) -> "Figure | None":
         """
         Generate and optionally save a dependence plot for a specific feature.
 
@@ -76,22 +434,36 @@ class ModelExplainer:
             X: Input data as a pandas DataFrame.
             feature: Name of the feature to plot.
             interaction_index: Optional feature to show interaction with.
-            output_path: Optional path to save the plot.
+            output_path: Optional path to save the plot; the file extension
+                sets the image format.
+            dpi: Resolution of the saved image.
+            max_points: Optional number of rows to randomly downsample to
+                before plotting.
+
+        Returns:
+            The figure if no output path is given, otherwise None.
         """
-        shap_values = self.explainer(X)
-        # Handle multiclass: select first class if 3D
-        values = shap_values.values
-        if values.ndim == 3:
-            values = values[:, :, 0]
-        plt.figure(figsize=(10, 6))
-        shap.dependence_plot(
-            feature, values, X, interaction_index=interaction_index, show=False
+        values, X = self._plot_data(X, max_points)
+        return _render_plot(
+            "dependence", values, X, output_path, dpi, feature, interaction_index
+        )
+
+    def attribution_profile(
+        self, X: pd.DataFrame, n_quantiles: int = 101
+    ) -> AttributionProfile:
+        """
+        Summarize the SHAP values of X into a persistable attribution profile.
+
+        Args:
+            X: Input data as a pandas DataFrame.
+            n_quantiles: Number of quantile levels kept per feature.
+
+        Returns:
+            The profile, which can be saved and compared with another model's.
+        """
+        return AttributionProfile.from_shap_values(
+            self._shap_values(X).values, list(self.feature_names), n_quantiles
         )
-        if output_path:
-            plt.savefig(output_path, bbox_inches="tight", dpi=300)
-            plt.close()
-        else:
-            plt.show()
 
     def get_feature_importance(self, X: pd.DataFrame) -> pd.DataFrame:
         """
@@ -103,7 +475,7 @@ class ModelExplainer:
         Returns:
             DataFrame with feature names and their importance scores.
         """
-        shap_values = self.explainer(X)
+        shap_values = self._shap_values(X)
         importance = np.abs(shap_values.values).mean(axis=0)
         n_features = len(self.feature_names)
         if importance.size != n_features:
@@ -118,8 +490,72 @@ class ModelExplainer:
             {"feature": self.feature_names, "importance": importance}
         ).sort_values("importance", ascending=False)
 
+    def interaction_strengths(
+        self, X: pd.DataFrame, tree_interactions: bool = False
+    ) -> pd.DataFrame:
+        """
+        Pairwise feature interaction strengths as a symmetric matrix.
+
+        By default the strength of features i and j is the mean of
+        ``|v_i * v_j|`` over samples, computed for every pair at once as
+        ``|V|ᵀ|V| / n``. Multiclass SHAP values are averaged over classes.
+        With ``tree_interactions``, true TreeSHAP interaction values are used
+        instead: the strength is the mean of ``|Φ_ij| + |Φ_ji|``.
+
+        Args:
+            X: Input data as a pandas DataFrame.
+            tree_interactions: Whether to use TreeSHAP interaction values.
+                Only tree models support them.
+
+        Returns:
+            DataFrame of interaction strengths indexed by feature on both axes.
+        """
+        if tree_interactions:
+            strengths = self._tree_interaction_strengths(X)
+        else:
+            values = np.abs(np.asarray(self._shap_values(X).values, dtype=np.float64))
+            if values.ndim == 2:
+                values = values[:, :, np.newaxis]
+            # (classes, features, samples) @ (classes, samples, features)
+            per_class = values.transpose(2, 1, 0) @ values.transpose(2, 0, 1)
+            strengths = per_class.mean(axis=0) / values.shape[0]
+        names = list(self.feature_names)
+        return pd.DataFrame(strengths, index=names, columns=names)
+
+    def _tree_interaction_strengths(self, X: pd.DataFrame) -> np.ndarray:
+        """
+        Mean absolute TreeSHAP interaction values, accumulated in row batches.
+
+        Interaction values hold features² entries per sample, so rows are
+        processed in batches small enough to keep that tensor bounded.
+        """
+        if self._tree_explainer is None:
+            import shap
+
+            try:
+                self._tree_explainer = shap.TreeExplainer(self.model)
+            except Exception as e:
+                raise ValueError(
+                    "tree_interactions requires a tree model supported by "
+                    f"shap.TreeExplainer: {e}"
+                ) from e
+        n_features = len(self.feature_names)
+        batch_size = max(1, _INTERACTION_BATCH_CELLS // n_features**2)
+        totals = np.zeros((n_features, n_features))
+        for start in range(0, len(X), batch_size):
+            phi = self._tree_explainer.shap_interaction_values(
+                _row_slice(X, start, start + batch_size)
+            )
+            # Older shap versions return one array per class.
+            phi = np.abs(np.stack(phi, axis=-1) if isinstance(phi, list) else phi)
+            if phi.ndim == 4:
+                phi = phi.mean(axis=-1)
+            totals += phi.sum(axis=0)
+        totals /= len(X)
+        return totals + totals.T
+
     def analyze_interactions(
-        self, X: pd.DataFrame, top_n: int = 5
+        self, X: pd.DataFrame, top_n: int = 5, tree_interactions: bool = False
     ) -> list[tuple[str, str, float]]:
         """
         Analyze feature interactions using SHAP interaction values.
@@ -127,43 +563,57 @@ class ModelExplainer:
         Args:
             X: Input data as a pandas DataFrame.
             top_n: Number of top interactions to return.
+            tree_interactions: Whether to use TreeSHAP interaction values;
+                see :meth:`interaction_strengths`.
 
         Returns:
             List of tuples containing (feature1, feature2, interaction_strength).
         """
-        shap_values = self.explainer(X)
-        interaction_values = shap_values.values
-
-        # Calculate interaction strengths
-        interactions = []
-        for i in range(len(self.feature_names)):
-            for j in range(i + 1, len(self.feature_names)):
-                interaction_strength = np.abs(
-                    interaction_values[:, i] * interaction_values[:, j]
-                ).mean()
-                interactions.append(
-                    (self.feature_names[i], self.feature_names[j], interaction_strength)
-                )
-
-        # Sort by interaction strength and return top N
-        return sorted(interactions, key=lambda x: x[2], reverse=True)[:top_n]
+        strengths = self.interaction_strengths(X, tree_interactions).to_numpy()
+        rows, cols = np.triu_indices(strengths.shape[0], k=1)
+        pair_strengths = strengths[rows, cols]
+        k = min(top_n, pair_strengths.size)
+        if k <= 0:
+            return []
+        top = np.argpartition(-pair_strengths, k - 1)[:k]
+        top = top[np.argsort(-pair_strengths[top], kind="stable")]
+        names = list(self.feature_names)
+        return [(names[rows[i]], names[cols[i]], float(pair_strengths[i])) for i in top]
 
     def save_explanation_report(
-        self, X: pd.DataFrame, output_dir: str, include_plots: bool = True
+        self,
+        X: pd.DataFrame,
+        output_dir: str,
+        include_plots: bool = True,
+        dpi: int = 300,
+        plot_format: str = "png",
+        max_points: int | None = None,
+        n_jobs: int | None = 1,
     ) -> None:
         """
         Generate a comprehensive explanation report.
 
+        Plots are rendered with the non-interactive Agg backend when
+        ``n_jobs`` starts worker processes, so reports can be built on
+        headless machines. Without plots, no figures are created.
+
         Args:
             X: Input data as a pandas DataFrame.
             output_dir: Directory to save the report and plots.
             include_plots: Whether to include visualization plots.
+            dpi: Resolution of the saved plots.
+            plot_format: Image format and file extension of the plots,
+                e.g. ``"png"`` or ``"svg"``.
+            max_points: Optional number of rows the plots are randomly
+                downsampled to.
+            n_jobs: Number of worker processes rendering the plots; -1 uses
+                every CPU.
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate SHAP values
-        shap_values = self.explainer(X)
+        shap_values = self._shap_values(X)
 
         # Save raw SHAP values
         np.save(output_dir / "shap_values.npy", shap_values.values)
@@ -178,14 +628,28 @@ class ModelExplainer:
             output_dir / "feature_interactions.csv", index=False
         )
 
-        if include_plots:
-            # Generate summary plot
-            self.plot_summary(X, str(output_dir / "summary_plot.png"))
+        # Save the attribution profile for later drift comparisons
+        self.attribution_profile(X).save(output_dir / "attribution_profile.npz")
 
-            # Generate dependence plots for top features
-            for feature in importance_df["feature"].head(3):
-                self.plot_dependence(
-                    X,
-                    feature,
-                    output_path=str(output_dir / f"dependence_{feature}.png"),
-                )
+        if not include_plots:
+            return
+        values, X_plot = self._plot_data(X, max_points)
+        # Summary plot, then dependence plots for the top features
+        plots = [("summary", str(output_dir / f"summary_plot.{plot_format}"), None)]
+        plots.extend(
+            (
+                "dependence",
+                str(output_dir / f"dependence_{feature}.{plot_format}"),
+                feature,
+            )
+            for feature in importance_df["feature"].head(3)
+        )
+        if joblib.effective_n_jobs(n_jobs) == 1:
+            # In-process rendering leaves the caller's matplotlib backend alone.
+            for kind, path, feature in plots:
+                _render_plot(kind, values, X_plot, path, dpi, feature)
+        else:
+            Parallel(n_jobs=n_jobs)(
+                delayed(_render_plot_headless)(kind, values, X_plot, path, dpi, feature)
+                for kind, path, feature in plots
+            )
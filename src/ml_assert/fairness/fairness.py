@@ -1,23 +1,319 @@
+import time
+import warnings
+from collections.abc import Sequence
+from typing import Any
+
 import numpy as np
+import pandas as pd
+
+
+def _factorize(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    codes, uniques = pd.factorize(values, sort=True, use_na_sentinel=False)
+    return codes.astype(np.int64, copy=False), np.asarray(uniques)
+
+
+def _binary_labels(values: Any, name: str) -> np.ndarray:
+    """Positive-class mask of 0/1 labels; any other value raises ValueError."""
+    values = np.asarray(values).ravel()
+    positive = values == 1
+    if not (positive | (values == 0)).all():
+        raise ValueError(
+            f"{name} must contain only binary 0/1 labels; threshold scores first"
+        )
+    return positive
+
+
+def _attribute_columns(
+    sensitive_attribute: np.ndarray | pd.DataFrame | Sequence[np.ndarray],
+) -> list[np.ndarray]:
+    """Split a sensitive attribute specification into one 1-D array per attribute."""
+    if isinstance(sensitive_attribute, pd.DataFrame):
+        return [sensitive_attribute[c].to_numpy() for c in sensitive_attribute.columns]
+    if isinstance(sensitive_attribute, list | tuple):
+        return [np.asarray(column).ravel() for column in sensitive_attribute]
+    values = np.asarray(sensitive_attribute)
+    if values.ndim == 2:
+        return [values[:, j] for j in range(values.shape[1])]
+    return [values.ravel()]
+
+
+def _encode_groups(
+    sensitive_attribute: np.ndarray | pd.DataFrame | Sequence[np.ndarray],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Integer group code per sample and the sorted group values.
+
+    With several attributes, each group value is a tuple with one entry per
+    attribute.
+    """
+    columns = _attribute_columns(sensitive_attribute)
+    codes, uniques = _factorize(columns[0])
+    levels = [np.arange(len(uniques))]
+    level_values = [uniques]
+    for column in columns[1:]:
+        column_codes, column_uniques = _factorize(column)
+        k = len(column_uniques)
+        # Mixed-radix code of (group so far, value), re-compacted to
+        # [0, n_groups) so the codes stay small however many attributes.
+        codes, combined = _factorize(codes * k + column_codes)
+        levels = [level[combined // k] for level in levels]
+        levels.append(combined % k)
+        level_values.append(column_uniques)
+    if len(columns) == 1:
+        return codes, uniques
+    groups = pd.MultiIndex.from_arrays(
+        [values[level] for values, level in zip(level_values, levels, strict=True)]
+    ).to_numpy()
+    return codes, groups
+
+
+# The one NaN object every missing group value is mapped to. NaN never equals
+# itself, so dict lookups only match missing values that are this same object.
+_MISSING = float("nan")
+
+
+def _group_key(group: Any) -> Any:
+    """``group`` with missing values, also inside tuples, replaced by _MISSING."""
+    if isinstance(group, tuple):
+        return tuple(_group_key(value) for value in group)
+    if pd.api.types.is_scalar(group) and pd.isna(group):
+        return _MISSING
+    return group
+
+
+def _rate_counts(cm: np.ndarray, rate: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Numerator and denominator counts of a per-group rate.
+
+    ``cm`` is a confusion tensor of shape ``(..., n_groups, 2, 2)`` indexed
+    ``[group, true, predicted]``; the leading axes hold resamples.
+    """
+    tp = cm[..., 1, 1]
+    if rate == "selection":
+        return cm[..., 0, 1] + tp, cm.sum(axis=(-2, -1))
+    if rate == "tpr":
+        return tp, cm[..., 1, 0] + tp
+    if rate == "fpr":
+        return cm[..., 0, 1], cm[..., 0, 0] + cm[..., 0, 1]
+    # ppv
+    return tp, cm[..., 0, 1] + tp
+
+
+# Metric -> (per-group rates it compares, how they are combined)
+_RESAMPLABLE_METRICS = {
+    "demographic_parity": (("selection",), "gap"),
+    "equal_opportunity": (("tpr",), "gap"),
+    "equalized_odds": (("tpr", "fpr"), "gap"),
+    "predictive_parity": (("ppv",), "gap"),
+    "false_positive_rate_parity": (("fpr",), "gap"),
+    "disparate_impact": (("selection",), "ratio"),
+}
+_METRIC_LABELS = {
+    "demographic_parity": "Demographic parity",
+    "equal_opportunity": "Equal opportunity",
+    "equalized_odds": "Equalized odds",
+    "predictive_parity": "Predictive parity",
+    "false_positive_rate_parity": "False positive rate parity",
+    "calibration_by_group": "Calibration by group",
+    "disparate_impact": "Disparate impact",
+}
+# Metrics where larger values are fairer; thresholds on them are minimums.
+_HIGHER_IS_FAIRER = {"disparate_impact"}
+
+# Upper bound on resampled counts held in memory at once (per chunk).
+_RESAMPLE_CHUNK_CELLS = 4_000_000
+
+
+def _combine_rates(rates: np.ndarray, how: str) -> np.ndarray:
+    """Reduce per-group rates (NaN = undefined) along the last axis."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        hi = np.fmax.reduce(rates, axis=-1)
+        lo = np.fmin.reduce(rates, axis=-1)
+        if how == "ratio":
+            return np.where(np.isnan(hi) | (hi == 0), 1.0, lo / hi)
+        return np.nan_to_num(hi - lo, nan=0.0)
+
+
+def _tensor_statistic(cm: np.ndarray, metric: str) -> np.ndarray:
+    """A resamplable metric for every confusion tensor in ``cm``."""
+    rate_names, how = _RESAMPLABLE_METRICS[metric]
+    values = []
+    for rate in rate_names:
+        num, den = _rate_counts(cm, rate)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values.append(_combine_rates(np.where(den > 0, num / den, np.nan), how))
+    return np.maximum.reduce(values)
+
+
+def _warn_saturated(metric: str, stats: np.ndarray, least_fair: float) -> None:
+    warnings.warn(
+        f"{np.mean(stats == least_fair):.0%} of the bootstrap replicates of "
+        f"{metric} are at its least fair value {least_fair:g}, so the interval "
+        "is uninformative; raise min_group_size or use permutation_pvalue",
+        stacklevel=3,
+    )
+
+
+def _resamplable(metric: str) -> None:
+    if metric not in _RESAMPLABLE_METRICS:
+        raise ValueError(f"metric must be one of: {', '.join(_RESAMPLABLE_METRICS)}")
 
 
 class FairnessMetrics:
-    """A class to compute fairness metrics for a model."""
+    """
+    A class to compute fairness metrics for a model.
+
+    The sensitive attribute is factorized into integer group codes once, on
+    first use. A single ``np.bincount`` over those codes and the labels then
+    builds a per-group confusion tensor (groups × 2 × 2), cached on the
+    instance, from which every metric derives its per-group rates.
+
+    Several sensitive attributes (a 2-D array, a DataFrame or a list of
+    arrays) define intersectional groups, one per observed combination of
+    values. Their codes are combined arithmetically, never by building
+    string keys.
+    """
 
     def __init__(
-        self, y_true: np.ndarray, y_pred: np.ndarray, sensitive_attribute: np.ndarray
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        sensitive_attribute: np.ndarray | pd.DataFrame | Sequence[np.ndarray],
+        min_group_size: int = 1,
+        y_scores: np.ndarray | None = None,
     ):
         """
         Initialize the FairnessMetrics.
 
         Args:
-            y_true: True labels.
-            y_pred: Predicted labels.
-            sensitive_attribute: Sensitive attribute (e.g., gender, race).
+            y_true: True binary (0/1) labels.
+            y_pred: Predicted binary (0/1) labels; probabilities must be
+                thresholded first, otherwise metrics raise ValueError.
+            sensitive_attribute: Sensitive attribute (e.g., gender, race), or
+                several of them as a 2-D array, DataFrame or list of arrays.
+            min_group_size: Groups with fewer samples are left out of every
+                metric.
+            y_scores: Optional positive-class probabilities, used for
+                calibration by group.
         """
+        if min_group_size < 1:
+            raise ValueError("min_group_size must be at least 1")
         self.y_true = y_true
         self.y_pred = y_pred
         self.sensitive_attribute = sensitive_attribute
+        self.min_group_size = min_group_size
+        self.y_scores = y_scores
+        self._group_cache: tuple[np.ndarray, np.ndarray] | None = None
+        self._confusion_cache: np.ndarray | None = None
+
+    @classmethod
+    def from_confusion_tensor(
+        cls,
+        confusion_tensor: np.ndarray,
+        groups: np.ndarray,
+        min_group_size: float = 1,
+    ) -> "FairnessMetrics":
+        """
+        Build metrics from precomputed per-group counts instead of samples.
+
+        Counts may be fractional (e.g. time-decayed); resampling methods
+        round them to whole samples. Calibration uses the predicted labels.
+
+        Args:
+            confusion_tensor: Counts of shape ``(n_groups, 2, 2)`` indexed
+                ``[group, true, predicted]``.
+            groups: Group values aligned with the first axis.
+            min_group_size: Groups with a smaller total count are left out.
+        """
+        metrics = cls.__new__(cls)
+        metrics.y_true = metrics.y_pred = metrics.y_scores = None
+        metrics.sensitive_attribute = None
+        metrics.min_group_size = min_group_size
+        metrics._group_cache = (None, np.asarray(groups))
+        metrics._confusion_cache = np.asarray(confusion_tensor)
+        return metrics
+
+    def _group_codes(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Integer group code per sample and the sorted group values.
+
+        Computed once and shared by every metric on this instance.
+        """
+        if self._group_cache is None:
+            self._group_cache = _encode_groups(self.sensitive_attribute)
+        return self._group_cache
+
+    @property
+    def groups(self) -> np.ndarray:
+        """The distinct (combinations of) sensitive attribute values, sorted."""
+        return self._group_codes()[1]
+
+    @property
+    def group_sizes(self) -> np.ndarray:
+        """Number of samples in each group, aligned with ``groups``."""
+        return self.confusion_tensor.sum(axis=(1, 2))
+
+    @property
+    def confusion_tensor(self) -> np.ndarray:
+        """
+        Per-group confusion matrices, shape ``(n_groups, 2, 2)``.
+
+        Entry ``[g, t, p]`` counts samples of group ``g`` with true label
+        ``t`` and predicted label ``p`` (1 is the positive class). Built with
+        one ``np.bincount`` on first use and shared by every metric.
+        """
+        if self._confusion_cache is None:
+            codes, groups = self._group_codes()
+            y_true = _binary_labels(self.y_true, "y_true")
+            y_pred = _binary_labels(self.y_pred, "y_pred")
+            flat = codes * 4 + y_true * 2 + y_pred
+            self._confusion_cache = np.bincount(
+                flat, minlength=4 * len(groups)
+            ).reshape(len(groups), 2, 2)
+        return self._confusion_cache
+
+    def _rate(self, num: np.ndarray, den: np.ndarray) -> np.ndarray:
+        """
+        Per-group ``num / den``.
+
+        Groups where ``den`` is 0, or smaller than ``min_group_size``, get NaN.
+        """
+        valid = den > 0
+        if self.min_group_size > 1:
+            valid &= self.group_sizes >= self.min_group_size
+        num = np.asarray(num, dtype=np.float64)
+        return np.divide(num, den, out=np.full(len(num), np.nan), where=valid)
+
+    def selection_rates(self) -> np.ndarray:
+        """Share of positive predictions per group."""
+        cm = self.confusion_tensor
+        return self._rate(cm[:, :, 1].sum(axis=1), cm.sum(axis=(1, 2)))
+
+    def true_positive_rates(self) -> np.ndarray:
+        """True positive rate (recall) per group."""
+        cm = self.confusion_tensor
+        return self._rate(cm[:, 1, 1], cm[:, 1, :].sum(axis=1))
+
+    def false_positive_rates(self) -> np.ndarray:
+        """False positive rate per group."""
+        cm = self.confusion_tensor
+        return self._rate(cm[:, 0, 1], cm[:, 0, :].sum(axis=1))
+
+    def positive_predictive_values(self) -> np.ndarray:
+        """Positive predictive value (precision) per group."""
+        cm = self.confusion_tensor
+        return self._rate(cm[:, 1, 1], cm[:, :, 1].sum(axis=1))
+
+    def base_rates(self) -> np.ndarray:
+        """Share of positive true labels per group."""
+        cm = self.confusion_tensor
+        return self._rate(cm[:, 1, :].sum(axis=1), cm.sum(axis=(1, 2)))
+
+    @staticmethod
+    def _gap(rates: np.ndarray) -> float:
+        """Largest difference between the defined (non-NaN) group rates."""
+        rates = rates[~np.isnan(rates)]
+        return float(rates.max() - rates.min()) if rates.size else 0.0
 
     def demographic_parity(self) -> float:
         """
@@ -26,28 +322,424 @@ class FairnessMetrics:
         Returns:
             The demographic parity score.
         """
-        # Compute the probability of positive prediction for each sensitive group
-        groups = np.unique(self.sensitive_attribute)
-        probs = [
-            np.mean(self.y_pred[self.sensitive_attribute == group]) for group in groups
-        ]
-        # Return the maximum difference in probabilities
-        return max(probs) - min(probs)
+        # Maximum difference in the probability of a positive prediction
+        return self._gap(self.selection_rates())
 
     def equal_opportunity(self) -> float:
         """
         Compute the equal opportunity metric.
 
+        Groups without positive samples have no true positive rate and are
+        ignored.
+
         Returns:
             The equal opportunity score.
         """
-        # Compute the true positive rate for each sensitive group
-        groups = np.unique(self.sensitive_attribute)
-        tprs = [
-            np.mean(
-                self.y_pred[(self.sensitive_attribute == group) & (self.y_true == 1)]
+        # Maximum difference in true positive rates
+        return self._gap(self.true_positive_rates())
+
+    def equalized_odds(self) -> float:
+        """
+        Compute the equalized odds metric.
+
+        Returns:
+            The larger of the true positive rate and false positive rate gaps.
+        """
+        return max(
+            self._gap(self.true_positive_rates()),
+            self._gap(self.false_positive_rates()),
+        )
+
+    def predictive_parity(self) -> float:
+        """
+        Compute the predictive parity metric.
+
+        Returns:
+            The maximum difference in positive predictive value across groups.
+        """
+        return self._gap(self.positive_predictive_values())
+
+    def false_positive_rate_parity(self) -> float:
+        """
+        Compute the false positive rate parity metric.
+
+        Returns:
+            The maximum difference in false positive rate across groups.
+        """
+        return self._gap(self.false_positive_rates())
+
+    def disparate_impact(self) -> float:
+        """
+        Compute the disparate impact ratio.
+
+        Returns:
+            The lowest group selection rate divided by the highest, 1.0 when
+            all groups are selected at the same rate (the "four-fifths rule"
+            flags values below 0.8).
+        """
+        rates = self.selection_rates()
+        rates = rates[~np.isnan(rates)]
+        if not rates.size or rates.max() == 0:
+            return 1.0
+        return float(rates.min() / rates.max())
+
+    def calibration_errors(self) -> np.ndarray:
+        """
+        Calibration-in-the-large error per group.
+
+        The absolute difference between the mean predicted probability
+        (``y_scores`` if given, else the predicted labels) and the observed
+        positive rate of each group.
+        """
+        if self.y_scores is None:
+            predicted = self.selection_rates()
+        else:
+            codes, groups = self._group_codes()
+            score_sums = np.bincount(
+                codes,
+                weights=np.asarray(self.y_scores, dtype=np.float64).ravel(),
+                minlength=len(groups),
+            )
+            predicted = self._rate(score_sums, self.group_sizes)
+        return np.abs(predicted - self.base_rates())
+
+    def calibration_by_group(self) -> float:
+        """
+        Compute the calibration-by-group metric.
+
+        Returns:
+            The largest calibration-in-the-large error of any group.
+        """
+        errors = self.calibration_errors()
+        errors = errors[~np.isnan(errors)]
+        return float(errors.max()) if errors.size else 0.0
+
+    def group_report(self) -> pd.DataFrame:
+        """
+        Per-group rates behind every metric, indexed by group.
+
+        Returns:
+            A DataFrame with the size, base rate, selection rate, TPR, FPR,
+            PPV and calibration error of each group.
+        """
+        return pd.DataFrame(
+            {
+                "size": self.group_sizes,
+                "base_rate": self.base_rates(),
+                "selection_rate": self.selection_rates(),
+                "tpr": self.true_positive_rates(),
+                "fpr": self.false_positive_rates(),
+                "ppv": self.positive_predictive_values(),
+                "calibration_error": self.calibration_errors(),
+            },
+            index=pd.Index(self.groups, name="group", tupleize_cols=False),
+        )
+
+    def _valid_tensor(self) -> np.ndarray:
+        """The confusion tensor restricted to groups of at least min_group_size."""
+        cm = self.confusion_tensor
+        if self.min_group_size > 1:
+            cm = cm[self.group_sizes >= self.min_group_size]
+        return cm
+
+    def bootstrap(
+        self,
+        metric: str,
+        n_resamples: int = 1000,
+        confidence: float = 0.95,
+        random_state: int | None = None,
+    ) -> dict[str, float]:
+        """
+        Bootstrap confidence interval for a fairness metric.
+
+        Rows are never resampled. Each group's four confusion cells are
+        redrawn from a multinomial with the group's size and observed cell
+        shares (a bootstrap stratified by group), for all groups and a chunk
+        of replicates in one vectorized call, and the metric is recomputed
+        from each resampled tensor.
+
+        With small groups, a max-min gap (or min/max ratio) of resampled
+        rates is biased away from fairness, so plain percentiles can exclude
+        the observed value. The percentile interval is therefore shifted by
+        the bootstrap estimate of that bias (mean replicate minus observed
+        value) and widened to include the observed value if needed.
+
+        With many tiny groups, nearly every replicate reaches the least fair
+        value (a gap of 1 or a ratio of 0), so even the percentile on the
+        fair side sits there and the interval collapses to a point. A
+        warning is issued in that case; ``min_group_size`` or
+        ``permutation_pvalue`` are the remedies.
+
+        Args:
+            metric: One of the confusion-tensor metrics, e.g.
+                'demographic_parity' or 'equalized_odds'.
+            n_resamples: Number of bootstrap replicates.
+            confidence: Confidence level of the interval.
+            random_state: Seed for the resampling.
+
+        Returns:
+            A dict with the observed ``value`` and the ``lower`` and ``upper``
+            interval bounds.
+        """
+        _resamplable(metric)
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be between 0 and 1")
+        if n_resamples < 1:
+            raise ValueError("n_resamples must be at least 1")
+        rng = np.random.default_rng(random_state)
+        cm = np.rint(self._valid_tensor()).astype(np.int64)
+        sizes = cm.sum(axis=(1, 2))
+        probs = cm.reshape(len(cm), 4) / np.maximum(sizes, 1)[:, None]
+        chunk = max(1, _RESAMPLE_CHUNK_CELLS // max(1, 4 * len(cm)))
+        stats = []
+        for start in range(0, n_resamples, chunk):
+            size = (min(chunk, n_resamples - start), len(cm))
+            resampled = rng.multinomial(sizes, probs, size=size)
+            stats.append(_tensor_statistic(resampled.reshape(*size, 2, 2), metric))
+        stats = np.concatenate(stats)
+        value = float(_tensor_statistic(cm, metric))
+        tail = (1 - confidence) / 2 * 100
+        lower, upper = np.percentile(stats, [tail, 100 - tail])
+        if metric in _HIGHER_IS_FAIRER and upper == 0.0:
+            _warn_saturated(metric, stats, 0.0)
+        elif metric not in _HIGHER_IS_FAIRER and lower == 1.0:
+            _warn_saturated(metric, stats, 1.0)
+        bias = stats.mean() - value
+        lower, upper = lower - bias, upper - bias
+        return {
+            "value": value,
+            "lower": float(np.clip(min(lower, value), 0.0, 1.0)),
+            "upper": float(np.clip(max(upper, value), 0.0, 1.0)),
+        }
+
+    def permutation_pvalue(
+        self,
+        metric: str,
+        n_permutations: int = 1000,
+        random_state: int | None = None,
+    ) -> float:
+        """
+        Permutation p-value for a fairness metric.
+
+        Under the null hypothesis that group membership is unrelated to the
+        outcome, permuting group labels spreads the numerator count of each
+        compared rate (e.g. positive predictions) over the groups as a
+        multivariate hypergeometric draw with the groups' denominators as
+        colors. Those draws are sampled directly, so no rows are shuffled.
+
+        Args:
+            metric: One of the confusion-tensor metrics.
+            n_permutations: Number of permutations.
+            random_state: Seed for the permutations.
+
+        Returns:
+            The share of permutations at least as unfair as the observed data.
+        """
+        _resamplable(metric)
+        if n_permutations < 1:
+            raise ValueError("n_permutations must be at least 1")
+        rng = np.random.default_rng(random_state)
+        cm = np.rint(self._valid_tensor()).astype(np.int64)
+        rate_names, how = _RESAMPLABLE_METRICS[metric]
+        values = []
+        for rate in rate_names:
+            num, den = _rate_counts(cm, rate)
+            drawn = rng.multivariate_hypergeometric(
+                den, int(num.sum()), size=n_permutations
+            )
+            with np.errstate(invalid="ignore", divide="ignore"):
+                rates = np.where(den > 0, drawn / den, np.nan)
+            values.append(_combine_rates(rates, how))
+        stats = np.maximum.reduce(values)
+        observed = _tensor_statistic(cm, metric)
+        if metric in _HIGHER_IS_FAIRER:
+            extreme = np.count_nonzero(stats <= observed + 1e-12)
+        else:
+            extreme = np.count_nonzero(stats >= observed - 1e-12)
+        return float((extreme + 1) / (n_permutations + 1))
+
+
+class FairnessAccumulator:
+    """
+    Streaming per-group confusion counts for continuous fairness monitoring.
+
+    Each ``update`` factorizes the batch's sensitive attribute(s), maps the
+    batch's groups to stable indices and adds one ``np.bincount`` to a
+    (groups × 2 × 2) count tensor, so the cost per row is constant and no
+    predictions are kept. With ``half_life``, counts decay exponentially
+    with time, so metrics describe recent traffic rather than all of it.
+
+    Usage:
+        acc = FairnessAccumulator(half_life=3600)
+        acc.update(y_true, y_pred, gender)  # per scored batch
+        acc.metrics().demographic_parity()
+        acc.export(exporter)  # to a PrometheusExporter
+    """
+
+    def __init__(self, half_life: float | None = None, min_group_size: float = 1):
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            half_life: Optional time, in the units of the update timestamps
+                (seconds by default), after which counts weigh half as much.
+            min_group_size: Groups with a smaller (decayed) count are left out
+                of the metrics.
+        """
+        if half_life is not None and half_life <= 0:
+            raise ValueError("half_life must be positive")
+        self.half_life = half_life
+        self.min_group_size = min_group_size
+        self._index: dict[Any, int] = {}
+        self._groups: list[Any] = []
+        self._counts = np.zeros((0, 2, 2))
+        self._last_update: float | None = None
+
+    @property
+    def groups(self) -> np.ndarray:
+        """Group values seen so far, in order of first appearance."""
+        groups = np.empty(len(self._groups), dtype=object)
+        # Assign one by one so tuple-valued groups are not broadcast.
+        for i, group in enumerate(self._groups):
+            groups[i] = group
+        return groups
+
+    @property
+    def confusion_tensor(self) -> np.ndarray:
+        """The accumulated (possibly decayed) counts, ``(n_groups, 2, 2)``."""
+        return self._counts.copy()
+
+    def _decay(self, timestamp: float) -> None:
+        if self.half_life is not None and self._last_update is not None:
+            elapsed = max(0.0, timestamp - self._last_update)
+            self._counts *= 0.5 ** (elapsed / self.half_life)
+        self._last_update = timestamp
+
+    def update(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        sensitive_attribute: np.ndarray | pd.DataFrame | Sequence[np.ndarray],
+        timestamp: float | None = None,
+    ) -> None:
+        """
+        Add a batch of labelled predictions.
+
+        Args:
+            y_true: True binary (0/1) labels of the batch.
+            y_pred: Predicted binary (0/1) labels of the batch.
+            sensitive_attribute: Sensitive attribute(s) of the batch, in any
+                form accepted by FairnessMetrics.
+            timestamp: Time of the batch; defaults to ``time.time()``.
+        """
+        y_true = _binary_labels(y_true, "y_true")
+        y_pred = _binary_labels(y_pred, "y_pred")
+        self._decay(time.time() if timestamp is None else timestamp)
+        codes, batch_groups = _encode_groups(sensitive_attribute)
+        # Map batch-local codes to accumulator indices; only the batch's
+        # distinct groups are looked up, not every row.
+        mapping = np.empty(len(batch_groups), dtype=np.int64)
+        for i, group in enumerate(map(_group_key, batch_groups.tolist())):
+            index = self._index.get(group)
+            if index is None:
+                index = self._index[group] = len(self._groups)
+                self._groups.append(group)
+            mapping[i] = index
+        n_groups = len(self._groups)
+        if n_groups > len(self._counts):
+            grown = np.zeros((n_groups, 2, 2))
+            grown[: len(self._counts)] = self._counts
+            self._counts = grown
+
+        flat = mapping[codes] * 4 + y_true * 2 + y_pred
+        self._counts += np.bincount(flat, minlength=4 * n_groups).reshape(
+            n_groups, 2, 2
+        )
+
+    def metrics(self) -> FairnessMetrics:
+        """FairnessMetrics over the current counts."""
+        return FairnessMetrics.from_confusion_tensor(
+            self._counts.copy(), self.groups, min_group_size=self.min_group_size
+        )
+
+    def export(
+        self,
+        exporter: Any,
+        metrics: Sequence[str] = tuple(_RESAMPLABLE_METRICS),
+    ) -> dict[str, float]:
+        """
+        Compute metrics and record them with an exporter.
+
+        Args:
+            exporter: An object with a ``record_fairness(values)`` method,
+                such as ``PrometheusExporter``.
+            metrics: Names of the FairnessMetrics methods to export.
+
+        Returns:
+            The exported values.
+        """
+        snapshot = self.metrics()
+        values = {name: getattr(snapshot, name)() for name in metrics}
+        exporter.record_fairness(values)
+        return values
+
+
+def check_fairness(
+    metrics: FairnessMetrics,
+    metric: str,
+    threshold: float,
+    confidence: float | None = None,
+    n_resamples: int = 1000,
+    alpha: float | None = None,
+    random_state: int | None = None,
+) -> None:
+    """
+    Raises an AssertionError if a fairness metric violates its threshold.
+
+    Gap metrics must not exceed ``threshold``; ``disparate_impact`` must not
+    fall below it. With ``confidence``, the threshold is applied to the
+    bootstrap interval bound closest to fairness, so a failure means the
+    metric is unfair with that confidence rather than by noise in small
+    groups. With ``alpha``, a failure additionally requires a permutation
+    p-value below ``alpha``. ``calibration_by_group`` is not a
+    confusion-tensor metric and is always checked on its estimate, ignoring
+    ``confidence`` and ``alpha``.
+
+    Args:
+        metrics: FairnessMetrics for the predictions to check.
+        metric: Metric name, e.g. 'demographic_parity'.
+        threshold: Maximum allowed gap, or minimum allowed disparate impact.
+        confidence: Optional bootstrap confidence level.
+        n_resamples: Bootstrap replicates and permutations.
+        alpha: Optional significance level for the permutation test.
+        random_state: Seed for resampling.
+    """
+    if metric not in _METRIC_LABELS:
+        raise ValueError(f"metric must be one of: {', '.join(_METRIC_LABELS)}")
+    if metric not in _RESAMPLABLE_METRICS:
+        confidence = alpha = None
+    higher_is_fairer = metric in _HIGHER_IS_FAIRER
+    detail = ""
+    if confidence is None:
+        value = bound = getattr(metrics, metric)()
+    else:
+        ci = metrics.bootstrap(metric, n_resamples, confidence, random_state)
+        value = ci["value"]
+        bound = ci["upper"] if higher_is_fairer else ci["lower"]
+        detail = f" ({confidence:.0%} CI {ci['lower']:.4f}-{ci['upper']:.4f})"
+
+    violated = bound < threshold if higher_is_fairer else bound > threshold
+    if violated and alpha is not None:
+        p_value = metrics.permutation_pvalue(metric, n_resamples, random_state)
+        violated = p_value < alpha
+        detail += f" (permutation p-value {p_value:.4f})"
+    if violated:
+        label = _METRIC_LABELS[metric]
+        if higher_is_fairer:
+            raise AssertionError(
+                f"{label} {value:.4f}{detail} is below the minimum threshold "
+                f"{threshold:.4f}"
             )
-            for group in groups
-        ]
-        # Return the maximum difference in true positive rates
-        return max(tprs) - min(tprs)
+        raise AssertionError(
+            f"{label} {value:.4f}{detail} exceeds threshold {threshold:.4f}"
+        )
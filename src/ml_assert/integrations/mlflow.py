@@ -1,23 +1,39 @@
 """MLflow integration for ml-assert."""
 
 import contextlib
+import time
 from typing import Any
 
 import mlflow
 import pandas as pd
+from mlflow.entities import Metric, Param, RunTag
 from mlflow.tracking import MlflowClient
 
 from ml_assert.core.base import Assertion, AssertionResult
 
+# Per-request limits of MlflowClient.log_batch.
+_MAX_BATCH_ENTITIES = 1000
+_MAX_BATCH_PARAMS = 100
+_MAX_BATCH_TAGS = 100
+
 
 class MLflowLogger:
-    """Logs assertion results to MLflow."""
+    """Logs assertion results to MLflow.
+
+    Metrics, params and tags are buffered and sent with
+    ``MlflowClient.log_batch`` instead of one request per value. The buffer
+    is flushed when it holds ``max_buffer_size`` entries, on the first log
+    call ``flush_interval`` seconds after the last flush, on :meth:`flush`
+    and on :meth:`end_run`, in chunks within MLflow's batch limits.
+    """
 
     def __init__(
         self,
         experiment_name: str,
         run_name: str | None = None,
         tracking_uri: str | None = None,
+        max_buffer_size: int = 1000,
+        flush_interval: float | None = 10.0,
     ):
         """Initialize MLflow logger.
 
@@ -25,15 +41,27 @@ class MLflowLogger:
             experiment_name: Name of the MLflow experiment
             run_name: Optional name for this run
             tracking_uri: Optional MLflow tracking server URI
+            max_buffer_size: Number of buffered metrics, params and tags
+                that triggers a flush
+            flush_interval: Seconds after which the next log call flushes
+                the buffer; None flushes on size, flush() and end_run() only
         """
         if tracking_uri:
             mlflow.set_tracking_uri(tracking_uri)
+        if max_buffer_size < 1:
+            raise ValueError("max_buffer_size must be a positive integer")
 
         self.client = MlflowClient()
         self.experiment_name = experiment_name
         self.run_name = run_name
+        self.max_buffer_size = max_buffer_size
+        self.flush_interval = flush_interval
         self._run_id = None
         self._active_run = None
+        self._metrics: list[Metric] = []
+        self._params: dict[str, Param] = {}
+        self._tags: dict[str, RunTag] = {}
+        self._last_flush = time.monotonic()
 
     @contextlib.contextmanager
     def run(self):
@@ -62,11 +90,71 @@ class MLflowLogger:
         self._run_id = self._active_run.info.run_id
 
     def end_run(self, status: str = "FINISHED") -> None:
-        """End the current MLflow run with a given status."""
+        """Flush buffered values and end the current MLflow run with a given status."""
         if self._active_run is not None:
-            mlflow.end_run(status=status)
-            self._active_run = None
-            self._run_id = None
+            try:
+                self.flush()
+            finally:
+                mlflow.end_run(status=status)
+                self._active_run = None
+                self._run_id = None
+
+    def _buffered(self) -> int:
+        return len(self._metrics) + len(self._params) + len(self._tags)
+
+    def flush(self) -> None:
+        """Send all buffered metrics, params and tags to the tracking server."""
+        metrics = self._metrics
+        params = list(self._params.values())
+        tags = list(self._tags.values())
+        self._metrics, self._params, self._tags = [], {}, {}
+        self._last_flush = time.monotonic()
+        while metrics or params or tags:
+            batch_params, params = (
+                params[:_MAX_BATCH_PARAMS],
+                params[_MAX_BATCH_PARAMS:],
+            )
+            batch_tags, tags = tags[:_MAX_BATCH_TAGS], tags[_MAX_BATCH_TAGS:]
+            n_metrics = _MAX_BATCH_ENTITIES - len(batch_params) - len(batch_tags)
+            batch_metrics, metrics = metrics[:n_metrics], metrics[n_metrics:]
+            self.client.log_batch(
+                self._run_id,
+                metrics=batch_metrics,
+                params=batch_params,
+                tags=batch_tags,
+            )
+
+    def _maybe_flush(self) -> None:
+        """Flush once the buffer is full or the flush interval has passed."""
+        if self._buffered() >= self.max_buffer_size or (
+            self.flush_interval is not None
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def _log_metric(self, key: str, value: float) -> None:
+        self._metrics.append(Metric(key, float(value), int(time.time() * 1000), 0))
+
+    def _log_param(self, key: str, value: Any) -> None:
+        value = str(value)
+        buffered = self._params.get(key)
+        if buffered is not None and buffered.value != value:
+            # Send the earlier value first, so MLflow rejects the change just
+            # as it would without buffering.
+            self.flush()
+        self._params[key] = Param(key, value)
+
+    def set_tag(self, key: str, value: Any) -> None:
+        """Buffer a tag on the current run.
+
+        Args:
+            key: Tag name
+            value: Tag value, converted to a string
+        """
+        if not self._run_id:
+            raise RuntimeError("No active MLflow run. Call start_run() first.")
+        self._tags[key] = RunTag(key, str(value))
+        self._maybe_flush()
 
     def log_assertion_result(
         self,
@@ -87,8 +175,7 @@ class MLflowLogger:
             raise RuntimeError("No active MLflow run. Call start_run() first.")
 
         # Log assertion result
-        self.client.log_metric(
-            self._run_id,
+        self._log_metric(
             f"assertion_{assertion.__class__.__name__}_passed",
             1.0 if result else 0.0,
         )
@@ -96,12 +183,13 @@ class MLflowLogger:
         # Log additional metrics if provided
         if metrics:
             for name, value in metrics.items():
-                self.client.log_metric(self._run_id, name, value)
+                self._log_metric(name, value)
 
         # Log parameters if provided
         if params:
             for name, value in params.items():
-                self.client.log_param(self._run_id, name, str(value))
+                self._log_param(name, str(value))
+        self._maybe_flush()
 
     def log_dataframe_assertion(
         self,
@@ -122,14 +210,11 @@ class MLflowLogger:
             raise RuntimeError("No active MLflow run. Call start_run() first.")
 
         # Log basic DataFrame info
-        self.client.log_param(self._run_id, f"{assertion_name}_rows", len(df))
-        self.client.log_param(
-            self._run_id, f"{assertion_name}_columns", len(df.columns)
-        )
+        self._log_param(f"{assertion_name}_rows", len(df))
+        self._log_param(f"{assertion_name}_columns", len(df.columns))
 
         # Log assertion result
-        self.client.log_metric(
-            self._run_id,
+        self._log_metric(
             f"{assertion_name}_passed",
             1.0 if result else 0.0,
         )
@@ -137,7 +222,8 @@ class MLflowLogger:
         # Log additional metrics if provided
         if metrics:
             for name, value in metrics.items():
-                self.client.log_metric(self._run_id, name, value)
+                self._log_metric(name, value)
+        self._maybe_flush()
 
     def log_model_assertion(
         self,
@@ -158,12 +244,11 @@ class MLflowLogger:
             raise RuntimeError("No active MLflow run. Call start_run() first.")
 
         # Log model info
-        self.client.log_param(self._run_id, "model_name", model_name)
-        self.client.log_param(self._run_id, "assertion_name", assertion_name)
+        self._log_param("model_name", model_name)
+        self._log_param("assertion_name", assertion_name)
 
         # Log assertion result
-        self.client.log_metric(
-            self._run_id,
+        self._log_metric(
             f"{assertion_name}_passed",
             1.0 if result else 0.0,
         )
@@ -171,7 +256,8 @@ class MLflowLogger:
         # Log additional metrics if provided
         if metrics:
             for name, value in metrics.items():
-                self.client.log_metric(self._run_id, name, value)
+                self._log_metric(name, value)
+        self._maybe_flush()
 
     def log_assertion_result_mlassert(
         self, result: AssertionResult, step_name: str | None = None
@@ -186,21 +272,16 @@ class MLflowLogger:
         if not self._run_id:
             raise RuntimeError("No active MLflow run. Call start_run() first.")
         # Log main result
-        self.client.log_metric(
-            self._run_id,
+        self._log_metric(
             f"{step_name or 'assertion'}_passed",
             1.0 if result.success else 0.0,
         )
-        self.client.log_param(
-            self._run_id, f"{step_name or 'assertion'}_message", result.message
-        )
-        self.client.log_param(
-            self._run_id,
+        self._log_param(f"{step_name or 'assertion'}_message", result.message)
+        self._log_param(
             f"{step_name or 'assertion'}_timestamp",
             result.timestamp.isoformat(),
         )
         # Log metadata as params
         for k, v in (result.metadata or {}).items():
-            self.client.log_param(
-                self._run_id, f"{step_name or 'assertion'}_{k}", str(v)
-            )
+            self._log_param(f"{step_name or 'assertion'}_{k}", str(v))
+        self._maybe_flush()
@@ -26,6 +26,12 @@ class PrometheusExporter:
             "Number of passed assertions",
             registry=self.registry,
         )
+        self.fairness_gauge = Gauge(
+            "ml_assert_fairness_metric",
+            "Latest value of each fairness metric",
+            ["metric"],
+            registry=self.registry,
+        )
         self.started = False
 
     def start(self) -> None:
@@ -48,3 +54,13 @@ class PrometheusExporter:
         else:
             self.assertion_gauge.dec()
         # Optionally, record metadata as labels if needed (not implemented here)
+
+    def record_fairness(self, values: dict[str, float]) -> None:
+        """
+        Record fairness metric values as Prometheus gauges.
+
+        Args:
+            values: Mapping from metric name to its current value.
+        """
+        for name, value in values.items():
+            self.fairness_gauge.labels(metric=name).set(value)
@@ -1,10 +1,52 @@
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from itertools import islice
+from pathlib import Path
 from typing import Any
 
+import joblib
 import numpy as np
-from sklearn.base import BaseEstimator
-from sklearn.model_selection import KFold, LeaveOneOut, StratifiedKFold, cross_val_score
+import pandas as pd
+import scipy.sparse as sp
+from joblib import Parallel, delayed
+from sklearn.base import BaseEstimator, clone, is_classifier
+from sklearn.metrics import (
+    accuracy_score,
+    f1_score,
+    precision_score,
+    recall_score,
+    roc_auc_score,
+)
+from sklearn.model_selection import (
+    BaseCrossValidator,
+    GroupKFold,
+    KFold,
+    LeaveOneOut,
+    RepeatedKFold,
+    RepeatedStratifiedKFold,
+    StratifiedKFold,
+    TimeSeriesSplit,
+)
+from sklearn.utils import _safe_indexing
+from sklearn.utils.validation import _num_samples
+from threadpoolctl import threadpool_limits
+
+# Metric name -> (function, whether it needs continuous scores rather than labels)
+_CV_METRICS: dict[str, tuple[Callable[[np.ndarray, np.ndarray], float], bool]] = {
+    "accuracy": (accuracy_score, False),
+    "precision": (precision_score, False),
+    "recall": (recall_score, False),
+    "f1": (f1_score, False),
+    "roc_auc": (roc_auc_score, True),
+}
+# Every built-in metric lies in [0, 1], which bounds the mean of unseen folds.
+_SCORE_RANGE = (0.0, 1.0)
+
+# Inputs are indexed per fold with sklearn's _safe_indexing and passed to the
+# estimator as-is, so DataFrames (including Arrow-backed ones) and sparse
+# matrices are never densified or converted.
+MatrixLike = np.ndarray | pd.DataFrame | sp.spmatrix | sp.sparray
+VectorLike = np.ndarray | pd.Series
 
 
 class CrossValidationError(Exception):
@@ -13,26 +55,97 @@ class CrossValidationError(Exception):
     pass
 
 
+_CV_TYPES = (
+    "kfold",
+    "stratified",
+    "loo",
+    "repeated_kfold",
+    "repeated_stratified",
+    "group_kfold",
+    "timeseries",
+    "loo_subsample",
+)
+
+
+class SubsampledLeaveOneOut(BaseCrossValidator):
+    """
+    Leave-one-out over a random subset of samples.
+
+    Each of ``n_samples`` randomly chosen samples is held out once while the
+    model is trained on all the others, giving an unbiased estimate of the
+    leave-one-out score at a fraction of the n fits of full LOO.
+    """
+
+    def __init__(self, n_samples: int = 100, random_state: int | None = 42):
+        """
+        Args:
+            n_samples: Number of samples to hold out, one per fold.
+            random_state: Seed for choosing the held-out samples.
+        """
+        self.n_samples = n_samples
+        self.random_state = random_state
+
+    def _iter_test_indices(self, X, y=None, groups=None):
+        n = _num_samples(X)
+        rng = np.random.default_rng(self.random_state)
+        yield from rng.choice(n, size=min(self.n_samples, n), replace=False)
+
+    def get_n_splits(self, X=None, y=None, groups=None) -> int:
+        """Number of folds, which requires X to know the sample count."""
+        if X is None:
+            raise ValueError("The 'X' parameter should not be None.")
+        return min(self.n_samples, _num_samples(X))
+
+
+def _is_splitter(cv_type: Any) -> bool:
+    return hasattr(cv_type, "split") and hasattr(cv_type, "get_n_splits")
+
+
+def _row_indexable(X: MatrixLike) -> MatrixLike:
+    """
+    X with sparse input converted to CSR once, as sklearn's ``indexable`` does.
+
+    ``_safe_indexing`` cannot select rows of COO, DIA or BSR matrices, and
+    CSR rows are the cheapest to slice; CSR input is returned as-is.
+    """
+    if sp.issparse(X) and X.format != "csr":
+        return X.tocsr()
+    return X
+
+
 def _validate_inputs(
     model: BaseEstimator,
-    X: np.ndarray,
-    y: np.ndarray,
-    cv_type: str,
+    X: MatrixLike,
+    y: VectorLike,
+    cv_type: str | BaseCrossValidator,
     n_splits: int,
+    groups: np.ndarray | None = None,
+    n_repeats: int = 3,
 ) -> None:
     """Validate input parameters for cross-validation."""
     if not isinstance(model, BaseEstimator):
         raise CrossValidationError("Model must be a scikit-learn estimator")
 
-    if not isinstance(X, np.ndarray) or not isinstance(y, np.ndarray):
-        raise CrossValidationError("X and y must be numpy arrays")
+    if not (isinstance(X, np.ndarray | pd.DataFrame) or sp.issparse(X)):
+        raise CrossValidationError(
+            "X must be a numpy array, a pandas DataFrame or a scipy sparse matrix"
+        )
+
+    if not isinstance(y, np.ndarray | pd.Series):
+        raise CrossValidationError("y must be a numpy array or a pandas Series")
 
-    if X.shape[0] != y.shape[0]:
+    if _num_samples(X) != _num_samples(y):
         raise CrossValidationError("X and y must have the same number of samples")
 
-    if cv_type not in ["kfold", "stratified", "loo"]:
+    if groups is not None and len(groups) != _num_samples(X):
+        raise CrossValidationError("groups must have one entry per sample")
+
+    if _is_splitter(cv_type):
+        return
+
+    if cv_type not in _CV_TYPES:
         raise CrossValidationError(
-            "cv_type must be one of: 'kfold', 'stratified', 'loo'"
+            f"cv_type must be a splitter or one of: {', '.join(map(repr, _CV_TYPES))}"
         )
 
     if cv_type != "loo" and n_splits < 2:
@@ -40,188 +153,970 @@ def _validate_inputs(
             "n_splits must be at least 2 for k-fold cross-validation"
         )
 
+    if cv_type.startswith("repeated") and n_repeats < 1:
+        raise CrossValidationError("n_repeats must be at least 1")
+
+    if cv_type == "group_kfold" and groups is None:
+        raise CrossValidationError("groups must be provided for group k-fold")
+
 
 def _get_cv_splitter(
-    cv_type: str, n_splits: int
-) -> KFold | StratifiedKFold | LeaveOneOut:
-    """Get the appropriate cross-validation splitter."""
+    cv_type: str | BaseCrossValidator, n_splits: int, n_repeats: int = 3
+) -> BaseCrossValidator:
+    """
+    Get the appropriate cross-validation splitter.
+
+    Splitter objects are returned unchanged. For ``loo_subsample``,
+    ``n_splits`` is the number of held-out samples.
+    """
+    if _is_splitter(cv_type):
+        return cv_type
     if cv_type == "kfold":
         return KFold(n_splits=n_splits, shuffle=True, random_state=42)
     elif cv_type == "stratified":
         return StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=42)
+    elif cv_type == "repeated_kfold":
+        return RepeatedKFold(n_splits=n_splits, n_repeats=n_repeats, random_state=42)
+    elif cv_type == "repeated_stratified":
+        return RepeatedStratifiedKFold(
+            n_splits=n_splits, n_repeats=n_repeats, random_state=42
+        )
+    elif cv_type == "group_kfold":
+        return GroupKFold(n_splits=n_splits)
+    elif cv_type == "timeseries":
+        # Ordered, expanding-window splits: never train on the future.
+        return TimeSeriesSplit(n_splits=n_splits)
+    elif cv_type == "loo_subsample":
+        return SubsampledLeaveOneOut(n_samples=n_splits)
     else:  # loo
         return LeaveOneOut()
 
 
+def _positive_scores(estimator: BaseEstimator, X: MatrixLike) -> np.ndarray:
+    """Continuous scores for the positive class, as sklearn's roc_auc scorer uses."""
+    if hasattr(estimator, "predict_proba"):
+        proba = estimator.predict_proba(X)
+        return proba[:, 1] if proba.ndim == 2 and proba.shape[1] == 2 else proba
+    return estimator.decision_function(X)
+
+
+def _resolve_n_jobs(n_jobs: int | None, n_tasks: int) -> int:
+    """
+    Number of workers to start for ``n_tasks`` folds.
+
+    ``None`` uses every CPU available to the process; ``joblib.cpu_count``
+    honors cgroup CPU quotas and CPU affinity, so containers are not
+    oversubscribed. Negative values count back from that total as in joblib.
+    """
+    if n_jobs == 0:
+        raise CrossValidationError("n_jobs must be a non-zero integer or None")
+    n_cpus = joblib.cpu_count()
+    if n_jobs is None:
+        n_jobs = n_cpus
+    elif n_jobs < 0:
+        n_jobs = n_cpus + 1 + n_jobs
+    return max(1, min(n_jobs, n_tasks))
+
+
+def _fit_and_predict_fold(
+    model: BaseEstimator,
+    X: MatrixLike,
+    y: VectorLike,
+    train: np.ndarray,
+    test: np.ndarray,
+    need_scores: bool,
+    estimator_path: Path | None = None,
+    max_threads: int | None = None,
+    keep_estimator: bool = True,
+) -> dict[str, Any]:
+    """
+    Fit a fresh clone on one training fold and predict its test fold once.
+
+    If ``estimator_path`` is given the fitted estimator is written there with
+    joblib instead of being returned, so it never travels back from a worker.
+    Otherwise it is returned only with ``keep_estimator``; folds scored from
+    their predictions alone drop it so fitted models are not retained.
+    ``max_threads`` caps the BLAS/OpenMP thread pools used inside the fold.
+    """
+    with threadpool_limits(limits=max_threads):
+        estimator = clone(model).fit(_safe_indexing(X, train), _safe_indexing(y, train))
+        X_test = _safe_indexing(X, test)
+        fold = {
+            "test": test,
+            "estimator": estimator,
+            "estimator_path": estimator_path,
+            "y_pred": estimator.predict(X_test),
+            "y_score": None,
+            "score_error": None,
+            "scored": need_scores,
+        }
+        if need_scores:
+            _add_fold_scores(fold, estimator, X_test)
+    if estimator_path is not None:
+        joblib.dump(estimator, estimator_path)
+        fold["estimator"] = None
+    elif not keep_estimator:
+        fold["estimator"] = None
+    return fold
+
+
+def _add_fold_scores(
+    fold: dict[str, Any], estimator: BaseEstimator, X_test: MatrixLike
+) -> None:
+    # Keep the fold usable for label-based metrics if scoring is unsupported.
+    try:
+        fold["y_score"] = _positive_scores(estimator, X_test)
+    except Exception as e:
+        fold["score_error"] = e
+    fold["scored"] = True
+
+
+def _fold_estimator(fold: dict[str, Any]) -> BaseEstimator:
+    """The fold's fitted estimator, loaded from disk if it was cached there."""
+    if fold["estimator"] is not None:
+        return fold["estimator"]
+    return joblib.load(fold["estimator_path"], mmap_mode="r")
+
+
+class CVSession:
+    """
+    Cache of cross-validation work shared across CV assertions.
+
+    Entries are keyed by a fingerprint of the (unfitted) model, the data and
+    the splitter. Each entry keeps the fold indices, the fitted estimator of
+    every fold that has been run (in memory, or on disk via joblib when
+    ``cache_dir`` is set) and the out-of-fold predictions and scores, so a
+    second assertion on the same setup only computes metrics.
+
+    Usage:
+        session = CVSession()
+        assert_cv_f1_score(model, X, y, 0.8, session=session)
+        assert_cv_roc_auc_score(model, X, y, 0.9, session=session)  # no refits
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None):
+        """
+        Initialize an empty session.
+
+        Args:
+            cache_dir: Optional directory for persisting fitted fold estimators.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.n_fits = 0
+        self._entries: dict[str, dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached entry and any estimators persisted for them."""
+        if self.cache_dir is not None:
+            for entry in self._entries.values():
+                for fold in entry["folds"].values():
+                    if fold["estimator_path"] is not None:
+                        fold["estimator_path"].unlink(missing_ok=True)
+        self._entries.clear()
+
+    @staticmethod
+    def fingerprint(
+        model: BaseEstimator, X: Any, y: Any, cv: Any, groups: Any = None
+    ) -> str:
+        """Hash identifying a (model, data, splitter) combination."""
+        return joblib.hash((clone(model), X, y, repr(cv), groups))
+
+    def _entry(
+        self,
+        model: BaseEstimator,
+        X: Any,
+        y: Any,
+        cv: Any,
+        groups: Any,
+        splits: Iterable,
+    ) -> dict[str, Any]:
+        key = self.fingerprint(model, X, y, cv, groups)
+        if key not in self._entries:
+            self._entries[key] = {"key": key, "splits": list(splits), "folds": {}}
+        return self._entries[key]
+
+    def _estimator_path(self, entry: dict[str, Any], fold_index: int) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{entry['key']}_fold{fold_index}.joblib"
+
+
+def _score_fold(
+    fold: dict[str, Any],
+    X: MatrixLike,
+    y: VectorLike,
+    scoring: str | Callable,
+) -> float:
+    """Score one fold from its cached predictions (or the fitted estimator for callables)."""
+    cached = fold.setdefault("scores", {})
+    if scoring in cached:
+        return cached[scoring]
+    y_test = _safe_indexing(y, fold["test"])
+    if callable(scoring):
+        score = scoring(_fold_estimator(fold), _safe_indexing(X, fold["test"]), y_test)
+    else:
+        metric_fn, needs_scores = _CV_METRICS[scoring]
+        if needs_scores:
+            if fold["score_error"] is not None:
+                raise fold["score_error"]
+            score = metric_fn(y_test, fold["y_score"])
+        else:
+            score = metric_fn(y_test, fold["y_pred"])
+    cached[scoring] = score
+    return score
+
+
+def _summarize_scores(scores: np.ndarray, n_folds: int) -> dict[str, Any]:
+    return {
+        "scores": scores,
+        "mean_score": np.mean(scores),
+        "std_score": np.std(scores),
+        "min_score": np.min(scores),
+        "max_score": np.max(scores),
+        "n_folds_run": len(scores),
+        "n_folds": n_folds,
+    }
+
+
+def _mean_bounds(scores: list[float], n_folds: int) -> tuple[float, float]:
+    """Lowest and highest achievable mean given the folds run so far."""
+    remaining = n_folds - len(scores)
+    total = float(np.sum(scores))
+    return (
+        (total + remaining * _SCORE_RANGE[0]) / n_folds,
+        (total + remaining * _SCORE_RANGE[1]) / n_folds,
+    )
+
+
+def _outcome_decided(
+    folds: list[dict[str, Any]],
+    X: MatrixLike,
+    y: VectorLike,
+    min_scores: dict[str, float],
+    n_folds: int,
+) -> bool:
+    """
+    True once the remaining folds can no longer change the assertion outcome.
+
+    That is the case as soon as one metric cannot reach its threshold even if
+    every remaining fold scores perfectly, or once every metric is guaranteed
+    to pass even if every remaining fold scores zero.
+    """
+    all_pass = True
+    for metric, min_score in min_scores.items():
+        scores = [_score_fold(fold, X, y, metric) for fold in folds]
+        lowest, highest = _mean_bounds(scores, n_folds)
+        if highest < min_score:
+            return True
+        all_pass = all_pass and lowest >= min_score
+    return all_pass
+
+
+def _compute_cv_folds(
+    model: BaseEstimator,
+    X: MatrixLike,
+    y: VectorLike,
+    cv_type: str,
+    n_splits: int,
+    need_scores: bool,
+    stop: Callable[[list[dict[str, Any]], int], bool] | None = None,
+    wave_size: int = 1,
+    session: CVSession | None = None,
+    n_jobs: int | None = None,
+    backend: str | None = None,
+    pre_dispatch: str | int = "2*n_jobs",
+    max_threads: int | None = None,
+    groups: np.ndarray | None = None,
+    n_repeats: int = 3,
+    max_nbytes: int | str | None = "1M",
+    keep_estimators: bool = False,
+) -> tuple[list[dict[str, Any]], int]:
+    """
+    Fit and predict folds, each exactly once.
+
+    Without ``stop`` all folds run in one parallel batch. With ``stop``, folds
+    run in waves of ``wave_size`` and ``stop(folds, n_folds)`` is consulted
+    after each wave to end the run early. Folds already cached in ``session``
+    are reused rather than refitted.
+
+    Folds run on ``n_jobs`` joblib workers (see ``_resolve_n_jobs``) using
+    ``backend`` and ``pre_dispatch``. Each worker caps its BLAS/OpenMP
+    threads at ``max_threads``, by default an even share of the available
+    CPUs, so nested multithreading does not oversubscribe them. The limits
+    are process-global: under the threading backend every worker shares the
+    last cap set, and the caller's pools are limited while folds run. With
+    process-based backends, arrays larger than ``max_nbytes`` are dumped to
+    a read-only memory map once per run and shared by every worker instead
+    of being pickled to each of them.
+
+    Fitted estimators are kept in the fold results only with
+    ``keep_estimators`` (callable scorers need them) or a ``session``, which
+    may score its cached folds again later.
+
+    Returns:
+        The fold results that were computed and the total number of folds.
+    """
+    _validate_inputs(model, X, y, cv_type, n_splits, groups, n_repeats)
+    X = _row_indexable(X)
+
+    cv = _get_cv_splitter(cv_type, n_splits, n_repeats)
+    n_folds = cv.get_n_splits(X, y, groups)
+    n_workers = _resolve_n_jobs(n_jobs, n_folds if stop is None else wave_size)
+    if max_threads is None:
+        max_threads = max(1, joblib.cpu_count() // n_workers)
+    entry = None
+    if session is not None:
+        entry = session._entry(model, X, y, cv, groups, cv.split(X, y, groups))
+        splits = enumerate(entry["splits"])
+    else:
+        splits = enumerate(cv.split(X, y, groups))
+    cached = entry["folds"] if entry is not None else {}
+
+    def run_wave(parallel: Parallel, wave: list) -> list[dict[str, Any]]:
+        todo = [(i, train, test) for i, (train, test) in wave if i not in cached]
+        fitted = parallel(
+            delayed(_fit_and_predict_fold)(
+                model,
+                X,
+                y,
+                train,
+                test,
+                need_scores,
+                session._estimator_path(entry, i) if session is not None else None,
+                max_threads,
+                keep_estimators or session is not None,
+            )
+            for i, train, test in todo
+        )
+        new = dict(zip((i for i, _, _ in todo), fitted, strict=True))
+        if session is not None:
+            session.n_fits += len(new)
+            cached.update(new)
+        folds = [cached[i] if i in cached else new[i] for i, _ in wave]
+        if need_scores:
+            for fold in folds:
+                if not fold["scored"]:
+                    X_test = _safe_indexing(X, fold["test"])
+                    _add_fold_scores(fold, _fold_estimator(fold), X_test)
+        return folds
+
+    try:
+        with Parallel(
+            n_jobs=n_workers,
+            backend=backend,
+            pre_dispatch=pre_dispatch,
+            max_nbytes=max_nbytes,
+            mmap_mode="r",
+        ) as parallel:
+            if stop is None:
+                return run_wave(parallel, list(splits)), n_folds
+            folds = []
+            while wave := list(islice(splits, wave_size)):
+                folds.extend(run_wave(parallel, wave))
+                if stop(folds, n_folds):
+                    break
+            return folds, n_folds
+    except Exception as e:
+        raise CrossValidationError(f"Error during cross-validation: {str(e)}") from e
+
+
+def _compute_cv_metrics(
+    model: BaseEstimator,
+    X: MatrixLike,
+    y: VectorLike,
+    cv_type: str,
+    n_splits: int,
+    metrics: Iterable[str | Callable],
+    early_stop_thresholds: dict[str, float] | None = None,
+    wave_size: int = 1,
+    **fold_options: Any,
+) -> dict[str | Callable, dict[str, Any] | Exception]:
+    """
+    Compute several cross-validation metrics from a single fit per fold.
+
+    Each fold is fitted and predicted once; every requested metric is then
+    derived from the fold's predictions. A metric that cannot be computed
+    maps to the exception it raised instead of aborting the others.
+
+    If ``early_stop_thresholds`` is given, folds are evaluated sequentially
+    (in waves of ``wave_size``) and evaluation stops as soon as the outcome
+    of asserting those minimum mean scores is decided. ``fold_options``
+    (``session``, parallelism and splitter options) are passed to
+    ``_compute_cv_folds``.
+    """
+    X = _row_indexable(X)
+    metrics = list(metrics)
+    for metric in metrics:
+        if not callable(metric) and metric not in _CV_METRICS:
+            raise CrossValidationError(
+                f"Unknown metric '{metric}'. Available: {', '.join(_CV_METRICS)}"
+            )
+    if wave_size < 1:
+        raise CrossValidationError("wave_size must be at least 1")
+    need_scores = any(not callable(m) and _CV_METRICS[m][1] for m in metrics)
+    stop = None
+    if early_stop_thresholds:
+        if any(callable(m) for m in early_stop_thresholds):
+            raise CrossValidationError(
+                "Early stopping requires named metrics with known score bounds"
+            )
+
+        def stop(folds: list[dict[str, Any]], n_folds: int) -> bool:
+            return _outcome_decided(folds, X, y, early_stop_thresholds, n_folds)
+
+    folds, n_folds = _compute_cv_folds(
+        model,
+        X,
+        y,
+        cv_type,
+        n_splits,
+        need_scores,
+        stop=stop,
+        wave_size=wave_size,
+        keep_estimators=any(callable(m) for m in metrics),
+        **fold_options,
+    )
+
+    results: dict[str | Callable, dict[str, Any] | Exception] = {}
+    for metric in metrics:
+        try:
+            scores = np.array([_score_fold(fold, X, y, metric) for fold in folds])
+            results[metric] = _summarize_scores(scores, n_folds)
+        except Exception as e:
+            results[metric] = CrossValidationError(
+                f"Error during cross-validation: {str(e)}"
+            )
+    return results
+
+
 def _compute_cv_scores(
     model: BaseEstimator,
-    X: np.ndarray,
-    y: np.ndarray,
+    X: MatrixLike,
+    y: VectorLike,
     cv_type: str,
     n_splits: int,
     scoring: str | Callable,
+    min_score: float | None = None,
+    early_stop: bool = False,
+    **options: Any,
 ) -> dict[str, Any]:
     """Compute cross-validation scores for a given metric."""
-    _validate_inputs(model, X, y, cv_type, n_splits)
+    early_stop_thresholds = {scoring: min_score} if early_stop else None
+    result = _compute_cv_metrics(
+        model,
+        X,
+        y,
+        cv_type,
+        n_splits,
+        [scoring],
+        early_stop_thresholds=early_stop_thresholds,
+        **options,
+    )[scoring]
+    if isinstance(result, Exception):
+        raise result
+    return result
 
-    cv = _get_cv_splitter(cv_type, n_splits)
 
-    try:
-        scores = cross_val_score(
-            estimator=model,
-            X=X,
-            y=y,
-            cv=cv,
-            scoring=scoring,
-            n_jobs=-1,  # Use all available CPU cores
+def _format_cv_failure(label: str, cv_results: dict[str, Any], min_score: float) -> str:
+    message = (
+        f"{label} {cv_results['mean_score']:.4f} (±{cv_results['std_score']:.4f}) "
+        f"is below the minimum threshold {min_score:.4f}"
+    )
+    if cv_results["n_folds_run"] < cv_results["n_folds"]:
+        _, highest = _mean_bounds(list(cv_results["scores"]), cv_results["n_folds"])
+        message += (
+            f" (stopped early after {cv_results['n_folds_run']} of "
+            f"{cv_results['n_folds']} folds; best achievable mean {highest:.4f})"
         )
+    return message
 
-        return {
-            "scores": scores,
-            "mean_score": np.mean(scores),
-            "std_score": np.std(scores),
-            "min_score": np.min(scores),
-            "max_score": np.max(scores),
-        }
-    except Exception as e:
-        raise CrossValidationError(f"Error during cross-validation: {str(e)}") from e
 
+def _cv_outcome(cv_results: dict[str, Any], min_score: float) -> bool | None:
+    """
+    Whether the mean score reaches min_score.
 
-def assert_cv_accuracy_score(
+    For early-stopped runs this is True or False only if the unseen folds
+    cannot change the outcome, and None if it is still undecided.
+    """
+    if cv_results["n_folds_run"] == cv_results["n_folds"]:
+        return bool(cv_results["mean_score"] >= min_score)
+    lowest, highest = _mean_bounds(list(cv_results["scores"]), cv_results["n_folds"])
+    if lowest >= min_score:
+        return True
+    if highest < min_score:
+        return False
+    return None
+
+
+def _assert_cv_metric(
+    label: str,
+    scoring: str,
     model: BaseEstimator,
-    X: np.ndarray,
-    y: np.ndarray,
+    X: MatrixLike,
+    y: VectorLike,
     min_score: float,
-    cv_type: str = "kfold",
-    n_splits: int = 5,
-) -> None:
-    """Assert that the mean accuracy score across cross-validation folds is above a minimum value."""
+    **options: Any,
+) -> dict[str, Any]:
     cv_results = _compute_cv_scores(
-        model=model, X=X, y=y, cv_type=cv_type, n_splits=n_splits, scoring="accuracy"
+        model=model, X=X, y=y, scoring=scoring, min_score=min_score, **options
     )
+    if not _cv_outcome(cv_results, min_score):
+        raise AssertionError(_format_cv_failure(label, cv_results, min_score))
+    return cv_results
 
-    if cv_results["mean_score"] < min_score:
-        raise AssertionError(
-            f"Mean accuracy score {cv_results['mean_score']:.4f} (±{cv_results['std_score']:.4f}) "
-            f"is below the minimum threshold {min_score:.4f}"
-        )
+
+def assert_cv_accuracy_score(
+    model: BaseEstimator,
+    X: MatrixLike,
+    y: VectorLike,
+    min_score: float,
+    cv_type: str | BaseCrossValidator = "kfold",
+    n_splits: int = 5,
+    **options: Any,
+) -> dict[str, Any]:
+    """
+    Assert that the mean accuracy score across cross-validation folds is above a minimum value.
+
+    Keyword ``options`` (``early_stop``, ``wave_size``, ``session`` and the
+    splitter and parallelism options) are those of ``assert_cv_scores``.
+    With ``early_stop=True`` the returned results report ``n_folds_run`` out
+    of ``n_folds``.
+    """
+    return _assert_cv_metric(
+        "Mean accuracy score",
+        "accuracy",
+        model,
+        X,
+        y,
+        min_score,
+        cv_type=cv_type,
+        n_splits=n_splits,
+        **options,
+    )
 
 
 def assert_cv_precision_score(
     model: BaseEstimator,
-    X: np.ndarray,
-    y: np.ndarray,
+    X: MatrixLike,
+    y: VectorLike,
     min_score: float,
-    cv_type: str = "kfold",
+    cv_type: str | BaseCrossValidator = "kfold",
     n_splits: int = 5,
-) -> None:
-    """Assert that the mean precision score across cross-validation folds is above a minimum value."""
-    cv_results = _compute_cv_scores(
-        model=model, X=X, y=y, cv_type=cv_type, n_splits=n_splits, scoring="precision"
-    )
+    **options: Any,
+) -> dict[str, Any]:
+    """
+    Assert that the mean precision score across cross-validation folds is above a minimum value.
 
-    if cv_results["mean_score"] < min_score:
-        raise AssertionError(
-            f"Mean precision score {cv_results['mean_score']:.4f} (±{cv_results['std_score']:.4f}) "
-            f"is below the minimum threshold {min_score:.4f}"
-        )
+    Keyword ``options`` are those of ``assert_cv_scores``.
+    """
+    return _assert_cv_metric(
+        "Mean precision score",
+        "precision",
+        model,
+        X,
+        y,
+        min_score,
+        cv_type=cv_type,
+        n_splits=n_splits,
+        **options,
+    )
 
 
 def assert_cv_recall_score(
     model: BaseEstimator,
-    X: np.ndarray,
-    y: np.ndarray,
+    X: MatrixLike,
+    y: VectorLike,
     min_score: float,
-    cv_type: str = "kfold",
+    cv_type: str | BaseCrossValidator = "kfold",
     n_splits: int = 5,
-) -> None:
-    """Assert that the mean recall score across cross-validation folds is above a minimum value."""
-    cv_results = _compute_cv_scores(
-        model=model, X=X, y=y, cv_type=cv_type, n_splits=n_splits, scoring="recall"
-    )
+    **options: Any,
+) -> dict[str, Any]:
+    """
+    Assert that the mean recall score across cross-validation folds is above a minimum value.
 
-    if cv_results["mean_score"] < min_score:
-        raise AssertionError(
-            f"Mean recall score {cv_results['mean_score']:.4f} (±{cv_results['std_score']:.4f}) "
-            f"is below the minimum threshold {min_score:.4f}"
-        )
+    Keyword ``options`` are those of ``assert_cv_scores``.
+    """
+    return _assert_cv_metric(
+        "Mean recall score",
+        "recall",
+        model,
+        X,
+        y,
+        min_score,
+        cv_type=cv_type,
+        n_splits=n_splits,
+        **options,
+    )
 
 
 def assert_cv_f1_score(
     model: BaseEstimator,
-    X: np.ndarray,
-    y: np.ndarray,
+    X: MatrixLike,
+    y: VectorLike,
     min_score: float,
-    cv_type: str = "kfold",
+    cv_type: str | BaseCrossValidator = "kfold",
     n_splits: int = 5,
-) -> None:
-    """Assert that the mean F1 score across cross-validation folds is above a minimum value."""
-    cv_results = _compute_cv_scores(
-        model=model, X=X, y=y, cv_type=cv_type, n_splits=n_splits, scoring="f1"
+    **options: Any,
+) -> dict[str, Any]:
+    """
+    Assert that the mean F1 score across cross-validation folds is above a minimum value.
+
+    Keyword ``options`` are those of ``assert_cv_scores``.
+    """
+    return _assert_cv_metric(
+        "Mean F1 score",
+        "f1",
+        model,
+        X,
+        y,
+        min_score,
+        cv_type=cv_type,
+        n_splits=n_splits,
+        **options,
     )
 
-    if cv_results["mean_score"] < min_score:
+
+def assert_cv_roc_auc_score(
+    model: BaseEstimator,
+    X: MatrixLike,
+    y: VectorLike,
+    min_score: float,
+    cv_type: str | BaseCrossValidator = "kfold",
+    n_splits: int = 5,
+    **options: Any,
+) -> dict[str, Any]:
+    """
+    Assert that the mean ROC AUC score across cross-validation folds is above a minimum value.
+
+    Keyword ``options`` are those of ``assert_cv_scores``.
+    """
+    return _assert_cv_metric(
+        "Mean ROC AUC score",
+        "roc_auc",
+        model,
+        X,
+        y,
+        min_score,
+        cv_type=cv_type,
+        n_splits=n_splits,
+        **options,
+    )
+
+
+def assert_cv_scores(
+    model: BaseEstimator,
+    X: MatrixLike,
+    y: VectorLike,
+    min_scores: dict[str, float],
+    cv_type: str | BaseCrossValidator = "kfold",
+    n_splits: int = 5,
+    early_stop: bool = False,
+    wave_size: int = 1,
+    session: CVSession | None = None,
+    n_jobs: int | None = None,
+    backend: str | None = None,
+    pre_dispatch: str | int = "2*n_jobs",
+    max_threads: int | None = None,
+    groups: np.ndarray | None = None,
+    n_repeats: int = 3,
+    max_nbytes: int | str | None = "1M",
+) -> dict[str, dict[str, Any]]:
+    """
+    Assert several mean cross-validation scores at once, fitting each fold only once.
+
+    Args:
+        model: Scikit-learn estimator to evaluate.
+        X: Feature matrix.
+        y: Target labels.
+        min_scores: Mapping from metric name ('accuracy', 'precision', 'recall',
+            'f1', 'roc_auc') to its minimum acceptable mean score.
+        cv_type: Cross-validation strategy: 'kfold', 'stratified', 'loo',
+            'repeated_kfold', 'repeated_stratified', 'group_kfold',
+            'timeseries', 'loo_subsample', or any scikit-learn splitter.
+        n_splits: Number of folds (held-out samples for 'loo_subsample').
+        early_stop: Stop evaluating folds once the outcome is decided.
+        wave_size: Number of folds evaluated in parallel per wave when
+            early stopping.
+        session: Optional CVSession whose cached folds are reused.
+        n_jobs: Number of parallel workers. None uses every CPU available to
+            the process, honoring cgroup CPU quotas; negative values count
+            back from that total as in joblib.
+        backend: joblib backend, e.g. 'loky', 'threading' or 'multiprocessing'.
+            None uses joblib's default.
+        pre_dispatch: Number of folds dispatched ahead of the workers.
+        max_threads: Cap on BLAS/OpenMP threads inside each worker. None
+            divides the available CPUs evenly between the workers. BLAS
+            thread limits are process-global, so with the 'threading'
+            backend the cap applies to all workers together.
+        groups: Group labels for 'group_kfold' or group-aware splitters.
+        n_repeats: Number of repetitions for the repeated k-fold strategies.
+        max_nbytes: Arrays above this size are shared with process-based
+            workers through a read-only memory map. None disables it.
+
+    Returns:
+        The cross-validation results per metric.
+    """
+    cv_results = _compute_cv_metrics(
+        model,
+        X,
+        y,
+        cv_type,
+        n_splits,
+        min_scores,
+        early_stop_thresholds=min_scores if early_stop else None,
+        wave_size=wave_size,
+        session=session,
+        n_jobs=n_jobs,
+        backend=backend,
+        pre_dispatch=pre_dispatch,
+        max_threads=max_threads,
+        groups=groups,
+        n_repeats=n_repeats,
+        max_nbytes=max_nbytes,
+    )
+    failures = []
+    for metric, min_score in min_scores.items():
+        result = cv_results[metric]
+        if isinstance(result, Exception):
+            raise result
+        # Undecided metrics only occur when another metric already failed.
+        if _cv_outcome(result, min_score) is False:
+            failures.append(_format_cv_failure(metric, result, min_score))
+    if failures:
         raise AssertionError(
-            f"Mean F1 score {cv_results['mean_score']:.4f} (±{cv_results['std_score']:.4f}) "
-            f"is below the minimum threshold {min_score:.4f}"
+            "Mean cross-validation scores below the minimum threshold: "
+            + "; ".join(failures)
         )
+    return cv_results
 
 
-def assert_cv_roc_auc_score(
+def _batched_metric(
+    estimator: BaseEstimator,
+    X: MatrixLike,
+    y_test: VectorLike,
+    test: np.ndarray,
+    scoring: str,
+    batch_size: int,
+) -> float:
+    """Score the test fold, predicting it one batch of rows at a time."""
+    metric_fn, needs_scores = _CV_METRICS[scoring]
+    outputs = []
+    for start in range(0, len(test), batch_size):
+        X_batch = _safe_indexing(X, test[start : start + batch_size])
+        if needs_scores:
+            outputs.append(_positive_scores(estimator, X_batch))
+        else:
+            outputs.append(estimator.predict(X_batch))
+    return metric_fn(y_test, np.concatenate(outputs))
+
+
+def _partial_fit_fold(
+    model: BaseEstimator,
+    X: MatrixLike,
+    y: VectorLike,
+    train: np.ndarray,
+    test: np.ndarray,
+    scoring: str,
+    classes: np.ndarray | None,
+    batch_size: int,
+    n_epochs: int,
+    eval_every: int | None,
+    max_threads: int | None,
+) -> dict[str, Any]:
+    """
+    Train a fresh clone on one fold by streaming mini-batches through partial_fit.
+
+    Only one batch of training rows is materialized at a time. The test fold
+    is scored after every ``eval_every`` batches, or after every epoch when
+    it is None, and after the last batch.
+    """
+    fit_params = {"classes": classes} if classes is not None else {}
+    y_test = _safe_indexing(y, test)
+    curve, seen = [], []
+    n_seen = n_batches = 0
+    with threadpool_limits(limits=max_threads):
+        estimator = clone(model)
+        for _ in range(n_epochs):
+            for start in range(0, len(train), batch_size):
+                batch = train[start : start + batch_size]
+                estimator.partial_fit(
+                    _safe_indexing(X, batch), _safe_indexing(y, batch), **fit_params
+                )
+                n_seen += len(batch)
+                n_batches += 1
+                if eval_every is not None and n_batches % eval_every == 0:
+                    curve.append(
+                        _batched_metric(estimator, X, y_test, test, scoring, batch_size)
+                    )
+                    seen.append(n_seen)
+            if eval_every is None:
+                curve.append(
+                    _batched_metric(estimator, X, y_test, test, scoring, batch_size)
+                )
+                seen.append(n_seen)
+        if not seen or seen[-1] != n_seen:
+            curve.append(
+                _batched_metric(estimator, X, y_test, test, scoring, batch_size)
+            )
+            seen.append(n_seen)
+    return {"learning_curve": np.array(curve), "n_samples_seen": np.array(seen)}
+
+
+def assert_cv_incremental_score(
     model: BaseEstimator,
-    X: np.ndarray,
-    y: np.ndarray,
+    X: MatrixLike,
+    y: VectorLike,
     min_score: float,
-    cv_type: str = "kfold",
+    scoring: str = "accuracy",
+    batch_size: int = 1000,
+    n_epochs: int = 1,
+    eval_every: int | None = None,
+    cv_type: str | BaseCrossValidator = "kfold",
     n_splits: int = 5,
-) -> None:
-    """Assert that the mean ROC AUC score across cross-validation folds is above a minimum value."""
-    cv_results = _compute_cv_scores(
-        model=model, X=X, y=y, cv_type=cv_type, n_splits=n_splits, scoring="roc_auc"
-    )
+    groups: np.ndarray | None = None,
+    n_repeats: int = 3,
+    n_jobs: int | None = None,
+    backend: str | None = None,
+    pre_dispatch: str | int = "2*n_jobs",
+    max_threads: int | None = None,
+    max_nbytes: int | str | None = "1M",
+) -> dict[str, Any]:
+    """
+    Assert a mean cross-validation score for a model trained incrementally.
+
+    Each fold trains a fresh clone with ``partial_fit`` on mini-batches of
+    ``batch_size`` training rows, so only one batch is held in memory at a
+    time; with a memory-mapped ``X`` (e.g. ``np.load(path, mmap_mode="r")``)
+    datasets larger than RAM can be cross-validated.
 
-    if cv_results["mean_score"] < min_score:
+    Args:
+        model: Estimator implementing ``partial_fit``.
+        X: Feature matrix.
+        y: Target labels.
+        min_score: Minimum acceptable mean final score.
+        scoring: Metric name ('accuracy', 'precision', 'recall', 'f1', 'roc_auc').
+        batch_size: Rows per mini-batch, for training and for scoring.
+        n_epochs: Number of passes over each training fold.
+        eval_every: Score the test fold after this many batches to build the
+            learning curve. None (default) scores it once per epoch, since
+            each score is a full pass over the test fold; small values make
+            scoring cost far more than training.
+        cv_type, n_splits, groups, n_repeats, n_jobs, backend, pre_dispatch,
+        max_threads, max_nbytes: As in ``assert_cv_scores``.
+
+    Returns:
+        The cross-validation results of the final models, plus per-fold
+        ``learning_curves`` and the matching ``n_samples_seen``.
+    """
+    if not hasattr(model, "partial_fit"):
+        raise CrossValidationError(
+            "Incremental cross-validation requires an estimator with partial_fit"
+        )
+    if scoring not in _CV_METRICS:
+        raise CrossValidationError(
+            f"Unknown metric '{scoring}'. Available: {', '.join(_CV_METRICS)}"
+        )
+    if batch_size < 1 or n_epochs < 1 or (eval_every is not None and eval_every < 1):
+        raise CrossValidationError(
+            "batch_size, n_epochs and eval_every must be at least 1"
+        )
+    _validate_inputs(model, X, y, cv_type, n_splits, groups, n_repeats)
+    X = _row_indexable(X)
+
+    cv = _get_cv_splitter(cv_type, n_splits, n_repeats)
+    n_folds = cv.get_n_splits(X, y, groups)
+    n_workers = _resolve_n_jobs(n_jobs, n_folds)
+    if max_threads is None:
+        max_threads = max(1, joblib.cpu_count() // n_workers)
+    # Classifiers need every class on the first partial_fit call.
+    classes = np.unique(np.asarray(y)) if is_classifier(model) else None
+
+    try:
+        with Parallel(
+            n_jobs=n_workers,
+            backend=backend,
+            pre_dispatch=pre_dispatch,
+            max_nbytes=max_nbytes,
+            mmap_mode="r",
+        ) as parallel:
+            folds = parallel(
+                delayed(_partial_fit_fold)(
+                    model,
+                    X,
+                    y,
+                    train,
+                    test,
+                    scoring,
+                    classes,
+                    batch_size,
+                    n_epochs,
+                    eval_every,
+                    max_threads,
+                )
+                for train, test in cv.split(X, y, groups)
+            )
+    except Exception as e:
+        raise CrossValidationError(f"Error during cross-validation: {str(e)}") from e
+
+    cv_results = _summarize_scores(
+        np.array([fold["learning_curve"][-1] for fold in folds]), n_folds
+    )
+    cv_results["learning_curves"] = [fold["learning_curve"] for fold in folds]
+    cv_results["n_samples_seen"] = [fold["n_samples_seen"] for fold in folds]
+    if not _cv_outcome(cv_results, min_score):
         raise AssertionError(
-            f"Mean ROC AUC score {cv_results['mean_score']:.4f} (±{cv_results['std_score']:.4f}) "
-            f"is below the minimum threshold {min_score:.4f}"
+            _format_cv_failure(
+                f"Mean incremental {scoring} score", cv_results, min_score
+            )
         )
+    return cv_results
 
 
 def get_cv_summary(
     model: BaseEstimator,
-    X: np.ndarray,
-    y: np.ndarray,
-    cv_type: str = "kfold",
+    X: MatrixLike,
+    y: VectorLike,
+    cv_type: str | BaseCrossValidator = "kfold",
     n_splits: int = 5,
+    **options: Any,
 ) -> dict[str, dict[str, float]]:
-    """Get a summary of all cross-validation metrics."""
-    metrics = {
-        "accuracy": "accuracy",
-        "precision": "precision",
-        "recall": "recall",
-        "f1": "f1",
-        "roc_auc": "roc_auc",
-    }
+    """
+    Get a summary of all cross-validation metrics, fitting each fold once.
+
+    Keyword ``options`` (``session`` and the splitter and parallelism
+    options) are those of ``assert_cv_scores``.
+    """
+    try:
+        cv_results = _compute_cv_metrics(
+            model,
+            X,
+            y,
+            cv_type,
+            n_splits,
+            _CV_METRICS,
+            **options,
+        )
+    except CrossValidationError as e:
+        cv_results = dict.fromkeys(_CV_METRICS, e)
 
     summary = {}
-    for metric_name, scoring in metrics.items():
-        try:
-            cv_results = _compute_cv_scores(
-                model=model,
-                X=X,
-                y=y,
-                cv_type=cv_type,
-                n_splits=n_splits,
-                scoring=scoring,
+    for metric_name, cv_result in cv_results.items():
+        if isinstance(cv_result, Exception):
+            warnings.warn(
+                f"Could not compute {metric_name}: {str(cv_result)}", stacklevel=2
             )
-            summary[metric_name] = {
-                "mean": cv_results["mean_score"],
-                "std": cv_results["std_score"],
-                "min": cv_results["min_score"],
-                "max": cv_results["max_score"],
-            }
-        except Exception as e:
-            warnings.warn(f"Could not compute {metric_name}: {str(e)}", stacklevel=2)
             summary[metric_name] = None
+            continue
+        summary[metric_name] = {
+            "mean": cv_result["mean_score"],
+            "std": cv_result["std_score"],
+            "min": cv_result["min_score"],
+            "max": cv_result["max_score"],
+        }
 
     return summary
@@ -0,0 +1,139 @@
+"""
+Model loaders with a process-wide cache.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import joblib
+import numpy as np
+
+_JOBLIB_SUFFIXES = {".joblib", ".pkl", ".pickle"}
+_ONNX_SUFFIXES = {".onnx"}
+_XGBOOST_SUFFIXES = {".json", ".ubj", ".xgb", ".bst"}
+
+# Loaded models keyed by (resolved path, mtime, format, mmap_mode).
+_MODEL_CACHE: dict[tuple[str, int, str, str | None], Any] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+class OnnxModel:
+    """Callable wrapper that runs an ONNX model with onnxruntime."""
+
+    def __init__(self, path: Path):
+        """
+        Create an inference session for the model.
+
+        Args:
+            path: Path to the ``.onnx`` file.
+        """
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise ImportError(
+                "Loading ONNX models requires onnxruntime. Install it with "
+                "'pip install onnxruntime'."
+            ) from e
+        self.session = ort.InferenceSession(str(path))
+        self.input_name = self.session.get_inputs()[0].name
+
+    def predict(self, X: Any) -> np.ndarray:
+        """Return the model's first output for the rows of X."""
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        return self.session.run(None, {self.input_name: X})[0]
+
+    def __call__(self, X: Any) -> np.ndarray:
+        return self.predict(X)
+
+
+def _model_format(path: Path, model_format: str | None) -> str:
+    if model_format is not None:
+        return model_format
+    suffix = path.suffix.lower()
+    if suffix in _JOBLIB_SUFFIXES:
+        return "joblib"
+    if suffix in _ONNX_SUFFIXES:
+        return "onnx"
+    if suffix in _XGBOOST_SUFFIXES:
+        return "xgboost"
+    raise ValueError(
+        f"Cannot infer the model format of {path}; specify it with 'format'"
+    )
+
+
+def _load_xgboost(path: Path) -> Any:
+    try:
+        import xgboost as xgb
+    except ImportError as e:
+        raise ImportError(
+            "Loading XGBoost models requires xgboost. Install it with "
+            "'pip install xgboost'."
+        ) from e
+    return xgb.Booster(model_file=str(path))
+
+
+def _load_uncached(path: Path, model_format: str, mmap_mode: str | None) -> Any:
+    if model_format == "joblib":
+        # joblib also reads plain pickles; mmap_mode applies to the numpy
+        # arrays of uncompressed joblib dumps and is ignored otherwise.
+        return joblib.load(path, mmap_mode=mmap_mode)
+    if model_format == "onnx":
+        return OnnxModel(path)
+    if model_format == "xgboost":
+        return _load_xgboost(path)
+    raise ValueError(
+        f"Unknown model format {model_format!r}; expected 'joblib', 'onnx' or 'xgboost'"
+    )
+
+
+def load_model(spec: str | Path | dict[str, Any]) -> Any:
+    """
+    Load a trained model, reusing an earlier load of the same file.
+
+    The format is chosen from the file suffix:
+
+    - ``.joblib``/``.pkl``/``.pickle``: ``joblib.load``, with numpy arrays of
+      uncompressed joblib dumps memory-mapped read-only.
+    - ``.onnx``: an :class:`OnnxModel` running the model with onnxruntime.
+    - ``.json``/``.ubj``/``.xgb``/``.bst``: an ``xgboost.Booster``.
+
+    Loaded models are cached for the life of the process, keyed by the
+    resolved path and modification time, so every step of a run shares one
+    deserialized copy and a rewritten file is loaded again. Cached models are
+    shared objects and should not be modified in place.
+
+    Args:
+        spec: A path, or a mapping with ``path`` and optional ``format``
+            (``joblib``, ``onnx`` or ``xgboost``) and ``mmap_mode`` keys.
+            ``mmap_mode`` defaults to ``"r"``; ``None`` reads arrays into
+            memory.
+
+    Returns:
+        The loaded model.
+    """
+    if isinstance(spec, dict):
+        path = Path(spec["path"])
+        model_format = spec.get("format")
+        mmap_mode = spec.get("mmap_mode", "r")
+    else:
+        path = Path(spec)
+        model_format = None
+        mmap_mode = "r"
+
+    path = path.resolve()
+    model_format = _model_format(path, model_format)
+    key = (str(path), path.stat().st_mtime_ns, model_format, mmap_mode)
+    with _MODEL_CACHE_LOCK:
+        if key not in _MODEL_CACHE:
+            # Drop stale versions of a rewritten file before loading the new one.
+            for stale in [k for k in _MODEL_CACHE if k[0] == key[0]]:
+                del _MODEL_CACHE[stale]
+            _MODEL_CACHE[key] = _load_uncached(path, model_format, mmap_mode)
+        return _MODEL_CACHE[key]
+
+
+def clear_model_cache() -> None:
+    """Release every cached model."""
+    with _MODEL_CACHE_LOCK:
+        _MODEL_CACHE.clear()
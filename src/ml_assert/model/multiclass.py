@@ -0,0 +1,168 @@
+"""
+Multi-class and multi-label classification metrics from shared count arrays.
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+_AVERAGES = ("macro", "micro", "weighted")
+_PER_CLASS_METRICS = ("precision", "recall", "f1")
+
+
+class ClassificationCounts:
+    """
+    Per-class true positive, false positive and false negative counts.
+
+    Multi-class labels are reduced to one K×K confusion matrix with a single
+    ``np.bincount``; multi-label indicator matrices are reduced to per-label
+    count arrays with one column-wise sum each. Every averaged or per-class
+    precision, recall and F1 score is then derived from these K-length arrays
+    without touching the samples again.
+    """
+
+    def __init__(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        labels: Sequence[Any] | None = None,
+    ):
+        """
+        Count outcomes per class.
+
+        Args:
+            y_true: Ground truth labels (1-D) or label indicator matrix (2-D).
+            y_pred: Predicted labels (1-D) or label indicator matrix (2-D).
+            labels: Optional class labels. Defaults to the sorted union of the
+                observed labels, or column indices for indicator matrices.
+        """
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred)
+        if y_true.shape != y_pred.shape:
+            raise ValueError("y_true and y_pred must have the same shape")
+
+        if y_true.ndim == 2:
+            self.multilabel = True
+            self.labels = np.arange(y_true.shape[1]) if labels is None else labels
+            self.labels = np.asarray(self.labels)
+            if len(self.labels) != y_true.shape[1]:
+                raise ValueError("labels must have one entry per indicator column")
+            t = y_true.astype(bool, copy=False)
+            p = y_pred.astype(bool, copy=False)
+            self.tp = np.count_nonzero(t & p, axis=0)
+            self.support = np.count_nonzero(t, axis=0)
+            self.predicted = np.count_nonzero(p, axis=0)
+            self.confusion_matrix = None
+        else:
+            self.multilabel = False
+            if labels is None:
+                labels = np.union1d(y_true, y_pred)
+            self.labels = np.asarray(labels)
+            k = len(self.labels)
+            if k == 0:
+                raise ValueError("Cannot compute classification counts without labels")
+            sorter = np.argsort(self.labels, kind="mergesort")
+            true_codes = self._encode(y_true, sorter)
+            pred_codes = self._encode(y_pred, sorter)
+            self.confusion_matrix = np.bincount(
+                true_codes * k + pred_codes, minlength=k * k
+            ).reshape(k, k)
+            self.tp = np.diagonal(self.confusion_matrix).copy()
+            self.support = self.confusion_matrix.sum(axis=1)
+            self.predicted = self.confusion_matrix.sum(axis=0)
+
+        self.fp = self.predicted - self.tp
+        self.fn = self.support - self.tp
+
+    def _encode(self, y: np.ndarray, sorter: np.ndarray) -> np.ndarray:
+        """Map labels to integer codes in [0, K)."""
+        pos = np.searchsorted(self.labels, y, sorter=sorter)
+        pos = np.minimum(pos, len(self.labels) - 1)
+        codes = sorter[pos]
+        if not np.array_equal(self.labels[codes], y):
+            raise ValueError("y_true or y_pred contains labels not in 'labels'")
+        return codes
+
+    @staticmethod
+    def _ratio(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+        """Element-wise num / den, with 0 where den is 0 (sklearn's zero_division=0)."""
+        num = np.asarray(num, dtype=np.float64)
+        den = np.asarray(den, dtype=np.float64)
+        return np.divide(num, den, out=np.zeros_like(num), where=den > 0)
+
+    def _average(self, per_class: np.ndarray, average: str) -> float:
+        if average == "macro":
+            return float(per_class.mean())
+        if average == "weighted":
+            total = self.support.sum()
+            return float(per_class @ self.support / total) if total else 0.0
+        raise ValueError(f"average must be one of: {', '.join(_AVERAGES)}")
+
+    def precision(self, average: str | None = "macro") -> float | np.ndarray:
+        """Precision, per class if average is None."""
+        if average == "micro":
+            return float(self._ratio(self.tp.sum(), self.predicted.sum()))
+        per_class = self._ratio(self.tp, self.predicted)
+        return per_class if average is None else self._average(per_class, average)
+
+    def recall(self, average: str | None = "macro") -> float | np.ndarray:
+        """Recall, per class if average is None."""
+        if average == "micro":
+            return float(self._ratio(self.tp.sum(), self.support.sum()))
+        per_class = self._ratio(self.tp, self.support)
+        return per_class if average is None else self._average(per_class, average)
+
+    def f1(self, average: str | None = "macro") -> float | np.ndarray:
+        """F1 score, per class if average is None."""
+        if average == "micro":
+            tp = self.tp.sum()
+            return float(self._ratio(2 * tp, 2 * tp + self.fp.sum() + self.fn.sum()))
+        per_class = self._ratio(2 * self.tp, 2 * self.tp + self.fp + self.fn)
+        return per_class if average is None else self._average(per_class, average)
+
+    def score(self, metric: str, average: str | None = "macro") -> float | np.ndarray:
+        """Dispatch to precision, recall or f1 by name."""
+        if metric not in _PER_CLASS_METRICS:
+            raise ValueError(f"metric must be one of: {', '.join(_PER_CLASS_METRICS)}")
+        return getattr(self, metric)(average)
+
+
+def check_per_class_scores(
+    counts: ClassificationCounts,
+    metric: str,
+    thresholds: float | Mapping[Any, float],
+) -> None:
+    """
+    Raises an AssertionError if any class scores below its threshold.
+
+    Args:
+        counts: Precomputed per-class counts.
+        metric: One of 'precision', 'recall', 'f1'.
+        thresholds: One minimum score for every class, or a mapping from
+            class label to minimum score for the classes to check.
+    """
+    scores = counts.score(metric, average=None)
+    if isinstance(thresholds, Mapping):
+        lookup = {label: i for i, label in enumerate(counts.labels.tolist())}
+        missing = [label for label in thresholds if label not in lookup]
+        if missing:
+            raise ValueError(f"Unknown class labels in thresholds: {missing}")
+        idx = np.array([lookup[label] for label in thresholds], dtype=np.intp)
+        bounds = np.array(list(thresholds.values()), dtype=np.float64)
+    else:
+        idx = np.arange(len(scores))
+        bounds = np.full(len(scores), thresholds, dtype=np.float64)
+
+    failing = idx[scores[idx] < bounds]
+    if failing.size:
+        bound_of = dict(zip(idx.tolist(), bounds.tolist(), strict=True))
+        details = ", ".join(
+            f"{counts.labels[i]!r}: {scores[i]:.4f} < {bound_of[i]:.4f}"
+            for i in failing[:10]
+        )
+        more = f" and {failing.size - 10} more" if failing.size > 10 else ""
+        raise AssertionError(
+            f"Per-class {metric} is below the minimum threshold for "
+            f"{failing.size} class(es): {details}{more}"
+        )
@@ -8,54 +8,92 @@ from sklearn.metrics import (
 )
 
 
+def check_min_score(name: str, score: float, min_score: float) -> None:
+    """Raises an AssertionError if a higher-is-better metric is below its threshold."""
+    if score < min_score:
+        raise AssertionError(
+            f"{name} {score:.4f} is below the minimum threshold {min_score:.4f}"
+        )
+
+
+def check_max_score(name: str, score: float, max_score: float) -> None:
+    """Raises an AssertionError if a lower-is-better metric is above its threshold."""
+    if score > max_score:
+        raise AssertionError(
+            f"{name} {score:.4f} is above the maximum threshold {max_score:.4f}"
+        )
+
+
+def _score_label(name: str, average: str) -> str:
+    return name if average == "binary" else f"{name} ({average})"
+
+
 def assert_accuracy_score(
     y_true: np.ndarray, y_pred: np.ndarray, min_score: float
 ) -> None:
     """Asserts that the accuracy score is above a minimum value."""
-    score = accuracy_score(y_true, y_pred)
-    if score < min_score:
-        raise AssertionError(
-            f"Accuracy score {score:.4f} is below the minimum threshold {min_score:.4f}"
-        )
+    check_min_score("Accuracy score", accuracy_score(y_true, y_pred), min_score)
 
 
 def assert_precision_score(
-    y_true: np.ndarray, y_pred: np.ndarray, min_score: float
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    min_score: float,
+    average: str = "binary",
 ) -> None:
-    """Asserts that the precision score is above a minimum value."""
-    score = precision_score(y_true, y_pred)
-    if score < min_score:
-        raise AssertionError(
-            f"Precision score {score:.4f} is below the minimum threshold {min_score:.4f}"
-        )
+    """
+    Asserts that the precision score is above a minimum value.
+
+    ``average`` is passed to sklearn; use 'macro', 'micro' or 'weighted' for
+    multi-class or multi-label targets.
+    """
+    check_min_score(
+        _score_label("Precision score", average),
+        precision_score(y_true, y_pred, average=average),
+        min_score,
+    )
 
 
 def assert_recall_score(
-    y_true: np.ndarray, y_pred: np.ndarray, min_score: float
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    min_score: float,
+    average: str = "binary",
 ) -> None:
-    """Asserts that the recall score is above a minimum value."""
-    score = recall_score(y_true, y_pred)
-    if score < min_score:
-        raise AssertionError(
-            f"Recall score {score:.4f} is below the minimum threshold {min_score:.4f}"
-        )
+    """
+    Asserts that the recall score is above a minimum value.
 
+    ``average`` is passed to sklearn; use 'macro', 'micro' or 'weighted' for
+    multi-class or multi-label targets.
+    """
+    check_min_score(
+        _score_label("Recall score", average),
+        recall_score(y_true, y_pred, average=average),
+        min_score,
+    )
 
-def assert_f1_score(y_true: np.ndarray, y_pred: np.ndarray, min_score: float) -> None:
-    """Asserts that the F1 score is above a minimum value."""
-    score = f1_score(y_true, y_pred)
-    if score < min_score:
-        raise AssertionError(
-            f"F1 score {score:.4f} is below the minimum threshold {min_score:.4f}"
-        )
+
+def assert_f1_score(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    min_score: float,
+    average: str = "binary",
+) -> None:
+    """
+    Asserts that the F1 score is above a minimum value.
+
+    ``average`` is passed to sklearn; use 'macro', 'micro' or 'weighted' for
+    multi-class or multi-label targets.
+    """
+    check_min_score(
+        _score_label("F1 score", average),
+        f1_score(y_true, y_pred, average=average),
+        min_score,
+    )
 
 
 def assert_roc_auc_score(
     y_true: np.ndarray, y_scores: np.ndarray, min_score: float
 ) -> None:
     """Asserts that the ROC AUC score is above a minimum value."""
-    score = roc_auc_score(y_true, y_scores)
-    if score < min_score:
-        raise AssertionError(
-            f"ROC AUC score {score:.4f} is below the minimum threshold {min_score:.4f}"
-        )
+    check_min_score("ROC AUC score", roc_auc_score(y_true, y_scores), min_score)
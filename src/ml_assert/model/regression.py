@@ -0,0 +1,234 @@
+"""
+Regression metrics computed in a single fused pass over residuals.
+"""
+
+import numpy as np
+
+from ml_assert.model.performance import check_max_score, check_min_score
+
+_CHUNK_SIZE = 1 << 16
+_EPS = np.finfo(np.float64).eps
+
+
+class RegressionMetrics:
+    """
+    Streaming accumulator for regression error metrics.
+
+    Every batch passed to :meth:`update` is consumed in fixed-size chunks that
+    share one residual buffer, so MAE, RMSE, R², MAPE and any number of
+    quantile (pinball) losses come out of a single pass without allocating
+    full-size temporaries. Accumulators can be merged, which makes them
+    suitable for sharded or streaming evaluation.
+    """
+
+    def __init__(self, chunk_size: int = _CHUNK_SIZE):
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            chunk_size: Number of rows processed per chunk.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        self.chunk_size = chunk_size
+        self.n_samples = 0
+        self._sum_residual = 0.0
+        self._sum_abs_residual = 0.0
+        self._sum_sq_residual = 0.0
+        self._sum_ape = 0.0
+        self._mean_true = 0.0
+        self._m2_true = 0.0
+
+    @classmethod
+    def from_arrays(
+        cls,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        sample_mask: np.ndarray | None = None,
+    ) -> "RegressionMetrics":
+        """
+        Build an accumulator from complete arrays.
+
+        Args:
+            y_true: Ground truth target values.
+            y_pred: Predicted target values.
+            sample_mask: Optional boolean mask or index array selecting the
+                slice of samples to evaluate.
+
+        Returns:
+            A populated RegressionMetrics instance.
+        """
+        metrics = cls()
+        if sample_mask is not None:
+            y_true = np.asarray(y_true)[sample_mask]
+            y_pred = np.asarray(y_pred)[sample_mask]
+        return metrics.update(y_true, y_pred)
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> "RegressionMetrics":
+        """
+        Accumulate a batch of targets and predictions.
+
+        Args:
+            y_true: Ground truth target values for the batch.
+            y_pred: Predicted target values for the batch.
+
+        Returns:
+            self, to allow chaining.
+        """
+        y_true = np.asarray(y_true).ravel()
+        y_pred = np.asarray(y_pred).ravel()
+        if y_true.shape != y_pred.shape:
+            raise ValueError(
+                f"y_true and y_pred must have the same length, "
+                f"got {y_true.shape[0]} and {y_pred.shape[0]}"
+            )
+        n = y_true.shape[0]
+        if n == 0:
+            return self
+
+        size = min(self.chunk_size, n)
+        residual = np.empty(size, dtype=np.float64)
+        scratch = np.empty(size, dtype=np.float64)
+        for start in range(0, n, size):
+            stop = min(start + size, n)
+            m = stop - start
+            r = residual[:m]
+            s = scratch[:m]
+            t = y_true[start:stop]
+
+            np.subtract(t, y_pred[start:stop], out=r)
+            self._sum_residual += float(r.sum())
+            self._sum_sq_residual += float(np.dot(r, r))
+            np.abs(r, out=r)
+            self._sum_abs_residual += float(r.sum())
+
+            np.abs(t, out=s)
+            np.maximum(s, _EPS, out=s)
+            np.divide(r, s, out=s)
+            self._sum_ape += float(s.sum())
+
+            # Chan et al. parallel update of the running mean / M2 of y_true.
+            chunk_mean = float(t.mean())
+            np.subtract(t, chunk_mean, out=s)
+            chunk_m2 = float(np.dot(s, s))
+            total = self.n_samples + m
+            delta = chunk_mean - self._mean_true
+            self._mean_true += delta * m / total
+            self._m2_true += chunk_m2 + delta * delta * self.n_samples * m / total
+            self.n_samples = total
+        return self
+
+    def merge(self, other: "RegressionMetrics") -> "RegressionMetrics":
+        """
+        Merge the statistics of another accumulator into this one.
+
+        Args:
+            other: Accumulator to merge.
+
+        Returns:
+            self, to allow chaining.
+        """
+        if other.n_samples == 0:
+            return self
+        total = self.n_samples + other.n_samples
+        delta = other._mean_true - self._mean_true
+        self._mean_true += delta * other.n_samples / total
+        self._m2_true += (
+            other._m2_true + delta * delta * self.n_samples * other.n_samples / total
+        )
+        self._sum_residual += other._sum_residual
+        self._sum_abs_residual += other._sum_abs_residual
+        self._sum_sq_residual += other._sum_sq_residual
+        self._sum_ape += other._sum_ape
+        self.n_samples = total
+        return self
+
+    def _require_samples(self) -> None:
+        if self.n_samples == 0:
+            raise ValueError("No samples have been accumulated")
+
+    @property
+    def mae(self) -> float:
+        """Mean absolute error."""
+        self._require_samples()
+        return self._sum_abs_residual / self.n_samples
+
+    @property
+    def mse(self) -> float:
+        """Mean squared error."""
+        self._require_samples()
+        return self._sum_sq_residual / self.n_samples
+
+    @property
+    def rmse(self) -> float:
+        """Root mean squared error."""
+        return float(np.sqrt(self.mse))
+
+    @property
+    def r2(self) -> float:
+        """Coefficient of determination (R²)."""
+        self._require_samples()
+        if self._m2_true == 0.0:
+            # Same convention as sklearn's r2_score for constant targets.
+            return 1.0 if self._sum_sq_residual == 0.0 else 0.0
+        return 1.0 - self._sum_sq_residual / self._m2_true
+
+    @property
+    def mape(self) -> float:
+        """Mean absolute percentage error, as a fraction."""
+        self._require_samples()
+        return self._sum_ape / self.n_samples
+
+    def quantile_loss(self, quantile: float) -> float:
+        """
+        Mean pinball loss for the given quantile.
+
+        The pinball loss is recovered from the residual sums, so any number of
+        quantiles can be evaluated without another pass over the data.
+
+        Args:
+            quantile: Quantile level in (0, 1).
+
+        Returns:
+            The mean quantile loss.
+        """
+        if not 0.0 < quantile < 1.0:
+            raise ValueError("quantile must be in the open interval (0, 1)")
+        self._require_samples()
+        # sum(max(q * r, (q - 1) * r)) == q * sum(r) + sum(|r| for r < 0)
+        negative_part = 0.5 * (self._sum_abs_residual - self._sum_residual)
+        return (quantile * self._sum_residual + negative_part) / self.n_samples
+
+
+def assert_mae(y_true: np.ndarray, y_pred: np.ndarray, max_error: float) -> None:
+    """Asserts that the mean absolute error is below a maximum value."""
+    check_max_score("MAE", RegressionMetrics.from_arrays(y_true, y_pred).mae, max_error)
+
+
+def assert_rmse(y_true: np.ndarray, y_pred: np.ndarray, max_error: float) -> None:
+    """Asserts that the root mean squared error is below a maximum value."""
+    check_max_score(
+        "RMSE", RegressionMetrics.from_arrays(y_true, y_pred).rmse, max_error
+    )
+
+
+def assert_r2_score(y_true: np.ndarray, y_pred: np.ndarray, min_score: float) -> None:
+    """Asserts that the R² score is above a minimum value."""
+    check_min_score(
+        "R2 score", RegressionMetrics.from_arrays(y_true, y_pred).r2, min_score
+    )
+
+
+def assert_mape(y_true: np.ndarray, y_pred: np.ndarray, max_error: float) -> None:
+    """Asserts that the mean absolute percentage error is below a maximum value."""
+    check_max_score(
+        "MAPE", RegressionMetrics.from_arrays(y_true, y_pred).mape, max_error
+    )
+
+
+def assert_quantile_loss(
+    y_true: np.ndarray, y_pred: np.ndarray, quantile: float, max_loss: float
+) -> None:
+    """Asserts that the quantile (pinball) loss is below a maximum value."""
+    loss = RegressionMetrics.from_arrays(y_true, y_pred).quantile_loss(quantile)
+    check_max_score(f"Quantile loss (q={quantile:g})", loss, max_loss)
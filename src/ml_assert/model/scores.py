@@ -0,0 +1,162 @@
+"""
+Probability and score based metrics.
+"""
+
+import numpy as np
+
+from ml_assert.model.performance import check_max_score
+
+_LOG_LOSS_EPS = 1e-15
+
+
+def as_score_array(y_scores: np.ndarray) -> np.ndarray:
+    """
+    Normalize scores to a C-contiguous float32/float64 array.
+
+    Arrays that already qualify, including read-only memory maps, are returned
+    unchanged so every score metric can share them without another copy.
+
+    Args:
+        y_scores: Scores or probability estimates.
+
+    Returns:
+        The normalized array.
+    """
+    if (
+        isinstance(y_scores, np.ndarray)
+        and y_scores.dtype in (np.float32, np.float64)
+        and y_scores.flags.c_contiguous
+    ):
+        return y_scores
+    return np.ascontiguousarray(y_scores, dtype=np.float64)
+
+
+def _positive_mask(y_true: np.ndarray, y_prob: np.ndarray) -> np.ndarray:
+    y_true = np.asarray(y_true).ravel()
+    if y_true.shape[0] != y_prob.shape[0]:
+        raise ValueError("y_true and y_scores must have the same number of samples")
+    return y_true == 1
+
+
+def log_loss_score(
+    y_true: np.ndarray, y_prob: np.ndarray, labels: np.ndarray | None = None
+) -> float:
+    """
+    Cross-entropy loss.
+
+    Args:
+        y_true: Ground truth labels. For 1-D probabilities these are binary
+            labels with 1 as the positive class; for 2-D probabilities the
+            columns correspond to ``labels``.
+        y_prob: Positive-class probabilities (1-D) or one column per class (2-D).
+        labels: Sorted class labels of the 2-D probability columns. Defaults
+            to the unique labels of y_true, which must then cover every
+            column, so pass it when y_true may lack a class.
+
+    Returns:
+        The mean log loss.
+    """
+    y_prob = as_score_array(y_prob)
+    if y_prob.ndim == 2:
+        y_true = np.asarray(y_true).ravel()
+        if labels is None:
+            classes, codes = np.unique(y_true, return_inverse=True)
+            if len(classes) != y_prob.shape[1]:
+                raise ValueError(
+                    f"y_true has {len(classes)} classes but y_scores has "
+                    f"{y_prob.shape[1]} columns; pass labels to map the columns"
+                )
+        else:
+            classes = np.asarray(labels)
+            if len(classes) != y_prob.shape[1]:
+                raise ValueError(
+                    f"labels has {len(classes)} entries but y_scores has "
+                    f"{y_prob.shape[1]} columns"
+                )
+            codes = np.searchsorted(classes, y_true)
+            codes = np.minimum(codes, len(classes) - 1)
+            if not np.array_equal(classes[codes], y_true):
+                raise ValueError("y_true contains labels that are not in 'labels'")
+        p = y_prob[np.arange(y_prob.shape[0]), codes]
+    else:
+        positive = _positive_mask(y_true, y_prob)
+        p = np.where(positive, y_prob, 1.0 - y_prob)
+    np.clip(p, _LOG_LOSS_EPS, 1.0, out=p)
+    np.log(p, out=p)
+    return float(-p.mean())
+
+
+def brier_score(y_true: np.ndarray, y_prob: np.ndarray) -> float:
+    """
+    Brier score of binary positive-class probabilities.
+
+    Args:
+        y_true: Ground truth binary labels, with 1 as the positive class.
+        y_prob: Positive-class probabilities.
+
+    Returns:
+        The mean squared difference between probabilities and outcomes.
+    """
+    y_prob = as_score_array(y_prob)
+    if y_prob.ndim != 1:
+        raise ValueError("Brier score requires 1-D positive-class probabilities")
+    diff = y_prob - _positive_mask(y_true, y_prob)
+    return float(np.dot(diff, diff) / diff.shape[0])
+
+
+def expected_calibration_error(
+    y_true: np.ndarray, y_prob: np.ndarray, n_bins: int = 10
+) -> float:
+    """
+    Expected calibration error over equal-width probability bins.
+
+    Per-bin counts, mean probabilities and observed positive rates are
+    computed with one ``np.bincount`` each.
+
+    Args:
+        y_true: Ground truth binary labels, with 1 as the positive class.
+        y_prob: Positive-class probabilities.
+        n_bins: Number of equal-width bins on [0, 1].
+
+    Returns:
+        The sample-weighted mean absolute gap between confidence and accuracy.
+    """
+    if n_bins < 1:
+        raise ValueError("n_bins must be a positive integer")
+    y_prob = as_score_array(y_prob)
+    if y_prob.ndim != 1:
+        raise ValueError("Calibration error requires 1-D positive-class probabilities")
+    positive = _positive_mask(y_true, y_prob)
+    bins = np.minimum((y_prob * n_bins).astype(np.intp), n_bins - 1)
+    np.maximum(bins, 0, out=bins)
+    prob_sums = np.bincount(bins, weights=y_prob, minlength=n_bins)
+    pos_counts = np.bincount(bins, weights=positive, minlength=n_bins)
+    return float(np.abs(pos_counts - prob_sums).sum() / y_prob.shape[0])
+
+
+def assert_log_loss(
+    y_true: np.ndarray,
+    y_prob: np.ndarray,
+    max_loss: float,
+    labels: np.ndarray | None = None,
+) -> None:
+    """Asserts that the log loss is below a maximum value."""
+    check_max_score("Log loss", log_loss_score(y_true, y_prob, labels), max_loss)
+
+
+def assert_brier_score(
+    y_true: np.ndarray, y_prob: np.ndarray, max_score: float
+) -> None:
+    """Asserts that the Brier score is below a maximum value."""
+    check_max_score("Brier score", brier_score(y_true, y_prob), max_score)
+
+
+def assert_calibration_error(
+    y_true: np.ndarray, y_prob: np.ndarray, max_error: float, n_bins: int = 10
+) -> None:
+    """Asserts that the expected calibration error is below a maximum value."""
+    check_max_score(
+        "Expected calibration error",
+        expected_calibration_error(y_true, y_prob, n_bins),
+        max_error,
+    )
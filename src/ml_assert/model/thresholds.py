@@ -0,0 +1,211 @@
+"""
+Threshold-sweep metrics derived from a single sort of the scores.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from ml_assert.model.performance import check_min_score
+
+_CURVE_METRICS = ("precision", "recall", "f1", "accuracy", "specificity")
+
+
+class ThresholdCurve:
+    """
+    Confusion counts at every distinct score threshold of a binary classifier.
+
+    The scores are sorted once and the true/false positive counts for every
+    cut-off are read off cumulative sums, so any number of precision@recall,
+    recall@precision, top-k or fixed-threshold queries cost O(n log n) in
+    total instead of one O(n) pass each. A sample is predicted positive when
+    its score is greater than or equal to the threshold.
+    """
+
+    def __init__(self, y_true: np.ndarray, y_scores: np.ndarray, pos_label: int = 1):
+        """
+        Build the curve.
+
+        Args:
+            y_true: Ground truth binary labels.
+            y_scores: Scores for the positive class.
+            pos_label: Label of the positive class.
+        """
+        y_true = np.asarray(y_true).ravel()
+        y_scores = np.asarray(y_scores).ravel()
+        if y_true.shape != y_scores.shape:
+            raise ValueError("y_true and y_scores must have the same length")
+        if y_true.size == 0:
+            raise ValueError("Cannot build a threshold curve from empty inputs")
+
+        order = np.argsort(y_scores, kind="mergesort")[::-1]
+        self._sorted_scores = y_scores[order]
+        # True positives among the top-(i + 1) ranked samples.
+        self._tp_at_rank = np.cumsum(y_true[order] == pos_label)
+        self.n_samples = y_true.size
+        self.n_positive = int(self._tp_at_rank[-1])
+        self.n_negative = self.n_samples - self.n_positive
+        if self.n_positive == 0:
+            raise ValueError("y_true contains no positive samples")
+
+        # Last rank of each run of tied scores marks a distinct threshold.
+        distinct = np.flatnonzero(np.diff(self._sorted_scores))
+        last = np.r_[distinct, self.n_samples - 1]
+        self.thresholds = self._sorted_scores[last]
+        self.tp = self._tp_at_rank[last]
+        self.fp = last + 1 - self.tp
+
+    @property
+    def precision(self) -> np.ndarray:
+        """Precision at each threshold, in decreasing threshold order."""
+        return self.tp / (self.tp + self.fp)
+
+    @property
+    def recall(self) -> np.ndarray:
+        """Recall at each threshold, in decreasing threshold order."""
+        return self.tp / self.n_positive
+
+    def precision_at_recall(self, min_recall: float) -> float:
+        """Best precision over all thresholds whose recall is at least min_recall."""
+        feasible = self.recall >= min_recall
+        return float(self.precision[feasible].max()) if feasible.any() else 0.0
+
+    def recall_at_precision(self, min_precision: float) -> float:
+        """Best recall over all thresholds whose precision is at least min_precision."""
+        feasible = self.precision >= min_precision
+        return float(self.recall[feasible].max()) if feasible.any() else 0.0
+
+    def _check_k(self, k: int) -> None:
+        if not 1 <= k <= self.n_samples:
+            raise ValueError(f"k must be between 1 and {self.n_samples}, got {k}")
+
+    def precision_at_k(self, k: int) -> float:
+        """Precision among the k highest-scored samples."""
+        self._check_k(k)
+        return float(self._tp_at_rank[k - 1]) / k
+
+    def recall_at_k(self, k: int) -> float:
+        """Recall among the k highest-scored samples."""
+        self._check_k(k)
+        return float(self._tp_at_rank[k - 1]) / self.n_positive
+
+    def metric_at_thresholds(
+        self, metric: str, thresholds: Iterable[float]
+    ) -> np.ndarray:
+        """
+        Evaluate a metric at arbitrary thresholds without re-thresholding.
+
+        Args:
+            metric: One of 'precision', 'recall', 'f1', 'accuracy', 'specificity'.
+            thresholds: Score cut-offs to evaluate.
+
+        Returns:
+            Array of metric values, one per threshold.
+        """
+        if metric not in _CURVE_METRICS:
+            raise ValueError(f"metric must be one of: {', '.join(_CURVE_METRICS)}")
+        thresholds = np.asarray(list(thresholds), dtype=np.float64)
+        # Number of samples with score >= t, via the descending sort.
+        n_pred_pos = np.searchsorted(-self._sorted_scores, -thresholds, side="right")
+        tp = np.where(
+            n_pred_pos > 0, self._tp_at_rank[np.maximum(n_pred_pos - 1, 0)], 0
+        ).astype(np.float64)
+        fp = n_pred_pos - tp
+        fn = self.n_positive - tp
+        tn = self.n_negative - fp
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if metric == "precision":
+                values = np.where(n_pred_pos > 0, tp / n_pred_pos, 0.0)
+            elif metric == "recall":
+                values = tp / self.n_positive
+            elif metric == "f1":
+                values = 2 * tp / (2 * tp + fp + fn)
+            elif metric == "accuracy":
+                values = (tp + tn) / self.n_samples
+            else:  # specificity
+                values = tn / self.n_negative if self.n_negative else np.ones_like(tp)
+        return values
+
+
+def assert_precision_at_recall(
+    y_true: np.ndarray, y_scores: np.ndarray, min_recall: float, min_score: float
+) -> None:
+    """Asserts that some threshold reaches min_recall with precision above min_score."""
+    check_min_score(
+        f"Precision at recall {min_recall:.2f}",
+        ThresholdCurve(y_true, y_scores).precision_at_recall(min_recall),
+        min_score,
+    )
+
+
+def assert_recall_at_precision(
+    y_true: np.ndarray, y_scores: np.ndarray, min_precision: float, min_score: float
+) -> None:
+    """Asserts that some threshold reaches min_precision with recall above min_score."""
+    check_min_score(
+        f"Recall at precision {min_precision:.2f}",
+        ThresholdCurve(y_true, y_scores).recall_at_precision(min_precision),
+        min_score,
+    )
+
+
+def assert_precision_at_k(
+    y_true: np.ndarray, y_scores: np.ndarray, k: int, min_score: float
+) -> None:
+    """Asserts that precision among the top-k scored samples is above min_score."""
+    check_min_score(
+        f"Precision at k={k}",
+        ThresholdCurve(y_true, y_scores).precision_at_k(k),
+        min_score,
+    )
+
+
+def assert_recall_at_k(
+    y_true: np.ndarray, y_scores: np.ndarray, k: int, min_score: float
+) -> None:
+    """Asserts that recall among the top-k scored samples is above min_score."""
+    check_min_score(
+        f"Recall at k={k}",
+        ThresholdCurve(y_true, y_scores).recall_at_k(k),
+        min_score,
+    )
+
+
+def check_metric_at_thresholds(
+    curve: ThresholdCurve,
+    metric: str,
+    thresholds: Iterable[float],
+    min_score: float | Iterable[float],
+) -> None:
+    """Raises an AssertionError if the metric falls below min_score at any threshold."""
+    thresholds = np.asarray(list(thresholds), dtype=np.float64)
+    values = curve.metric_at_thresholds(metric, thresholds)
+    bounds = np.broadcast_to(
+        np.asarray(
+            list(min_score) if isinstance(min_score, Iterable) else min_score,
+            dtype=np.float64,
+        ),
+        values.shape,
+    )
+    failing = np.flatnonzero(values < bounds)
+    if failing.size:
+        i = failing[0]
+        raise AssertionError(
+            f"{metric.capitalize()} {values[i]:.4f} at threshold {thresholds[i]:.4f} "
+            f"is below the minimum threshold {bounds[i]:.4f} "
+            f"({failing.size} of {values.size} thresholds failing)"
+        )
+
+
+def assert_metric_at_thresholds(
+    y_true: np.ndarray,
+    y_scores: np.ndarray,
+    metric: str,
+    thresholds: Iterable[float],
+    min_score: float | Iterable[float],
+) -> None:
+    """Asserts that a metric stays above min_score at every given threshold."""
+    check_metric_at_thresholds(
+        ThresholdCurve(y_true, y_scores), metric, thresholds, min_score
+    )
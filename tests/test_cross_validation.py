@@ -1,15 +1,32 @@
+import numpy as np
+import pandas as pd
 import pytest
+import scipy.sparse as sp
 from sklearn.datasets import make_classification
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.model_selection import (
+    KFold,
+    ShuffleSplit,
+    TimeSeriesSplit,
+    cross_val_score,
+)
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import FunctionTransformer
 
 from ml_assert.model.cross_validation import (
     CrossValidationError,
+    CVSession,
+    _compute_cv_folds,
+    _compute_cv_metrics,
+    _resolve_n_jobs,
     assert_cv_accuracy_score,
     assert_cv_f1_score,
+    assert_cv_incremental_score,
     assert_cv_precision_score,
     assert_cv_recall_score,
     assert_cv_roc_auc_score,
+    assert_cv_scores,
     get_cv_summary,
 )
 
@@ -124,6 +141,12 @@ def test_invalid_inputs(sample_data):
     with pytest.raises(CrossValidationError):
         assert_cv_accuracy_score(LogisticRegression(), X, y, min_score=0.5, n_splits=1)
 
+    # Test misspelled options
+    with pytest.raises(TypeError):
+        assert_cv_accuracy_score(LogisticRegression(), X, y, min_score=0.5, njobs=2)
+    with pytest.raises(TypeError):
+        get_cv_summary(LogisticRegression(), X, y, njobs=2)
+
 
 def test_cv_summary(sample_data, sample_model):
     """Test cross-validation summary function."""
@@ -162,3 +185,313 @@ def test_parallel_processing(sample_data, sample_model):
     # Test with different numbers of splits to ensure parallel processing works
     for n_splits in [2, 5, 10]:
         assert_cv_accuracy_score(sample_model, X, y, min_score=0.5, n_splits=n_splits)
+
+
+def test_cv_summary_matches_cross_val_score(sample_data, sample_model):
+    """Test that the single-fit summary matches per-metric cross_val_score runs."""
+    X, y = sample_data
+    summary = get_cv_summary(sample_model, X, y)
+    cv = KFold(n_splits=5, shuffle=True, random_state=42)
+    for metric in ["accuracy", "precision", "recall", "f1", "roc_auc"]:
+        expected = cross_val_score(sample_model, X, y, cv=cv, scoring=metric)
+        assert summary[metric]["mean"] == pytest.approx(np.mean(expected))
+        assert summary[metric]["std"] == pytest.approx(np.std(expected))
+
+
+def test_cv_summary_isolates_metric_failures():
+    """Test that one failing metric does not discard the others."""
+    X, y = make_classification(
+        n_samples=150, n_informative=6, n_classes=3, random_state=42
+    )
+    with pytest.warns(UserWarning, match="Could not compute roc_auc"):
+        summary = get_cv_summary(LogisticRegression(max_iter=500), X, y)
+    assert summary["roc_auc"] is None
+    assert summary["accuracy"]["mean"] > 0.5
+
+
+def test_cv_folds_drop_estimators_unless_needed(sample_data, sample_model):
+    """Test that fitted fold estimators are kept only for sessions and callables."""
+    X, y = sample_data
+    folds, _ = _compute_cv_folds(sample_model, X, y, "kfold", 5, need_scores=True)
+    assert all(fold["estimator"] is None for fold in folds)
+
+    session = CVSession()
+    folds, _ = _compute_cv_folds(
+        sample_model, X, y, "kfold", 5, need_scores=False, session=session
+    )
+    assert all(fold["estimator"] is not None for fold in folds)
+
+    def n_coefs(estimator, X_test, y_test):
+        return float(estimator.coef_.size)
+
+    results = _compute_cv_metrics(sample_model, X, y, "kfold", 5, [n_coefs])
+    assert results[n_coefs]["mean_score"] == 20.0
+
+
+def test_assert_cv_scores(sample_data, sample_model):
+    """Test asserting several metrics from one cross-validation run."""
+    X, y = sample_data
+    results = assert_cv_scores(
+        sample_model, X, y, {"accuracy": 0.5, "f1": 0.5, "roc_auc": 0.5}
+    )
+    assert set(results) == {"accuracy", "f1", "roc_auc"}
+
+    with pytest.raises(AssertionError, match="f1 .* below the minimum threshold 1.0"):
+        assert_cv_scores(sample_model, X, y, {"accuracy": 0.5, "f1": 1.0})
+
+    with pytest.raises(CrossValidationError, match="Unknown metric"):
+        assert_cv_scores(sample_model, X, y, {"balanced_accuracy": 0.5})
+
+
+def test_cv_early_stop_fails_fast(sample_data, sample_model):
+    """Test that an unreachable threshold stops after the first decisive folds."""
+    X, y = sample_data
+    with pytest.raises(AssertionError, match="stopped early after 1 of 10 folds"):
+        assert_cv_accuracy_score(
+            sample_model, X, y, min_score=0.99, n_splits=10, early_stop=True
+        )
+
+
+def test_cv_early_stop_passes_early(sample_data, sample_model):
+    """Test that a guaranteed pass stops before running every fold."""
+    X, y = sample_data
+    results = assert_cv_accuracy_score(
+        sample_model, X, y, min_score=0.3, n_splits=10, early_stop=True, wave_size=2
+    )
+    assert results["n_folds"] == 10
+    assert results["n_folds_run"] < 10
+    assert results["n_folds_run"] % 2 == 0
+
+
+def test_cv_early_stop_matches_full_run(sample_data, sample_model):
+    """Test that undecided runs evaluate every fold and agree with a full run."""
+    X, y = sample_data
+    full = assert_cv_f1_score(sample_model, X, y, min_score=0.5)
+    early = assert_cv_f1_score(sample_model, X, y, min_score=0.5, early_stop=True)
+    assert full["n_folds_run"] == 5
+    assert early["n_folds_run"] <= 5
+    np.testing.assert_allclose(early["scores"], full["scores"][: early["n_folds_run"]])
+
+    with pytest.raises(AssertionError, match="stopped early"):
+        assert_cv_scores(
+            sample_model,
+            X,
+            y,
+            {"accuracy": 0.3, "roc_auc": 0.999},
+            n_splits=10,
+            early_stop=True,
+        )
+
+
+def test_cv_session_reuses_fits(sample_data, sample_model):
+    """Test that a shared session fits each fold once across assertions."""
+    X, y = sample_data
+    session = CVSession()
+    f1 = assert_cv_f1_score(sample_model, X, y, min_score=0.5, session=session)
+    assert session.n_fits == 5
+    auc = assert_cv_roc_auc_score(sample_model, X, y, min_score=0.5, session=session)
+    summary = get_cv_summary(sample_model, X, y, session=session)
+    assert session.n_fits == 5
+    assert len(session) == 1
+    assert summary["f1"]["mean"] == pytest.approx(f1["mean_score"])
+    assert summary["roc_auc"]["mean"] == pytest.approx(auc["mean_score"])
+
+    # A different model, splitter or dataset is a new entry.
+    assert_cv_f1_score(sample_model, X, y, min_score=0.5, n_splits=3, session=session)
+    assert_cv_f1_score(LogisticRegression(C=0.1), X, y, min_score=0.5, session=session)
+    assert session.n_fits == 13
+    assert len(session) == 3
+
+
+def test_cv_session_disk_cache(sample_data, sample_model, tmp_path):
+    """Test that fold estimators persisted on disk are reused for scoring."""
+    X, y = sample_data
+    session = CVSession(cache_dir=tmp_path)
+    acc = assert_cv_accuracy_score(sample_model, X, y, min_score=0.5, session=session)
+    assert len(list(tmp_path.glob("*.joblib"))) == 5
+    auc = assert_cv_roc_auc_score(sample_model, X, y, min_score=0.5, session=session)
+    assert session.n_fits == 5
+    expected = cross_val_score(
+        sample_model,
+        X,
+        y,
+        cv=KFold(5, shuffle=True, random_state=42),
+        scoring="roc_auc",
+    )
+    np.testing.assert_allclose(auc["scores"], expected)
+    assert acc["n_folds_run"] == 5
+
+    session.clear()
+    assert len(session) == 0
+    assert not list(tmp_path.glob("*.joblib"))
+
+
+def test_cv_parallel_options(sample_data, sample_model):
+    """Test that backend, n_jobs and thread caps do not change the scores."""
+    X, y = sample_data
+    default = assert_cv_f1_score(sample_model, X, y, min_score=0.5)
+    threaded = assert_cv_f1_score(
+        sample_model,
+        X,
+        y,
+        min_score=0.5,
+        n_jobs=2,
+        backend="threading",
+        pre_dispatch="n_jobs",
+        max_threads=1,
+    )
+    sequential = get_cv_summary(sample_model, X, y, n_jobs=1, max_threads=1)
+    np.testing.assert_allclose(threaded["scores"], default["scores"])
+    assert sequential["f1"]["mean"] == pytest.approx(default["mean_score"])
+
+    with pytest.raises(CrossValidationError, match="n_jobs must be"):
+        assert_cv_f1_score(sample_model, X, y, min_score=0.5, n_jobs=0)
+
+
+def test_resolve_n_jobs_uses_available_cpus(monkeypatch):
+    """Test that the automatic worker count follows joblib's cgroup-aware cpu_count."""
+    monkeypatch.setattr("joblib.cpu_count", lambda: 3)
+    assert _resolve_n_jobs(None, 10) == 3
+    assert _resolve_n_jobs(None, 2) == 2
+    assert _resolve_n_jobs(-1, 10) == 3
+    assert _resolve_n_jobs(-2, 10) == 2
+    assert _resolve_n_jobs(-10, 10) == 1
+    assert _resolve_n_jobs(8, 5) == 5
+
+
+def test_cv_additional_splitters(sample_data, sample_model):
+    """Test repeated, grouped, time-series and subsampled leave-one-out splits."""
+    X, y = sample_data
+    repeated = assert_cv_accuracy_score(
+        sample_model, X, y, min_score=0.5, cv_type="repeated_stratified", n_repeats=2
+    )
+    assert repeated["n_folds"] == 10
+
+    timeseries = assert_cv_accuracy_score(
+        sample_model, X, y, min_score=0.5, cv_type="timeseries", n_splits=4
+    )
+    expected = cross_val_score(sample_model, X, y, cv=TimeSeriesSplit(4))
+    np.testing.assert_allclose(timeseries["scores"], expected)
+
+    groups = np.arange(len(y)) // 10
+    grouped = assert_cv_accuracy_score(
+        sample_model, X, y, min_score=0.5, cv_type="group_kfold", groups=groups
+    )
+    assert grouped["n_folds"] == 5
+    with pytest.raises(CrossValidationError, match="groups must be provided"):
+        assert_cv_accuracy_score(sample_model, X, y, 0.5, cv_type="group_kfold")
+
+    loo = assert_cv_accuracy_score(
+        sample_model, X, y, min_score=0.5, cv_type="loo_subsample", n_splits=12
+    )
+    assert loo["n_folds"] == 12
+    assert set(loo["scores"]) <= {0.0, 1.0}
+
+    custom = ShuffleSplit(n_splits=3, test_size=0.25, random_state=0)
+    results = assert_cv_accuracy_score(sample_model, X, y, 0.5, cv_type=custom)
+    np.testing.assert_allclose(
+        results["scores"], cross_val_score(sample_model, X, y, cv=custom)
+    )
+
+
+def test_cv_memmapped_workers(sample_data, sample_model):
+    """Test that process workers sharing memory-mapped data give the same scores."""
+    X, y = sample_data
+    default = assert_cv_f1_score(sample_model, X, y, min_score=0.5, n_jobs=1)
+    shared = assert_cv_f1_score(
+        sample_model, X, y, min_score=0.5, n_jobs=2, backend="loky", max_nbytes=0
+    )
+    np.testing.assert_allclose(shared["scores"], default["scores"])
+
+
+def _require_sparse(X):
+    assert sp.issparse(X), "X was densified"
+    return X
+
+
+def test_cv_dataframe_and_sparse_inputs(sample_data, sample_model):
+    """Test that DataFrames and sparse matrices reach the estimator unchanged."""
+    X, y = sample_data
+    dense = assert_cv_f1_score(sample_model, X, y, min_score=0.5)
+
+    frame = pd.DataFrame(X, columns=[f"f{i}" for i in range(X.shape[1])])
+    from_frame = assert_cv_f1_score(sample_model, frame, pd.Series(y), min_score=0.5)
+    np.testing.assert_allclose(from_frame["scores"], dense["scores"])
+
+    sparse_model = make_pipeline(
+        FunctionTransformer(_require_sparse, accept_sparse=True),
+        LogisticRegression(random_state=42),
+    )
+    from_sparse = assert_cv_roc_auc_score(
+        sparse_model, sp.csr_matrix(X), y, min_score=0.5, backend="threading"
+    )
+    assert from_sparse["n_folds_run"] == 5
+
+    # COO matrices cannot be row-indexed and are converted to CSR once.
+    from_coo = assert_cv_roc_auc_score(sparse_model, sp.coo_matrix(X), y, min_score=0.5)
+    np.testing.assert_allclose(from_coo["scores"], from_sparse["scores"])
+    incremental = assert_cv_incremental_score(
+        SGDClassifier(random_state=0), sp.coo_array(X), y, min_score=0.5
+    )
+    from_csr = assert_cv_incremental_score(
+        SGDClassifier(random_state=0), sp.csr_array(X), y, min_score=0.5
+    )
+    np.testing.assert_allclose(incremental["scores"], from_csr["scores"])
+
+    with pytest.raises(CrossValidationError, match="y must be"):
+        assert_cv_f1_score(sample_model, frame, list(y), min_score=0.5)
+
+
+def test_cv_arrow_backed_dataframe(sample_data, sample_model):
+    """Test Arrow-backed DataFrames are indexed per fold without conversion."""
+    pytest.importorskip("pyarrow", exc_type=ImportError)
+    X, y = sample_data
+    frame = pd.DataFrame(X).convert_dtypes(dtype_backend="pyarrow")
+    frame.columns = [f"f{i}" for i in range(X.shape[1])]
+    results = assert_cv_f1_score(sample_model, frame, y, min_score=0.5)
+    expected = assert_cv_f1_score(sample_model, X, y, min_score=0.5)
+    np.testing.assert_allclose(results["scores"], expected["scores"])
+
+
+def test_cv_incremental_learning_curves(sample_data, tmp_path):
+    """Test mini-batch partial_fit CV against a manually streamed model."""
+    X, y = sample_data
+    path = tmp_path / "X.npy"
+    np.save(path, X)
+    X_mmap = np.load(path, mmap_mode="r")
+    model = SGDClassifier(random_state=0)
+    results = assert_cv_incremental_score(
+        model, X_mmap, y, min_score=0.5, batch_size=16, n_epochs=2, eval_every=2
+    )
+    # 80 training rows -> 5 batches per epoch, 10 in total, scored every 2.
+    assert [len(curve) for curve in results["learning_curves"]] == [5] * 5
+    assert results["n_samples_seen"][0].tolist() == [32, 64, 96, 128, 160]
+
+    train, test = next(KFold(5, shuffle=True, random_state=42).split(X))
+    manual = SGDClassifier(random_state=0)
+    for _ in range(2):
+        for start in range(0, len(train), 16):
+            batch = train[start : start + 16]
+            manual.partial_fit(X[batch], y[batch], classes=np.unique(y))
+    assert results["scores"][0] == pytest.approx(manual.score(X[test], y[test]))
+    assert results["learning_curves"][0][-1] == results["scores"][0]
+
+    # By default the test fold is scored once per epoch.
+    per_epoch = assert_cv_incremental_score(
+        model, X_mmap, y, min_score=0.5, batch_size=16, n_epochs=2
+    )
+    assert per_epoch["n_samples_seen"][0].tolist() == [80, 160]
+    np.testing.assert_allclose(per_epoch["scores"], results["scores"])
+
+
+def test_cv_incremental_errors(sample_data, sample_model):
+    """Test incremental CV input validation and failing thresholds."""
+    X, y = sample_data
+    with pytest.raises(CrossValidationError, match="partial_fit"):
+        assert_cv_incremental_score(sample_model, X, y, min_score=0.5)
+    with pytest.raises(CrossValidationError, match="batch_size"):
+        assert_cv_incremental_score(SGDClassifier(), X, y, 0.5, batch_size=0)
+    with pytest.raises(AssertionError, match="Mean incremental roc_auc score"):
+        assert_cv_incremental_score(
+            SGDClassifier(random_state=0), X, y, min_score=1.01, scoring="roc_auc"
+        )
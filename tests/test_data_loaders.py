@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from ml_assert.data.loaders import load_array
+
+VALUES = np.array([0.1, 0.9, 0.4, 0.2, 0.8])
+
+
+def test_load_npy_is_memory_mapped(tmp_path):
+    """Test that .npy files are memory-mapped rather than read into memory."""
+    path = tmp_path / "scores.npy"
+    np.save(path, VALUES)
+    arr = load_array(path)
+    assert isinstance(arr, np.memmap)
+    np.testing.assert_array_equal(arr, VALUES)
+
+
+def test_load_raw_binary(tmp_path):
+    """Test memory-mapped raw binary files with an explicit dtype."""
+    path = tmp_path / "scores.bin"
+    VALUES.astype(np.float32).tofile(path)
+    arr = load_array({"path": str(path), "dtype": "float32"})
+    assert isinstance(arr, np.memmap)
+    assert arr.dtype == np.float32
+    np.testing.assert_allclose(arr, VALUES, rtol=1e-6)
+
+
+def test_load_text_fallback(tmp_path):
+    """Test that unknown suffixes fall back to np.loadtxt."""
+    path = tmp_path / "scores.csv"
+    np.savetxt(path, VALUES)
+    np.testing.assert_allclose(load_array(str(path)), VALUES)
+
+
+def test_load_dat_is_text(tmp_path):
+    """Test that .dat files, commonly text, are parsed rather than memory-mapped."""
+    path = tmp_path / "scores.dat"
+    np.savetxt(path, VALUES)
+    arr = load_array(path)
+    assert not isinstance(arr, np.memmap)
+    np.testing.assert_allclose(arr, VALUES)
+
+
+def test_load_arrow_and_parquet(tmp_path):
+    """Test loading columns from Arrow IPC and Parquet files."""
+    pa = pytest.importorskip("pyarrow", exc_type=ImportError)
+    import pyarrow.parquet as pq
+
+    table = pa.table({"score": VALUES, "label": [0, 1, 0, 0, 1]})
+    arrow_path = tmp_path / "preds.arrow"
+    with (
+        pa.OSFile(str(arrow_path), "wb") as sink,
+        pa.ipc.new_file(sink, table.schema) as writer,
+    ):
+        writer.write_table(table)
+    parquet_path = tmp_path / "preds.parquet"
+    pq.write_table(table, parquet_path)
+
+    for path in (arrow_path, parquet_path):
+        np.testing.assert_array_equal(
+            load_array({"path": str(path), "column": "score"}), VALUES
+        )
+        with pytest.raises(ValueError, match="specify which one"):
+            load_array(str(path))
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from scipy.stats import wasserstein_distance
+
+from ml_assert.fairness.attribution import (
+    AttributionProfile,
+    assert_attribution_distance,
+    assert_attribution_rank_correlation,
+)
+
+RNG = np.random.default_rng(0)
+FEATURES = ["age", "income", "tenure", "region"]
+BASELINE = RNG.normal(size=(2000, 4)) * [4.0, 3.0, 2.0, 1.0]
+
+
+def test_profile_summarizes_values():
+    """Test importance and quantiles of a profile, including multiclass input."""
+    profile = AttributionProfile.from_shap_values(BASELINE, FEATURES)
+    np.testing.assert_allclose(profile.mean_abs, np.abs(BASELINE).mean(axis=0))
+    assert profile.quantiles.shape == (4, 101)
+    assert profile.importance().index.tolist() == FEATURES
+    np.testing.assert_allclose(profile.quantiles[:, -1], BASELINE.max(axis=0))
+
+    multiclass = np.stack([BASELINE, -BASELINE], axis=-1)
+    pooled = AttributionProfile.from_shap_values(multiclass, FEATURES)
+    assert pooled.n_samples == 4000
+    np.testing.assert_allclose(pooled.mean_abs, profile.mean_abs)
+    with pytest.raises(ValueError, match="4 feature columns"):
+        AttributionProfile.from_shap_values(BASELINE[:, :3], FEATURES)
+
+
+def test_profile_save_and_load(tmp_path):
+    """Test that a saved profile round-trips without pickling."""
+    profile = AttributionProfile.from_shap_values(BASELINE, FEATURES, n_quantiles=11)
+    path = tmp_path / "profile.npz"
+    profile.save(path)
+    loaded = AttributionProfile.load(path)
+    assert loaded.feature_names == FEATURES
+    assert loaded.n_samples == 2000
+    np.testing.assert_array_equal(loaded.quantiles, profile.quantiles)
+
+
+def test_profile_comparisons():
+    """Test rank correlation and quantile-based Wasserstein distances."""
+    baseline = AttributionProfile.from_shap_values(BASELINE, FEATURES)
+    shifted = BASELINE + [0.0, 0.0, 0.0, 0.5]
+    candidate = AttributionProfile.from_shap_values(shifted, FEATURES)
+    assert baseline.rank_correlation(candidate) == 1.0
+
+    distances = baseline.distances(candidate)
+    assert distances.index[0] == "region"
+    assert distances["region"] == pytest.approx(0.5, abs=0.01)
+    assert distances["age"] == pytest.approx(0.0)
+    exact = wasserstein_distance(BASELINE[:, 3], shifted[:, 3])
+    assert distances["region"] == pytest.approx(exact, rel=0.05)
+
+    # Features are matched by name and coarser grids are interpolated.
+    reordered = AttributionProfile.from_shap_values(
+        BASELINE[:, ::-1], FEATURES[::-1], n_quantiles=51
+    )
+    assert baseline.rank_correlation(reordered) == 1.0
+    assert baseline.distances(reordered).max() < 0.05
+    with pytest.raises(ValueError, match="different features"):
+        baseline.distances(
+            AttributionProfile.from_shap_values(BASELINE, ["a", "b", "c", "d"])
+        )
+
+
+def test_attribution_assertions():
+    """Test the rank-correlation and distance drift assertions."""
+    baseline = AttributionProfile.from_shap_values(BASELINE, FEATURES)
+    swapped = AttributionProfile.from_shap_values(BASELINE[:, ::-1], FEATURES)
+    assert_attribution_rank_correlation(baseline, baseline, min_correlation=0.99)
+    assert_attribution_distance(baseline, baseline, max_distance=0.0)
+    with pytest.raises(AssertionError, match="rank correlation -1.0000 is below"):
+        assert_attribution_rank_correlation(baseline, swapped, min_correlation=0.5)
+    with pytest.raises(AssertionError, match="feature 'age'"):
+        assert_attribution_distance(baseline, swapped, max_distance=0.1)
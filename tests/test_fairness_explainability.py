@@ -1,7 +1,17 @@
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+import pytest
+from matplotlib.figure import Figure
+from sklearn.linear_model import LinearRegression
+from sklearn.tree import DecisionTreeRegressor
 
-from ml_assert.fairness.explainability import ModelExplainer
+from ml_assert.fairness.attribution import AttributionProfile
+from ml_assert.fairness.explainability import ModelExplainer, summarize_background
 
 
 class MockModel:
@@ -12,6 +22,14 @@ class MockModel:
         return self.predict(X)
 
 
+class PickleCountingModel(MockModel):
+    pickles = 0
+
+    def __getstate__(self):
+        type(self).pickles += 1
+        return self.__dict__
+
+
 def test_model_explainer():
     """Test that the ModelExplainer generates SHAP values correctly."""
     model = MockModel()
@@ -20,3 +38,228 @@ def test_model_explainer():
     result = explainer.explain(X)
     assert "shap_values" in result
     assert result["shap_values"].shape == (10, 5)
+
+
+def test_model_explainer_caches_shap_values():
+    """Test that SHAP values are computed once per input and evicted by LRU."""
+    X = pd.DataFrame(np.random.rand(10, 3), columns=["A", "B", "C"])
+    X2 = X + 1
+    explainer = ModelExplainer(MockModel(), feature_names=X.columns, cache_size=1)
+    calls = []
+    compute = explainer.explainer
+    explainer.explainer = lambda data: calls.append(len(data)) or compute(data)
+
+    explainer.explain(X)
+    explainer.get_feature_importance(X)
+    explainer.analyze_interactions(X)
+    assert len(calls) == 1
+
+    explainer.explain(X2)  # evicts X
+    explainer.explain(X)
+    assert len(calls) == 3
+
+    explainer.clear_cache()
+    explainer.explain(X)
+    assert len(calls) == 4
+
+
+def test_model_explainer_batched_matches_single_call(tmp_path):
+    """Test that batched explanation fills the same values, in memory or on disk."""
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.random((25, 3)), columns=["A", "B", "C"])
+    model = LinearRegression().fit(X, X.to_numpy() @ [1.0, -2.0, 0.5])
+    explainer = ModelExplainer(
+        model.predict, background=X, background_size=5, random_state=0, cache_size=0
+    )
+    expected = explainer.explain(X)["shap_values"]
+    assert np.abs(expected).min() > 0
+
+    batched = explainer.explain(X, batch_size=7)["shap_values"]
+    np.testing.assert_allclose(batched, expected)
+
+    path = tmp_path / "shap_values.npy"
+    result = explainer.explain(X, batch_size=10, n_jobs=2, output_path=path)
+    assert isinstance(result["shap_values"], np.memmap)
+    np.testing.assert_allclose(np.load(path), expected)
+
+    # Worker processes must keep shap's identity link: a constant model
+    # explained there gave NaN instead of zeros.
+    constant = ModelExplainer(MockModel(), feature_names=X.columns, cache_size=0)
+    values = constant.explain(X, batch_size=10, n_jobs=2)["shap_values"]
+    np.testing.assert_array_equal(values, 0.0)
+
+
+def test_model_explainer_batches_pickle_model_once():
+    """Test that worker processes get the explainer once, not once per batch."""
+    X = pd.DataFrame(np.random.rand(25, 3), columns=["A", "B", "C"])
+    explainer = ModelExplainer(PickleCountingModel(), feature_names=X.columns)
+    PickleCountingModel.pickles = 0
+
+    values = explainer.explain(X, batch_size=2, n_jobs=2)["shap_values"]
+    np.testing.assert_array_equal(values, 0.0)
+    assert PickleCountingModel.pickles == 1
+
+
+def test_summarize_background():
+    """Test k-means and stratified background summarization."""
+    data = pd.DataFrame(np.random.rand(300, 3), columns=["A", "B", "C"])
+    labels = np.r_[np.zeros(240), np.ones(60)]
+
+    centroids = summarize_background(data, size=10, random_state=0)
+    assert centroids.shape == (10, 3)
+    assert list(centroids.columns) == ["A", "B", "C"]
+
+    # A spread-out minority draws most centroids; repeating them by cluster
+    # size keeps the dense majority's share of the background.
+    rng = np.random.default_rng(0)
+    blobs = pd.DataFrame(
+        np.r_[rng.normal(0, 0.1, (270, 2)), rng.normal(10, 3, (30, 2))],
+        columns=["A", "B"],
+    )
+    weighted = summarize_background(blobs, size=10, random_state=0)
+    assert weighted.shape == (10, 2)
+    assert (weighted["A"] > 5).sum() == 1
+    np.testing.assert_allclose(weighted.mean(), blobs.mean(), atol=0.5)
+    with pytest.raises(ValueError, match="stratify is only supported"):
+        summarize_background(data, size=10, stratify=labels)
+
+    sample = summarize_background(
+        data, size=50, method="sample", stratify=labels, random_state=0
+    )
+    assert len(sample) == 50
+    assert labels[sample.index].mean() == 0.2
+    assert summarize_background(data.head(5), size=10).shape == (5, 3)
+    with pytest.raises(ValueError, match="method must be one of"):
+        summarize_background(data, method="median")
+
+
+def test_model_explainer_background():
+    """Test that the explainer keeps the summarized background as its masker."""
+    data = pd.DataFrame(np.random.rand(200, 3), columns=["A", "B", "C"])
+    explainer = ModelExplainer(
+        MockModel(), background=data, background_size=20, random_state=0
+    )
+    assert list(explainer.feature_names) == ["A", "B", "C"]
+    assert explainer.background.shape == (20, 3)
+    assert explainer.explain(data.head(5))["shap_values"].shape == (5, 3)
+
+
+def test_interaction_strengths_match_pairwise_loop():
+    """Test the matrix-product interactions against the per-pair definition."""
+    X = pd.DataFrame(np.random.rand(40, 4), columns=["A", "B", "C", "D"])
+    explainer = ModelExplainer(MockModel(), feature_names=X.columns)
+    values = explainer.explain(X)["shap_values"]
+    expected = {
+        (a, b): np.abs(values[:, i] * values[:, j]).mean()
+        for i, a in enumerate(X.columns)
+        for j, b in enumerate(X.columns)
+        if i < j
+    }
+
+    top = explainer.analyze_interactions(X, top_n=3)
+    assert [pair[2] for pair in top] == pytest.approx(
+        sorted(expected.values(), reverse=True)[:3]
+    )
+    for a, b, strength in top:
+        assert strength == pytest.approx(expected[(a, b)])
+    assert len(explainer.analyze_interactions(X, top_n=10)) == 6
+
+
+def test_interaction_strengths_multiclass():
+    """Test that 3-D multiclass SHAP values are averaged over classes."""
+    X = pd.DataFrame(np.random.rand(20, 3), columns=["A", "B", "C"])
+    explainer = ModelExplainer(MockModel(), feature_names=X.columns)
+    values = np.random.rand(20, 3, 2)
+    explainer.explainer = lambda data: SimpleNamespace(values=values)
+
+    strengths = explainer.interaction_strengths(X)
+    expected = np.mean(
+        [np.abs(values[:, :, c]).T @ np.abs(values[:, :, c]) / 20 for c in range(2)],
+        axis=0,
+    )
+    np.testing.assert_allclose(strengths.to_numpy(), expected)
+    assert len(explainer.analyze_interactions(X, top_n=2)) == 2
+
+
+def test_tree_interaction_values():
+    """Test TreeSHAP interaction strengths and the error for other models."""
+    X = pd.DataFrame(np.random.rand(50, 3), columns=["A", "B", "C"])
+    y = X["A"] * X["B"] + X["C"]
+    model = DecisionTreeRegressor(max_depth=4, random_state=0).fit(X, y)
+    explainer = ModelExplainer(model, background=X, background_size=10)
+
+    strengths = explainer.interaction_strengths(X, tree_interactions=True)
+    assert strengths.shape == (3, 3)
+    np.testing.assert_allclose(strengths.to_numpy(), strengths.to_numpy().T)
+    assert len(explainer.analyze_interactions(X, tree_interactions=True)) == 3
+
+    with pytest.raises(ValueError, match="tree_interactions requires"):
+        ModelExplainer(MockModel(), feature_names=X.columns).interaction_strengths(
+            X, tree_interactions=True
+        )
+
+
+def test_explanation_report_renders_plots_in_parallel(tmp_path):
+    """Test headless parallel plot rendering with a custom format and downsampling."""
+    X = pd.DataFrame(np.random.rand(30, 4), columns=["A", "B", "C", "D"])
+    explainer = ModelExplainer(MockModel(), feature_names=X.columns)
+    explainer.save_explanation_report(
+        X, tmp_path, dpi=50, plot_format="svg", max_points=10, n_jobs=2
+    )
+    plots = sorted(p.name for p in tmp_path.glob("*.svg"))
+    assert len(plots) == 4
+    assert "summary_plot.svg" in plots
+
+    no_plots = tmp_path / "no_plots"
+    explainer.save_explanation_report(X, no_plots, include_plots=False)
+    assert sorted(p.suffix for p in no_plots.iterdir()) == [
+        ".csv",
+        ".csv",
+        ".npy",
+        ".npz",
+    ]
+
+
+def test_plot_without_output_path_returns_figure():
+    """Test that plots are returned instead of shown when no path is given."""
+    X = pd.DataFrame(np.random.rand(30, 3), columns=["A", "B", "C"])
+    explainer = ModelExplainer(MockModel(), feature_names=X.columns)
+    for fig in (
+        explainer.plot_dependence(X, "A", max_points=10),
+        explainer.plot_summary(X, output_path=None),
+    ):
+        assert isinstance(fig, Figure)
+        plt.close(fig)
+
+
+def test_import_does_not_load_shap_or_pyplot():
+    """Test that importing the module defers shap, which loads pyplot."""
+    code = (
+        "import sys, ml_assert.fairness.explainability; "
+        "print('shap' in sys.modules, 'matplotlib.pyplot' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_attribution_profile_from_explainer(tmp_path):
+    """Test that the report saves a profile matching the explainer's values."""
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.random((30, 3)), columns=["A", "B", "C"])
+    model = LinearRegression().fit(X, X.to_numpy() @ [1.0, -4.0, 0.25])
+    explainer = ModelExplainer(
+        model.predict, background=X, background_size=10, random_state=0
+    )
+    explainer.save_explanation_report(X, tmp_path, include_plots=False)
+
+    profile = AttributionProfile.load(tmp_path / "attribution_profile.npz")
+    values = explainer.explain(X)["shap_values"]
+    np.testing.assert_allclose(profile.mean_abs, np.abs(values).mean(axis=0))
+    assert list(profile.importance().index) == ["B", "A", "C"]
+
+    fresh = explainer.attribution_profile(X)
+    np.testing.assert_allclose(profile.quantiles, fresh.quantiles)
+    assert profile.rank_correlation(fresh) == pytest.approx(1.0)
+    assert profile.distances(fresh).max() == pytest.approx(0.0)
@@ -1,6 +1,16 @@
+from unittest.mock import patch
+
 import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import confusion_matrix
 
-from ml_assert.fairness.fairness import FairnessMetrics
+from ml_assert.fairness.fairness import (
+    FairnessAccumulator,
+    FairnessMetrics,
+    check_fairness,
+)
+from ml_assert.integrations.prometheus import PrometheusExporter
 
 
 def test_fairness_metrics():
@@ -11,3 +21,287 @@ def test_fairness_metrics():
     metrics = FairnessMetrics(y_true, y_pred, sensitive_attribute)
     assert metrics.demographic_parity() == 0.3333333333333333
     assert metrics.equal_opportunity() == 0.5
+
+
+def test_fairness_metrics_reject_non_binary_predictions():
+    """Test that probabilities are rejected rather than read as negatives."""
+    y_true = np.array([1, 0, 1, 0, 1, 0])
+    y_prob = np.array([0.9, 0.8, 0.7, 0.1, 0.2, 0.1])
+    sensitive_attribute = np.array([0, 0, 0, 1, 1, 1])
+    metrics = FairnessMetrics(y_true, y_prob, sensitive_attribute)
+    with pytest.raises(ValueError, match="y_pred must contain only binary"):
+        metrics.demographic_parity()
+    acc = FairnessAccumulator()
+    with pytest.raises(ValueError, match="y_pred must contain only binary"):
+        acc.update(y_true, y_prob, sensitive_attribute, timestamp=0.0)
+    assert len(acc.groups) == 0
+
+    thresholded = FairnessMetrics(y_true, y_prob >= 0.5, sensitive_attribute)
+    assert thresholded.demographic_parity() == 1.0
+
+
+def test_fairness_metrics_many_groups():
+    """Test the bincount rates against a per-group loop with many groups."""
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=20_000)
+    y_pred = rng.integers(0, 2, size=20_000)
+    zip_codes = rng.integers(10_000, 15_000, size=20_000)
+    metrics = FairnessMetrics(y_true, y_pred, zip_codes)
+
+    selection = [y_pred[zip_codes == g].mean() for g in metrics.groups]
+    tprs = [
+        y_pred[(zip_codes == g) & (y_true == 1)].mean()
+        for g in metrics.groups
+        if ((zip_codes == g) & (y_true == 1)).any()
+    ]
+    assert metrics.demographic_parity() == pytest.approx(
+        max(selection) - min(selection)
+    )
+    assert metrics.equal_opportunity() == pytest.approx(max(tprs) - min(tprs))
+    assert metrics._group_codes() is metrics._group_codes()
+
+
+def test_fairness_metrics_string_groups():
+    """Test string-valued sensitive attributes."""
+    metrics = FairnessMetrics(
+        np.array([1, 1, 0, 1]),
+        np.array([1, 0, 0, 1]),
+        np.array(["a", "b", "b", "c"]),
+    )
+    assert metrics.groups.tolist() == ["a", "b", "c"]
+    assert metrics.demographic_parity() == 1.0
+    assert metrics.equal_opportunity() == 1.0
+
+
+def test_intersectional_groups():
+    """Test combined codes over several attributes against a tuple-keyed loop."""
+    rng = np.random.default_rng(1)
+    n = 5_000
+    gender = rng.choice(["f", "m"], size=n)
+    age = rng.integers(0, 5, size=n)
+    region = rng.choice(["n", "s", "e", "w"], size=n)
+    y_true = rng.integers(0, 2, size=n)
+    y_pred = rng.integers(0, 2, size=n)
+    metrics = FairnessMetrics(y_true, y_pred, [gender, age, region])
+
+    keys = list(zip(gender, age.tolist(), region, strict=True))
+    expected_groups = sorted(set(keys))
+    assert metrics.groups.tolist() == expected_groups
+    assert metrics.group_sizes.sum() == n
+
+    def rates(mask):
+        out = []
+        for group in expected_groups:
+            selected = [
+                p
+                for k, p, m in zip(keys, y_pred, mask, strict=True)
+                if k == group and m
+            ]
+            out.append(np.mean(selected))
+        return max(out) - min(out)
+
+    assert metrics.demographic_parity() == pytest.approx(rates(np.ones(n, bool)))
+    assert metrics.equalized_odds() == pytest.approx(
+        max(rates(y_true == 1), rates(y_true == 0))
+    )
+
+    frame = pd.DataFrame({"gender": gender, "age": age, "region": region})
+    from_frame = FairnessMetrics(y_true, y_pred, frame)
+    assert from_frame.demographic_parity() == metrics.demographic_parity()
+
+
+def test_min_group_size():
+    """Test that small groups are excluded from the gaps."""
+    y_true = np.array([1, 0, 1, 0, 1])
+    y_pred = np.array([1, 0, 1, 0, 0])
+    attr = np.column_stack([[0, 0, 1, 1, 2], [0, 0, 0, 0, 1]])
+    assert FairnessMetrics(y_true, y_pred, attr).demographic_parity() == 0.5
+    assert (
+        FairnessMetrics(y_true, y_pred, attr, min_group_size=2).demographic_parity()
+        == 0.0
+    )
+    with pytest.raises(ValueError, match="min_group_size"):
+        FairnessMetrics(y_true, y_pred, attr, min_group_size=0)
+
+
+def test_extended_metrics_from_confusion_tensor():
+    """Test every metric against sklearn per-group confusion matrices."""
+    rng = np.random.default_rng(2)
+    n = 3_000
+    y_true = rng.integers(0, 2, size=n)
+    y_pred = np.where(rng.random(n) < 0.7, y_true, 1 - y_true)
+    y_scores = np.clip(y_pred * 0.6 + rng.random(n) * 0.4, 0, 1)
+    attr = rng.integers(0, 7, size=n)
+    metrics = FairnessMetrics(y_true, y_pred, attr, y_scores=y_scores)
+
+    tpr, fpr, ppv, sel, calib = [], [], [], [], []
+    for g in range(7):
+        m = attr == g
+        tn, fp, fn, tp = confusion_matrix(y_true[m], y_pred[m], labels=[0, 1]).ravel()
+        np.testing.assert_array_equal(metrics.confusion_tensor[g], [[tn, fp], [fn, tp]])
+        tpr.append(tp / (tp + fn))
+        fpr.append(fp / (fp + tn))
+        ppv.append(tp / (tp + fp))
+        sel.append((tp + fp) / m.sum())
+        calib.append(abs(y_scores[m].mean() - y_true[m].mean()))
+
+    def gap(values):
+        return max(values) - min(values)
+
+    assert metrics.equal_opportunity() == pytest.approx(gap(tpr))
+    assert metrics.false_positive_rate_parity() == pytest.approx(gap(fpr))
+    assert metrics.equalized_odds() == pytest.approx(max(gap(tpr), gap(fpr)))
+    assert metrics.predictive_parity() == pytest.approx(gap(ppv))
+    assert metrics.demographic_parity() == pytest.approx(gap(sel))
+    assert metrics.disparate_impact() == pytest.approx(min(sel) / max(sel))
+    assert metrics.calibration_by_group() == pytest.approx(max(calib))
+
+    report = metrics.group_report()
+    assert list(report.index) == list(range(7))
+    np.testing.assert_allclose(report["ppv"], ppv)
+    assert metrics.confusion_tensor is metrics.confusion_tensor
+
+
+def test_bootstrap_and_permutation():
+    """Test bootstrap intervals and permutation p-values on fair and unfair data."""
+    rng = np.random.default_rng(3)
+    n = 20_000
+    attr = rng.integers(0, 2_000, size=n)
+    y_true = rng.integers(0, 2, size=n)
+    fair_pred = rng.integers(0, 2, size=n)
+    metrics = FairnessMetrics(y_true, fair_pred, attr, min_group_size=5)
+
+    for metric in ("demographic_parity", "equalized_odds", "disparate_impact"):
+        ci = metrics.bootstrap(metric, n_resamples=500, random_state=0)
+        assert ci["value"] == pytest.approx(getattr(metrics, metric)())
+        assert ci["lower"] <= ci["upper"]
+    assert metrics.permutation_pvalue("demographic_parity", 500, random_state=0) > 0.05
+
+    unfair_pred = np.where(attr < 1_000, 1, fair_pred)
+    unfair = FairnessMetrics(y_true, unfair_pred, attr < 1_000)
+    ci = unfair.bootstrap("demographic_parity", random_state=0)
+    assert 0.45 < ci["lower"] <= ci["value"] <= ci["upper"] < 0.55
+    assert unfair.permutation_pvalue("equal_opportunity", 200, random_state=0) < 0.01
+
+    with pytest.raises(ValueError, match="metric must be one of"):
+        metrics.bootstrap("calibration_by_group")
+
+
+def test_bootstrap_interval_brackets_small_group_gaps():
+    """Test that the interval stays around the estimate despite small-group bias."""
+    rng = np.random.default_rng(3)
+    attr = rng.integers(0, 20, size=600)
+    y_true = rng.integers(0, 2, size=600)
+    y_pred = rng.integers(0, 2, size=600)
+    metrics = FairnessMetrics(y_true, y_pred, attr)
+
+    for metric in ("demographic_parity", "equalized_odds", "disparate_impact"):
+        ci = metrics.bootstrap(metric, n_resamples=500, random_state=0)
+        assert 0.0 <= ci["lower"] <= ci["value"] <= ci["upper"] <= 1.0
+
+    # 1,000 groups of about 10 rows: replicates saturate at the least fair
+    # value, which is reported instead of trusted.
+    rng = np.random.default_rng(0)
+    attr = rng.integers(0, 1_000, size=10_000)
+    y_true = rng.integers(0, 2, size=10_000)
+    y_pred = (rng.random(10_000) < 0.25).astype(int)
+    tiny = FairnessMetrics(y_true, y_pred, attr)
+    for metric in ("equal_opportunity", "equalized_odds", "disparate_impact"):
+        with pytest.warns(UserWarning, match="least fair value"):
+            ci = tiny.bootstrap(metric, n_resamples=300, random_state=0)
+        assert 0.0 <= ci["lower"] <= ci["value"] <= ci["upper"] <= 1.0
+    with (
+        pytest.warns(UserWarning, match="least fair value"),
+        pytest.raises(AssertionError, match="Equal opportunity"),
+    ):
+        check_fairness(tiny, "equal_opportunity", 0.5, confidence=0.95)
+    check_fairness(tiny, "equal_opportunity", 0.5, alpha=0.05, random_state=0)
+
+    # Replicates just below the ceiling: the shifted bounds used to land
+    # above the estimate.
+    trimmed = FairnessMetrics(y_true, y_pred, attr, min_group_size=12)
+    with pytest.warns(UserWarning, match="least fair value"):
+        ci = trimmed.bootstrap("equal_opportunity", n_resamples=300, random_state=0)
+    assert ci["lower"] <= ci["value"] < 1.0
+
+
+def test_check_fairness_uses_interval_bound():
+    """Test that noisy gaps in small groups only fail on the point estimate."""
+    rng = np.random.default_rng(4)
+    attr = rng.integers(0, 2, size=40)
+    y_true = rng.integers(0, 2, size=40)
+    y_pred = rng.integers(0, 2, size=40)
+    metrics = FairnessMetrics(y_true, y_pred, attr)
+
+    with pytest.raises(AssertionError, match="Demographic parity .* exceeds threshold"):
+        check_fairness(metrics, "demographic_parity", 0.1)
+    check_fairness(metrics, "demographic_parity", 0.1, confidence=0.95, random_state=0)
+    check_fairness(metrics, "demographic_parity", 0.1, alpha=0.05, random_state=0)
+    with pytest.raises(AssertionError, match="Disparate impact .* is below"):
+        check_fairness(metrics, "disparate_impact", 0.8)
+    check_fairness(metrics, "disparate_impact", 0.8, confidence=0.95, random_state=0)
+
+    # Calibration has no bootstrap; confidence and alpha are ignored for it.
+    with pytest.raises(AssertionError, match="Calibration by group"):
+        check_fairness(
+            metrics, "calibration_by_group", 0.0, confidence=0.95, alpha=0.05
+        )
+
+
+def test_fairness_accumulator_matches_batch():
+    """Test that streamed batches give the same metrics as one in-memory pass."""
+    rng = np.random.default_rng(5)
+    n = 6_000
+    y_true = rng.integers(0, 2, size=n)
+    y_pred = rng.integers(0, 2, size=n)
+    gender = rng.choice(["f", "m", "x"], size=n)
+    region = rng.integers(0, 4, size=n)
+
+    acc = FairnessAccumulator()
+    for batch in np.array_split(np.arange(n), 7):
+        acc.update(y_true[batch], y_pred[batch], [gender[batch], region[batch]])
+    streamed = acc.metrics()
+    full = FairnessMetrics(y_true, y_pred, [gender, region])
+
+    order = [streamed.groups.tolist().index(g) for g in full.groups.tolist()]
+    np.testing.assert_array_equal(acc.confusion_tensor[order], full.confusion_tensor)
+    for metric in ("demographic_parity", "equalized_odds", "disparate_impact"):
+        assert getattr(streamed, metric)() == pytest.approx(getattr(full, metric)())
+    ci = streamed.bootstrap("demographic_parity", 200, random_state=0)
+    assert ci["value"] == pytest.approx(full.demographic_parity())
+
+
+def test_fairness_accumulator_pools_missing_attributes():
+    """Test that missing attribute values form one group across batches."""
+    acc = FairnessAccumulator()
+    multi = FairnessAccumulator()
+    for _ in range(3):
+        region = np.array([1.0, 2.0, np.nan, np.nan])
+        acc.update([1, 0, 1, 0], [1, 0, 0, 1], region)
+        multi.update([1, 0, 1, 0], [1, 0, 0, 1], [region, np.array(list("abaa"))])
+    assert len(acc.groups) == 3
+    np.testing.assert_array_equal(acc.confusion_tensor[2], [[0, 3], [3, 0]])
+    assert len(multi.groups) == 3
+    np.testing.assert_array_equal(multi.confusion_tensor[2], [[0, 3], [3, 0]])
+
+
+def test_fairness_accumulator_decay_and_export():
+    """Test exponential decay of old batches and export through Prometheus."""
+    acc = FairnessAccumulator(half_life=10.0)
+    groups = np.array([0, 0, 1, 1])
+    acc.update(np.ones(4), np.array([1, 1, 0, 0]), groups, timestamp=0.0)
+    assert acc.metrics().demographic_parity() == 1.0
+    acc.update(np.ones(4), np.array([0, 0, 1, 1]), groups, timestamp=10.0)
+    # The first batch now weighs half: rates are 1/3 and 2/3.
+    assert acc.metrics().demographic_parity() == pytest.approx(1 / 3)
+    np.testing.assert_allclose(acc.confusion_tensor.sum(), 6.0)
+
+    with patch("ml_assert.integrations.prometheus.start_http_server"):
+        exporter = PrometheusExporter(port=8000)
+        values = acc.export(exporter, ["demographic_parity", "equal_opportunity"])
+    samples = {
+        sample.labels["metric"]: sample.value
+        for sample in list(exporter.fairness_gauge.collect())[0].samples
+    }
+    assert samples == values
+    assert samples["demographic_parity"] == pytest.approx(1 / 3)
@@ -89,8 +89,7 @@ def test_mlflow_logger():
         patch("mlflow.end_run") as mock_end_run,
         patch("mlflow.get_experiment_by_name", return_value=None),
         patch("mlflow.create_experiment", return_value="test-exp-id"),
-        patch("mlflow.tracking.MlflowClient.log_metric") as mock_log_metric,
-        patch("mlflow.tracking.MlflowClient.log_param") as mock_log_param,
+        patch("mlflow.tracking.MlflowClient.log_batch") as mock_log_batch,
     ):
         logger = MLflowLogger(experiment_name="test-exp")
         logger.start_run()
@@ -105,13 +104,6 @@ def test_mlflow_logger():
         )
         logger.log_assertion_result_mlassert(result, step_name="test_step")
 
-        # Verify metrics and params were logged correctly
-        mock_log_metric.assert_called_with("test-run-id", "test_step_passed", 1.0)
-        mock_log_param.assert_any_call(
-            "test-run-id", "test_step_message", "Test passed"
-        )
-        mock_log_param.assert_any_call("test-run-id", "test_step_key", "value")
-
         # Test logging a failed assertion
         result2 = AssertionResult(
             success=False,
@@ -120,13 +112,19 @@ def test_mlflow_logger():
             metadata={"error": "test error"},
         )
         logger.log_assertion_result_mlassert(result2, step_name="test_step2")
-
-        # Verify metrics and params were logged correctly
-        mock_log_metric.assert_called_with("test-run-id", "test_step2_passed", 0.0)
-        mock_log_param.assert_any_call(
-            "test-run-id", "test_step2_message", "Test failed"
-        )
-        mock_log_param.assert_any_call("test-run-id", "test_step2_error", "test error")
+        mock_log_batch.assert_not_called()
 
         logger.end_run()
         mock_end_run.assert_called_once()
+
+        # Both results are sent in one batch when the run ends
+        mock_log_batch.assert_called_once()
+        args, kwargs = mock_log_batch.call_args
+        assert args == ("test-run-id",)
+        metrics = {m.key: m.value for m in kwargs["metrics"]}
+        params = {p.key: p.value for p in kwargs["params"]}
+        assert metrics == {"test_step_passed": 1.0, "test_step2_passed": 0.0}
+        assert params["test_step_message"] == "Test passed"
+        assert params["test_step_key"] == "value"
+        assert params["test_step2_message"] == "Test failed"
+        assert params["test_step2_error"] == "test error"
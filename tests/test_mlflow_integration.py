@@ -1,12 +1,15 @@
 """Tests for MLflow integration."""
 
 import tempfile
+from datetime import datetime
+from unittest.mock import patch
 
 import mlflow
 import numpy as np
 import pandas as pd
 import pytest
 
+from ml_assert.core.base import AssertionResult
 from ml_assert.integrations.mlflow import MLflowLogger
 
 
@@ -107,6 +110,7 @@ def test_log_dataframe_assertion(mlflow_logger):
     )
 
     # Verify logged data
+    mlflow_logger.flush()
     run = mlflow.get_run(mlflow_logger._run_id)
     metrics = run.data.metrics
     assert "accuracy" in metrics
@@ -126,6 +130,7 @@ def test_log_model_assertion(mlflow_logger):
     )
 
     # Verify logged data
+    mlflow_logger.flush()
     run = mlflow.get_run(mlflow_logger._run_id)
     metrics = run.data.metrics
     assert "precision" in metrics
@@ -155,6 +160,7 @@ def test_log_assertion_result(mlflow_logger):
     )
 
     # Verify logged data
+    mlflow_logger.flush()
     run = mlflow.get_run(mlflow_logger._run_id)
     metrics = run.data.metrics
     assert "f1" in metrics
@@ -177,3 +183,47 @@ def test_no_active_run_error(mlflow_logger):
             assertion=TestAssertion(),
             result=True,
         )
+
+
+def test_buffered_logging_uses_batches(mlflow_logger):
+    """Test that values are buffered and flushed in log_batch chunks."""
+    mlflow_logger.flush_interval = None
+    mlflow_logger.max_buffer_size = 10_000
+    mlflow_logger.start_run()
+    run_id = mlflow_logger._run_id
+    with patch.object(
+        mlflow_logger.client,
+        "log_batch",
+        wraps=mlflow_logger.client.log_batch,
+    ) as mock_log_batch:
+        for i in range(150):
+            mlflow_logger.log_assertion_result_mlassert(
+                AssertionResult(True, "ok", datetime.now(), {}),
+                step_name=f"step{i}",
+            )
+        mlflow_logger.set_tag("suite", "nightly")
+        mock_log_batch.assert_not_called()
+        mlflow_logger.end_run()
+
+    # 150 metrics, 300 params and one tag, at most 100 params per request.
+    assert mock_log_batch.call_count == 3
+    for call in mock_log_batch.call_args_list:
+        assert len(call.kwargs["params"]) <= 100
+        assert sum(len(call.kwargs[k]) for k in ("metrics", "params", "tags")) <= 1000
+    run = mlflow.get_run(run_id)
+    assert len(run.data.metrics) == 150
+    assert len(run.data.params) == 300
+    assert run.data.tags["suite"] == "nightly"
+
+
+def test_buffer_size_triggers_flush(mlflow_logger):
+    """Test that a full buffer is flushed without waiting for end_run."""
+    mlflow_logger.flush_interval = None
+    mlflow_logger.max_buffer_size = 5
+    mlflow_logger.start_run()
+    mlflow_logger.log_model_assertion(
+        "model", "accuracy", True, metrics={f"m{i}": i for i in range(5)}
+    )
+    run = mlflow.get_run(mlflow_logger._run_id)
+    assert run.data.metrics["m4"] == 4
+    mlflow_logger.end_run()
@@ -0,0 +1,66 @@
+import os
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from ml_assert.model.loaders import clear_model_cache, load_model
+
+X = np.random.default_rng(0).normal(size=(50, 3))
+Y = (X[:, 0] > 0).astype(int)
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    clear_model_cache()
+    yield
+    clear_model_cache()
+
+
+def test_load_model_is_cached_by_path_and_mtime(tmp_path):
+    """Test that repeated loads share one object until the file changes."""
+    path = tmp_path / "model.joblib"
+    original = LogisticRegression().fit(X, Y)
+    joblib.dump(original, path)
+
+    model = load_model(path)
+    assert load_model(str(path)) is model
+    np.testing.assert_array_equal(model.predict(X), original.predict(X))
+
+    joblib.dump(LogisticRegression(C=0.01).fit(X, Y), path)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reloaded = load_model(path)
+    assert reloaded is not model
+    assert reloaded.C == 0.01
+
+    clear_model_cache()
+    assert load_model(path) is not reloaded
+
+
+def test_load_model_memory_maps_arrays(tmp_path):
+    """Test that numpy arrays of uncompressed joblib dumps are memory-mapped."""
+    path = tmp_path / "weights.pkl"
+    joblib.dump({"weights": np.arange(1000.0)}, path)
+    assert isinstance(load_model(path)["weights"], np.memmap)
+    in_memory = load_model({"path": str(path), "mmap_mode": None})
+    assert not isinstance(in_memory["weights"], np.memmap)
+
+
+def test_load_model_formats(tmp_path):
+    """Test format inference, explicit formats and optional backends."""
+    path = tmp_path / "model.bin"
+    joblib.dump(LogisticRegression().fit(X, Y), path)
+    with pytest.raises(ValueError, match="Cannot infer the model format"):
+        load_model(path)
+    assert isinstance(
+        load_model({"path": str(path), "format": "joblib"}), LogisticRegression
+    )
+    with pytest.raises(ValueError, match="Unknown model format"):
+        load_model({"path": str(path), "format": "torch"})
+
+    xgb = pytest.importorskip("xgboost")
+    booster = xgb.train({"max_depth": 2}, xgb.DMatrix(X, label=Y), num_boost_round=2)
+    booster.save_model(tmp_path / "model.json")
+    assert isinstance(load_model(tmp_path / "model.json"), xgb.Booster)
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from sklearn.metrics import f1_score, precision_score, recall_score
+
+from ml_assert.core.dsl import ModelAssertion
+from ml_assert.model.multiclass import ClassificationCounts, check_per_class_scores
+from ml_assert.model.performance import assert_f1_score
+
+RNG = np.random.default_rng(0)
+Y_TRUE = RNG.integers(0, 6, size=600)
+Y_PRED = np.where(RNG.random(600) < 0.7, Y_TRUE, RNG.integers(0, 6, size=600))
+ML_TRUE = RNG.integers(0, 2, size=(200, 4))
+ML_PRED = np.where(RNG.random((200, 4)) < 0.8, ML_TRUE, 1 - ML_TRUE)
+
+
+@pytest.mark.parametrize("average", ["macro", "micro", "weighted", None])
+def test_multiclass_counts_match_sklearn(average):
+    """Test that confusion-matrix scores match sklearn for every average."""
+    counts = ClassificationCounts(Y_TRUE, Y_PRED)
+    for metric, ref in (
+        ("precision", precision_score),
+        ("recall", recall_score),
+        ("f1", f1_score),
+    ):
+        np.testing.assert_allclose(
+            counts.score(metric, average), ref(Y_TRUE, Y_PRED, average=average)
+        )
+
+
+@pytest.mark.parametrize("average", ["macro", "micro", "weighted", None])
+def test_multilabel_counts_match_sklearn(average):
+    """Test that per-label count arrays match sklearn for indicator matrices."""
+    counts = ClassificationCounts(ML_TRUE, ML_PRED)
+    assert counts.multilabel
+    for metric, ref in (
+        ("precision", precision_score),
+        ("recall", recall_score),
+        ("f1", f1_score),
+    ):
+        np.testing.assert_allclose(
+            counts.score(metric, average), ref(ML_TRUE, ML_PRED, average=average)
+        )
+
+
+def test_string_labels_and_confusion_matrix():
+    """Test string labels and the shape of the shared confusion matrix."""
+    y_true = np.array(["cat", "dog", "bird", "dog"])
+    y_pred = np.array(["cat", "bird", "bird", "dog"])
+    counts = ClassificationCounts(y_true, y_pred)
+    assert counts.labels.tolist() == ["bird", "cat", "dog"]
+    assert counts.confusion_matrix.sum() == 4
+    assert counts.recall(None).tolist() == [1.0, 1.0, 0.5]
+    with pytest.raises(ValueError, match="not in 'labels'"):
+        ClassificationCounts(y_true, y_pred, labels=["cat", "dog"])
+
+
+def test_check_per_class_scores():
+    """Test per-class thresholds given as a scalar or a mapping."""
+    counts = ClassificationCounts(Y_TRUE, Y_PRED)
+    check_per_class_scores(counts, "recall", 0.5)
+    check_per_class_scores(counts, "f1", {0: 0.5, 3: 0.5})
+    with pytest.raises(AssertionError, match="Per-class precision"):
+        check_per_class_scores(counts, "precision", {1: 0.99})
+    with pytest.raises(ValueError, match="Unknown class labels"):
+        check_per_class_scores(counts, "precision", {42: 0.5})
+
+
+def test_assert_f1_score_average():
+    """Test that the standalone assertions accept an averaging strategy."""
+    assert_f1_score(Y_TRUE, Y_PRED, min_score=0.6, average="macro")
+    with pytest.raises(AssertionError, match=r"F1 score \(macro\)"):
+        assert_f1_score(Y_TRUE, Y_PRED, min_score=0.95, average="macro")
+
+
+def test_model_assertion_multiclass_chain():
+    """Test averaged and per-class assertions share one confusion matrix."""
+    ma = ModelAssertion(Y_TRUE, Y_PRED)
+    result = (
+        ma.accuracy(0.6)
+        .precision(0.6, average="macro")
+        .recall(0.6, average="weighted")
+        .f1(0.6, average="micro")
+        .per_class("recall", 0.5)
+        .per_class("f1", {0: 0.5})
+        .validate()
+    )
+    assert result.success
+    assert len(result.metadata["results"]) == 6
+    assert ma._classification_counts() is ma._counts_cache
+
+    with pytest.raises(AssertionError):
+        ModelAssertion(Y_TRUE, Y_PRED).precision(0.95, average="macro").validate()
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+from sklearn.metrics import (
+    mean_absolute_error,
+    mean_absolute_percentage_error,
+    mean_pinball_loss,
+    mean_squared_error,
+    r2_score,
+)
+
+from ml_assert.core.dsl import ModelAssertion
+from ml_assert.model.regression import (
+    RegressionMetrics,
+    assert_mae,
+    assert_mape,
+    assert_quantile_loss,
+    assert_r2_score,
+    assert_rmse,
+)
+
+RNG = np.random.default_rng(0)
+Y_TRUE = RNG.normal(10.0, 3.0, size=1000)
+Y_PRED = Y_TRUE + RNG.normal(0.0, 1.0, size=1000)
+
+
+def test_regression_metrics_match_sklearn():
+    """Test that the fused pass matches sklearn's reference implementations."""
+    metrics = RegressionMetrics(chunk_size=64).update(Y_TRUE, Y_PRED)
+    assert metrics.n_samples == 1000
+    assert metrics.mae == pytest.approx(mean_absolute_error(Y_TRUE, Y_PRED))
+    assert metrics.rmse == pytest.approx(np.sqrt(mean_squared_error(Y_TRUE, Y_PRED)))
+    assert metrics.r2 == pytest.approx(r2_score(Y_TRUE, Y_PRED))
+    assert metrics.mape == pytest.approx(mean_absolute_percentage_error(Y_TRUE, Y_PRED))
+    for q in (0.1, 0.5, 0.9):
+        assert metrics.quantile_loss(q) == pytest.approx(
+            mean_pinball_loss(Y_TRUE, Y_PRED, alpha=q)
+        )
+
+
+def test_regression_metrics_streaming_and_merge():
+    """Test that batched updates and merges agree with a single pass."""
+    full = RegressionMetrics.from_arrays(Y_TRUE, Y_PRED)
+    streamed = RegressionMetrics()
+    for start in range(0, 1000, 137):
+        streamed.update(Y_TRUE[start : start + 137], Y_PRED[start : start + 137])
+    merged = RegressionMetrics.from_arrays(Y_TRUE[:400], Y_PRED[:400]).merge(
+        RegressionMetrics.from_arrays(Y_TRUE[400:], Y_PRED[400:])
+    )
+    for acc in (streamed, merged):
+        assert acc.n_samples == full.n_samples
+        assert acc.mae == pytest.approx(full.mae)
+        assert acc.rmse == pytest.approx(full.rmse)
+        assert acc.r2 == pytest.approx(full.r2)
+        assert acc.mape == pytest.approx(full.mape)
+
+
+def test_regression_metrics_invalid_inputs():
+    """Test error handling for empty accumulators and bad arguments."""
+    with pytest.raises(ValueError, match="No samples"):
+        _ = RegressionMetrics().mae
+    with pytest.raises(ValueError, match="same length"):
+        RegressionMetrics().update(np.zeros(3), np.zeros(4))
+    with pytest.raises(ValueError, match="quantile"):
+        RegressionMetrics.from_arrays(Y_TRUE, Y_PRED).quantile_loss(1.0)
+
+
+def test_regression_assert_functions():
+    """Test the standalone regression assertion functions."""
+    assert_mae(Y_TRUE, Y_PRED, max_error=1.0)
+    assert_rmse(Y_TRUE, Y_PRED, max_error=1.2)
+    assert_r2_score(Y_TRUE, Y_PRED, min_score=0.8)
+    assert_mape(Y_TRUE, Y_PRED, max_error=0.2)
+    assert_quantile_loss(Y_TRUE, Y_PRED, quantile=0.9, max_loss=0.5)
+    with pytest.raises(AssertionError, match="MAE .* is above the maximum"):
+        assert_mae(Y_TRUE, Y_PRED, max_error=0.1)
+    with pytest.raises(AssertionError, match="R2 score .* is below the minimum"):
+        assert_r2_score(Y_TRUE, Y_PRED, min_score=0.99)
+
+
+def test_model_assertion_regression_chain():
+    """Test chaining regression assertions, including sliced variants."""
+    mask = Y_TRUE > 10.0
+    ma = ModelAssertion(Y_TRUE, Y_PRED)
+    result = (
+        ma.mae(1.0)
+        .rmse(1.2)
+        .r2(0.8)
+        .mape(0.2)
+        .quantile_loss(0.5, 0.5)
+        .mae(1.0, sample_mask=mask)
+        .rmse(1.2, sample_mask=mask)
+        .validate()
+    )
+    assert result.success
+    assert len(result.metadata["results"]) == 7
+    # One fused pass for the full data and one for the slice.
+    assert len(ma._regression_cache) == 2
+    assert ma._regression_metrics(mask).n_samples == int(mask.sum())
+
+    with pytest.raises(AssertionError):
+        ModelAssertion(Y_TRUE, Y_PRED).rmse(0.5).validate()
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from sklearn.metrics import brier_score_loss, log_loss
+
+from ml_assert import assert_model
+from ml_assert.model.scores import (
+    as_score_array,
+    assert_brier_score,
+    assert_calibration_error,
+    assert_log_loss,
+    brier_score,
+    expected_calibration_error,
+    log_loss_score,
+)
+
+RNG = np.random.default_rng(0)
+Y_PROB = RNG.random(1000)
+Y_TRUE = (RNG.random(1000) < Y_PROB).astype(int)
+Y_PRED = (Y_PROB >= 0.5).astype(int)
+
+
+def test_as_score_array_reuses_normalized_arrays():
+    """Test that contiguous float arrays are shared rather than copied."""
+    assert as_score_array(Y_PROB) is Y_PROB
+    scores32 = Y_PROB.astype(np.float32)
+    assert as_score_array(scores32) is scores32
+    normalized = as_score_array([1, 0, 1])
+    assert normalized.dtype == np.float64
+    assert as_score_array(Y_PROB[::2]).flags.c_contiguous
+
+
+def test_score_metrics_match_sklearn():
+    """Test log loss and Brier score against sklearn."""
+    assert log_loss_score(Y_TRUE, Y_PROB) == pytest.approx(log_loss(Y_TRUE, Y_PROB))
+    assert brier_score(Y_TRUE, Y_PROB) == pytest.approx(
+        brier_score_loss(Y_TRUE, Y_PROB)
+    )
+    proba = np.column_stack([1 - Y_PROB, Y_PROB])
+    assert log_loss_score(Y_TRUE, proba) == pytest.approx(log_loss(Y_TRUE, proba))
+
+
+def test_log_loss_missing_class_columns():
+    """Test that columns are mapped through labels when y_true lacks a class."""
+    y_true = np.array([0, 2, 2, 0])
+    proba = np.array(
+        [[0.7, 0.2, 0.1], [0.1, 0.3, 0.6], [0.2, 0.2, 0.6], [0.5, 0.4, 0.1]]
+    )
+    with pytest.raises(ValueError, match="pass labels"):
+        log_loss_score(y_true, proba)
+    assert log_loss_score(y_true, proba, labels=[0, 1, 2]) == pytest.approx(
+        log_loss(y_true, proba, labels=[0, 1, 2])
+    )
+    with pytest.raises(ValueError, match="not in 'labels'"):
+        log_loss_score(np.array([0, 3, 2, 0]), proba, labels=[0, 1, 2])
+
+
+def test_expected_calibration_error():
+    """Test ECE on calibrated and miscalibrated probabilities."""
+    assert expected_calibration_error(Y_TRUE, Y_PROB) < 0.05
+    assert expected_calibration_error(Y_TRUE, Y_PROB**3) > 0.1
+    assert expected_calibration_error(
+        np.array([1, 0]), np.array([1.0, 0.0])
+    ) == pytest.approx(0.0)
+    with pytest.raises(ValueError, match="n_bins"):
+        expected_calibration_error(Y_TRUE, Y_PROB, n_bins=0)
+
+
+def test_score_assert_functions():
+    """Test the standalone score-based assertion functions."""
+    assert_log_loss(Y_TRUE, Y_PROB, max_loss=0.6)
+    assert_brier_score(Y_TRUE, Y_PROB, max_score=0.2)
+    assert_calibration_error(Y_TRUE, Y_PROB, max_error=0.05)
+    with pytest.raises(AssertionError, match="Log loss .* is above the maximum"):
+        assert_log_loss(Y_TRUE, Y_PROB, max_loss=0.1)
+
+
+def test_assert_model_uses_scores():
+    """Test that assert_model forwards y_scores to score-based assertions."""
+    ma = assert_model(Y_TRUE, Y_PRED, Y_PROB.tolist())
+    result = (
+        ma.roc_auc(0.7)
+        .log_loss(0.6)
+        .brier_score(0.2)
+        .calibration(0.05, n_bins=10)
+        .validate()
+    )
+    assert result.success
+    assert len(result.metadata["results"]) == 4
+    assert ma._scores() is ma._scores()
+    assert ma._scores().dtype == np.float64
+
+    with pytest.raises(AssertionError):
+        assert_model(Y_TRUE, Y_PRED, Y_PROB).brier_score(0.01).validate()
+    with pytest.raises(ValueError, match="y_scores must be provided"):
+        assert_model(Y_TRUE, Y_PRED).log_loss(0.5)
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from sklearn.metrics import f1_score, precision_recall_curve, precision_score
+
+from ml_assert.core.dsl import ModelAssertion
+from ml_assert.model.thresholds import (
+    ThresholdCurve,
+    assert_metric_at_thresholds,
+    assert_precision_at_k,
+    assert_precision_at_recall,
+    assert_recall_at_k,
+    assert_recall_at_precision,
+)
+
+RNG = np.random.default_rng(0)
+Y_TRUE = RNG.integers(0, 2, size=500)
+Y_SCORES = np.round(np.clip(Y_TRUE * 0.3 + RNG.random(500) * 0.7, 0, 1), 2)
+
+
+def test_threshold_curve_matches_sklearn():
+    """Test that the single-sort curve matches sklearn's precision-recall curve."""
+    curve = ThresholdCurve(Y_TRUE, Y_SCORES)
+    precision, recall, thresholds = precision_recall_curve(Y_TRUE, Y_SCORES)
+    # sklearn returns increasing thresholds and may drop thresholds past full recall.
+    n = len(thresholds)
+    np.testing.assert_allclose(curve.thresholds[::-1][:n], thresholds)
+    np.testing.assert_allclose(curve.precision[::-1][:n], precision[:-1])
+    np.testing.assert_allclose(curve.recall[::-1][:n], recall[:-1])
+
+
+def test_threshold_curve_queries():
+    """Test top-k, operating-point and fixed-threshold queries."""
+    curve = ThresholdCurve(Y_TRUE, Y_SCORES)
+    order = np.argsort(-Y_SCORES, kind="mergesort")
+    assert curve.precision_at_k(50) == pytest.approx(Y_TRUE[order[:50]].mean())
+    assert curve.recall_at_k(500) == pytest.approx(1.0)
+
+    best = curve.precision_at_recall(0.5)
+    assert best == pytest.approx(curve.precision[curve.recall >= 0.5].max())
+    assert curve.recall_at_precision(1.01) == 0.0
+
+    for t in (0.2, 0.5, 0.8):
+        y_hat = (t <= Y_SCORES).astype(int)
+        assert curve.metric_at_thresholds("precision", [t])[0] == pytest.approx(
+            precision_score(Y_TRUE, y_hat)
+        )
+        assert curve.metric_at_thresholds("f1", [t])[0] == pytest.approx(
+            f1_score(Y_TRUE, y_hat)
+        )
+
+
+def test_threshold_curve_invalid_inputs():
+    """Test error handling for degenerate inputs and arguments."""
+    with pytest.raises(ValueError, match="no positive samples"):
+        ThresholdCurve(np.zeros(3), np.array([0.1, 0.2, 0.3]))
+    curve = ThresholdCurve(Y_TRUE, Y_SCORES)
+    with pytest.raises(ValueError, match="k must be between"):
+        curve.precision_at_k(0)
+    with pytest.raises(ValueError, match="metric must be one of"):
+        curve.metric_at_thresholds("roc_auc", [0.5])
+
+
+def test_threshold_assert_functions():
+    """Test the standalone threshold-sweep assertion functions."""
+    assert_precision_at_recall(Y_TRUE, Y_SCORES, min_recall=0.5, min_score=0.6)
+    assert_recall_at_precision(Y_TRUE, Y_SCORES, min_precision=0.6, min_score=0.5)
+    assert_precision_at_k(Y_TRUE, Y_SCORES, k=20, min_score=0.6)
+    assert_recall_at_k(Y_TRUE, Y_SCORES, k=500, min_score=1.0)
+    assert_metric_at_thresholds(Y_TRUE, Y_SCORES, "recall", [0.1, 0.2], 0.9)
+    with pytest.raises(AssertionError, match="Precision at recall"):
+        assert_precision_at_recall(Y_TRUE, Y_SCORES, min_recall=0.99, min_score=0.99)
+    with pytest.raises(AssertionError, match="at threshold 0.9000"):
+        assert_metric_at_thresholds(Y_TRUE, Y_SCORES, "recall", [0.1, 0.9], 0.9)
+
+
+def test_model_assertion_threshold_chain():
+    """Test that chained threshold-sweep assertions share one sorted curve."""
+    ma = ModelAssertion(Y_TRUE, (Y_SCORES >= 0.5).astype(int), Y_SCORES)
+    result = (
+        ma.precision_at_recall(0.5, 0.6)
+        .recall_at_precision(0.6, 0.5)
+        .precision_at_k(20, 0.6)
+        .recall_at_k(500, 1.0)
+        .metric_at_thresholds("recall", [0.1, 0.2], [0.95, 0.9])
+        .validate()
+    )
+    assert result.success
+    assert len(result.metadata["results"]) == 5
+    assert ma._threshold_curve() is ma._threshold_curve()
+
+    with pytest.raises(ValueError, match="y_scores must be provided"):
+        ModelAssertion(Y_TRUE, Y_TRUE).precision_at_k(10, 0.5)